@@ -0,0 +1,29 @@
+{#
+    Filter for incremental merge models over rows fingerprinted at ingest.
+
+    The collectors store a 64-bit hash of each row's metric values in
+    row_hash. On incremental runs, rows whose key already exists in the
+    model with the same hash are dropped before the merge, so restatement
+    lookbacks only rewrite rows that actually changed. Hashes are compared
+    with equal_null, so rows loaded before row_hash existed (NULL in RAW
+    and in the model) match and are skipped too; a restatement of such a
+    row is loaded with a hash and is merged.
+
+    Usage (as the WHERE clause of the final select, aliased):
+        select * from renamed
+        {{ exclude_unchanged_rows('renamed', ['hour', 'app', 'store_id', 'country', 'os_name']) }}
+#}
+
+{% macro exclude_unchanged_rows(relation_alias, unique_key, hash_column='row_hash') %}
+    {%- if is_incremental() -%}
+    where not exists (
+        select 1
+        from {{ this }} as existing
+        where
+            {%- for key in unique_key %}
+            existing.{{ key }} = {{ relation_alias }}.{{ key }} and
+            {%- endfor %}
+            equal_null(existing.{{ hash_column }}, {{ relation_alias }}.{{ hash_column }})
+    )
+    {%- endif -%}
+{% endmacro %}
@@ -0,0 +1,40 @@
+{#
+    Incremental filter for staging models over append-only RAW tables.
+
+    On incremental runs, keeps only RAW rows loaded after the model's
+    high-water mark (max loaded_at already staged) minus a restatement
+    lookback, so rows from loads that committed out of order are still
+    picked up. Full refreshes (and the first run) read everything.
+
+    When the pipeline runner triggers dbt after a load it passes the
+    loaded date window as vars start_date / end_date; with date_column set,
+    RAW reads are pruned to those days as well (clustered on date), and the
+    high-water mark is taken over the model's rows for those days only
+    (model_date_column). Rows of other days (a backfill, a run without dbt)
+    are staged by the next windowed run over their days. A run without the
+    vars still uses the model-wide mark, so loads outside a dbt run should
+    be followed by a windowed run (backfill_gaps.py does this).
+
+    Usage (as the WHERE clause of a model's source CTE):
+        select * from {{ source('raw', 'admob_daily') }}
+        {{ incremental_lookback_filter(date_column="to_date(date, 'YYYYMMDD')") }}
+#}
+
+{% macro incremental_lookback_filter(column='loaded_at', lookback_hours=none, date_column=none, model_date_column='date') %}
+    {%- set start_date = var('start_date', none) -%}
+    {%- set end_date = var('end_date', none) -%}
+    {%- set windowed = date_column is not none and start_date is not none and end_date is not none -%}
+    {%- if is_incremental() -%}
+        {%- set hours = lookback_hours if lookback_hours is not none else var('staging_lookback_hours') -%}
+    where {{ column }} > (
+        select dateadd(hour, -{{ hours }}, coalesce(max({{ column }}), '1900-01-01'::timestamp_ntz))
+        from {{ this }}
+        {%- if windowed %}
+        where {{ model_date_column }} between '{{ start_date }}'::date and '{{ end_date }}'::date
+        {%- endif %}
+    )
+        {%- if windowed %}
+      and {{ date_column }} between '{{ start_date }}'::date and '{{ end_date }}'::date
+        {%- endif -%}
+    {%- endif -%}
+{% endmacro %}
@@ -0,0 +1,65 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='merge',
+        unique_key=['hour', 'app', 'store_id', 'country', 'os_name'],
+        cluster_by=['date', 'app']
+    )
+}}
+
+-- Adjust hourly metrics, renamed to the warehouse vocabulary and deduplicated.
+-- Incremental: only RAW rows loaded since the last run (minus the
+-- staging_lookback_hours restatement window) are read and merged on the
+-- RAW primary key, so run time tracks new data, not RAW history. Rows whose
+-- row_hash is already staged are not merged again.
+
+with source as (
+
+    select * from {{ source('raw', 'adjust_hourly') }}
+    {{ incremental_lookback_filter(date_column='day') }}
+
+),
+
+-- Each run re-fetches whole days: keep the latest load per key
+deduped as (
+
+    select *
+    from source
+    qualify row_number() over (
+        partition by hour, app, store_id, country, os_name
+        order by loaded_at desc
+    ) = 1
+
+),
+
+renamed as (
+
+    select
+        hour,
+        day as date,
+        app,
+        store_id,
+        store_id as app_id,
+        upper(country) as country_code,
+        country,
+        os_name,
+
+        installs,
+        clicks,
+        daus,
+        ad_revenue,
+        ad_impressions,
+        ad_revenue_total_d0,
+        ad_impressions_total_d0,
+        network_cost,
+        network_cost_diff,
+
+        row_hash,
+        loaded_at
+
+    from deduped
+
+)
+
+select * from renamed
+{{ exclude_unchanged_rows('renamed', ['hour', 'app', 'store_id', 'country', 'os_name']) }}
@@ -0,0 +1,63 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='merge',
+        unique_key=['date', 'app_id', 'country_code', 'platform', 'ad_format', 'ad_unit_id'],
+        cluster_by=['date', 'app_id']
+    )
+}}
+
+-- AdMob daily performance, typed and deduplicated.
+-- Incremental: only RAW rows loaded since the last run (minus the
+-- staging_lookback_hours restatement window) are read and merged on the
+-- RAW primary key, so run time tracks new data, not RAW history. Rows whose
+-- row_hash is already staged are not merged again.
+
+with source as (
+
+    select * from {{ source('raw', 'admob_daily') }}
+    {{ incremental_lookback_filter(date_column="to_date(date, 'YYYYMMDD')") }}
+
+),
+
+-- Re-fetched days are appended again in RAW: keep the latest load per key
+deduped as (
+
+    select *
+    from source
+    qualify row_number() over (
+        partition by date, app_id, country_code, platform, ad_format, ad_unit_id
+        order by loaded_at desc
+    ) = 1
+
+),
+
+renamed as (
+
+    select
+        to_date(date, 'YYYYMMDD') as date,
+        app_id,
+        country_code,
+        platform,
+        ad_format,
+        ad_unit_id,
+
+        try_to_number(ad_impressions)::integer as ad_impressions,
+        try_to_number(ad_clicks)::integer as ad_clicks,
+        try_to_number(ad_requests)::integer as ad_requests,
+        try_to_number(matched_requests)::integer as matched_requests,
+
+        -- microsValue → USD
+        try_to_number(estimated_earnings) / 1000000 as estimated_earnings_usd,
+        try_to_number(observed_ecpm) / 1000000 as observed_ecpm_usd,
+
+        batch_id,
+        row_hash,
+        loaded_at
+
+    from deduped
+
+)
+
+select * from renamed
+{{ exclude_unchanged_rows('renamed', ['date', 'app_id', 'country_code', 'platform', 'ad_format', 'ad_unit_id']) }}
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+End-to-End Pipeline Benchmark
+
+Runs each collector's chain on synthetic API responses (from the mock API
+server's catalog) at 10K, 100K and 1M rows, with no network or warehouse:
+- parse: AdMob JSON rows → DataFrame (parse_admob_response) and Adjust CSV
+  → DataFrame (parse_adjust_csv)
+- prepare: column uppercasing, LOADED_AT / BATCH_ID stamping, ROW_HASH
+- load: validate_batch, spool Parquet write, then a batched INSERT into a
+  SQLite table built from the RAW DDL (standing in for Snowflake); the
+  adjust_hot source loads through load_to_postgres instead (partition
+  creation and upsert into the same SQLite stand-in), covering the hot-store
+  sink path
+
+Reports rows/sec per stage and end to end, p50 / p95 latency over the
+repeats, and peak traced memory (one extra run under tracemalloc). Fails if
+end-to-end throughput drops more than --threshold below the saved baseline.
+Sizes without a baseline are reported as not gated (and fail with
+--require-baseline); save one with --save-baseline on the reference machine.
+
+Usage:
+    python scripts/benchmarks/bench_pipeline.py
+    python scripts/benchmarks/bench_pipeline.py --rows 10000,100000 --sources adjust
+    python scripts/benchmarks/bench_pipeline.py --rows 10000 --sources adjust_hot --repeat 1
+    python scripts/benchmarks/bench_pipeline.py --repeat 5 --save-baseline
+    python scripts/benchmarks/bench_pipeline.py --require-baseline  # CI gate
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import tempfile
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+
+from scripts.benchmarks.mock_api_server import SyntheticCatalog
+from scripts.collect_admob import parse_admob_response, stamp_admob_frame
+from scripts.collect_adjust import load_to_postgres, parse_adjust_csv, stamp_adjust_frame
+from scripts.utils.batch_validation import NUMERIC_TYPES, load_table_schemas, validate_batch
+from scripts.utils.console import console
+from scripts.utils.spool import Spool
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "pipeline.json"
+STAGES = ["parse", "prepare", "load"]
+SOURCES = {"admob": "ADMOB_DAILY", "adjust": "ADJUST_HOURLY", "adjust_hot": "ADJUST_HOURLY"}
+
+# Catalog scale: 40K AdMob and 96K Adjust rows per synthetic day
+CATALOG = {"apps": 20, "countries": 200, "ad_units": 10}
+FIRST_DAY = date(2025, 1, 1)
+
+ADMOB_SPEC = {
+    "dimensions": ["APP", "DATE", "COUNTRY", "PLATFORM", "FORMAT", "AD_UNIT"],
+    "metrics": ["ESTIMATED_EARNINGS", "IMPRESSIONS", "CLICKS", "AD_REQUESTS", "MATCHED_REQUESTS", "OBSERVED_ECPM"],
+}
+ADJUST_PARAMS = {
+    "dimensions": "app,store_id,day,hour,country,os_name",
+    "metrics": "installs,clicks,daus,ad_revenue,ad_impressions,ad_revenue_total_d0,ad_impressions_total_d0,network_cost,network_cost_diff",
+}
+
+
+def admob_response(catalog: SyntheticCatalog, rows: int) -> list:
+    """mediationReport.generate response with exactly N rows (header and footer kept)."""
+
+    days = -(-rows // catalog.admob_rows_per_day()) + 1
+    end = FIRST_DAY + timedelta(days=days - 1)
+    spec = {
+        **ADMOB_SPEC,
+        "date_range": {
+            "start_date": {"year": FIRST_DAY.year, "month": FIRST_DAY.month, "day": FIRST_DAY.day},
+            "end_date": {"year": end.year, "month": end.month, "day": end.day},
+        },
+    }
+    items = catalog.admob_report(spec)
+    return items[:rows + 1] + items[-1:]
+
+
+def adjust_csv(catalog: SyntheticCatalog, rows: int) -> str:
+    """csv_report body with exactly N rows."""
+
+    days = -(-rows // catalog.adjust_rows_per_day())
+    period = f"{FIRST_DAY}:{FIRST_DAY + timedelta(days=days - 1)}"
+    lines = catalog.adjust_report({**ADJUST_PARAMS, "date_period": period}).splitlines()
+    return "\n".join(lines[:rows + 1]) + "\n"
+
+
+class SqliteWarehouse:
+    """SQLite stand-in for the RAW tables (columns and primary keys from the DDL)."""
+
+    def __init__(self, path: Path):
+        self.conn = sqlite3.connect(path)
+        self.schemas = load_table_schemas()
+
+    def reset(self, table_name: str):
+        """Drop and recreate the table (each run loads into an empty table)."""
+
+        schema = self.schemas[table_name]
+        columns = [
+            f"{name} {'NUMERIC' if spec['type'] in NUMERIC_TYPES else 'TEXT'}"
+            for name, spec in schema["columns"].items()
+        ]
+        self.conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+        self.conn.execute(
+            f"CREATE TABLE {table_name} ({', '.join(columns)}, PRIMARY KEY ({', '.join(schema['primary_key'])}))"
+        )
+
+    def insert(self, df: pd.DataFrame, table_name: str) -> int:
+        """One batched INSERT in a single transaction (the COPY stand-in)."""
+
+        frame = df.copy(deep=False)
+        for col in frame.columns[[pd.api.types.is_datetime64_any_dtype(dtype) for dtype in frame.dtypes]]:
+            frame[col] = np.datetime_as_string(frame[col].to_numpy(), unit="us")
+
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {table_name} ({', '.join(frame.columns)}) "
+                f"VALUES ({', '.join('?' for _ in frame.columns)})",
+                frame.itertuples(index=False, name=None)
+            )
+        return len(frame)
+
+    def close(self):
+        self.conn.close()
+
+
+class SqliteHotStore:
+    """PostgresClient stand-in for load_to_postgres (partitions and upsert into SQLite)."""
+
+    def __init__(self, warehouse: SqliteWarehouse):
+        self.warehouse = warehouse
+        self.partitions = set()
+
+    def create_partitions(self, table_name: str, days) -> list[str]:
+        created = sorted(set(days) - self.partitions)
+        self.partitions.update(created)
+        return [f"{table_name}_{day:%Y%m%d}" for day in created]
+
+    def load_dataframe(self, df: pd.DataFrame, table_name: str) -> int:
+        return self.warehouse.insert(df, SOURCES["adjust_hot"])
+
+
+def run_chain(source: str, payload, warehouse: SqliteWarehouse, work_dir: Path) -> dict:
+    """One parse → prepare → load run; returns seconds per stage."""
+
+    table_name = SOURCES[source]
+    warehouse.reset(table_name)
+    seconds = {}
+
+    start = time.perf_counter()
+    df = parse_admob_response(payload) if source == "admob" else parse_adjust_csv(payload)
+    seconds["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df = stamp_admob_frame(df, "bench") if source == "admob" else stamp_adjust_frame(df)
+    seconds["prepare"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df, _ = validate_batch(df, table_name, quarantine_dir=work_dir / "quarantine")
+    Spool(work_dir / "spool").write(df, table_name, source=source)
+    if source == "adjust_hot":
+        load_to_postgres(df, client=SqliteHotStore(warehouse))
+    else:
+        warehouse.insert(df, table_name)
+    seconds["load"] = time.perf_counter() - start
+
+    return seconds
+
+
+def peak_memory_mb(source: str, payload, warehouse: SqliteWarehouse, work_dir: Path) -> float:
+    """Peak traced memory (MB) of one run (Python and numpy allocations)."""
+
+    tracemalloc.start()
+    try:
+        run_chain(source, payload, warehouse, work_dir)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024 ** 2
+
+
+def main():
+    """Run the pipeline benchmark."""
+
+    from rich.table import Table
+
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmark (parse → prepare → load)")
+    parser.add_argument("--rows", type=str, default="10000,100000,1000000", help="Comma-separated batch sizes")
+    parser.add_argument("--sources", type=str, default="admob,adjust,adjust_hot", help="Comma-separated sources (default: admob,adjust,adjust_hot)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size (default: 3)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed throughput drop vs baseline (default: 0.2)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write results to {BASELINE_FILE.name}")
+    parser.add_argument("--require-baseline", action="store_true", help="Fail sizes that have no saved baseline")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.rows.split(",")]
+    sources = [source.strip() for source in args.sources.split(",") if source.strip()]
+    unknown = [source for source in sources if source not in SOURCES]
+    if unknown:
+        console.print(f"[red]✗ Unknown source(s): {', '.join(unknown)}[/red]")
+        return 1
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    catalog = SyntheticCatalog(**CATALOG)
+    results = {}
+    failures = []
+    ungated = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        warehouse = SqliteWarehouse(work_dir / "warehouse.db")
+
+        for source in sources:
+            table = Table(title=f"{source}: parse → prepare → load into SQLite {SOURCES[source]} ({args.repeat} runs)")
+            table.add_column("Rows", justify="right", style="cyan")
+            for stage in STAGES:
+                table.add_column(f"{stage.capitalize()} rows/s", justify="right")
+            table.add_column("End-to-end rows/s", justify="right", style="green")
+            table.add_column("p50 (s)", justify="right")
+            table.add_column("p95 (s)", justify="right", style="yellow")
+            table.add_column("Peak (MB)", justify="right")
+            table.add_column("Baseline rows/s", justify="right")
+            table.add_column("Status")
+
+            results[source] = {}
+
+            for rows in sizes:
+                payload = admob_response(catalog, rows) if source == "admob" else adjust_csv(catalog, rows)
+                runs = [run_chain(source, payload, warehouse, work_dir) for _ in range(args.repeat)]
+
+                totals = [sum(run.values()) for run in runs]
+                stage_median = {stage: float(np.median([run[stage] for run in runs])) for stage in STAGES}
+                p50, p95 = (float(value) for value in np.percentile(totals, [50, 95]))
+                rows_per_s = rows / p50
+                peak_mb = None if args.no_memory else peak_memory_mb(source, payload, warehouse, work_dir)
+
+                results[source][str(rows)] = {
+                    "rows_per_s": round(rows_per_s, 1),
+                    "p50_s": round(p50, 4),
+                    "p95_s": round(p95, 4),
+                    "peak_mb": round(peak_mb, 1) if peak_mb is not None else None,
+                    "stage_s": {stage: round(value, 4) for stage, value in stage_median.items()},
+                }
+
+                base = baseline.get(source, {}).get(str(rows), {}).get("rows_per_s")
+                status = "[green]ok[/green]"
+                if not base:
+                    status = "[yellow]no baseline[/yellow]"
+                    ungated.append(f"{source} {rows:,}")
+                elif rows_per_s < base * (1 - args.threshold):
+                    status = "[red]regressed[/red]"
+                    failures.append(f"{source} {rows:,} rows: {rows_per_s:,.0f} rows/s vs baseline {base:,.0f}")
+
+                table.add_row(
+                    f"{rows:,}",
+                    *(f"{rows / stage_median[stage]:,.0f}" for stage in STAGES),
+                    f"{rows_per_s:,.0f}",
+                    f"{p50:.3f}",
+                    f"{p95:.3f}",
+                    f"{peak_mb:,.0f}" if peak_mb is not None else "-",
+                    f"{base:,.0f}" if base else "-",
+                    status,
+                )
+
+                del payload
+
+            console.print(table)
+
+        warehouse.close()
+
+    if args.save_baseline:
+        saved = {**baseline}
+        for source, sizes_run in results.items():
+            saved[source] = {**baseline.get(source, {}), **sizes_run}
+        BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps(saved, indent=2))
+        console.print(f"[green]✓ Baseline saved: {BASELINE_FILE}[/green]")
+
+    if ungated and not args.save_baseline:
+        console.print(
+            f"[yellow]⚠ No baseline in {BASELINE_FILE.name} for {', '.join(ungated)}: "
+            "regressions not checked (run --save-baseline on the reference machine)[/yellow]"
+        )
+        if args.require_baseline:
+            failures.append(f"no baseline for {len(ungated)} size(s)")
+
+    if failures:
+        console.print(f"[red]✗ {'; '.join(failures)}[/red]")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
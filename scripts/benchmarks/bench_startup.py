@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+
+Times `--help` for each collector CLI in fresh interpreters (what cron pays
+before any work starts) and compares against a saved JSON baseline.
+
+Usage:
+    python scripts/benchmarks/bench_startup.py
+    python scripts/benchmarks/bench_startup.py --runs 20 --save-baseline
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.utils.console import console
+
+CLIS = [
+    "scripts/check_data.py",
+    "scripts/collect_adjust.py",
+    "scripts/collect_admob.py",
+]
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "startup.json"
+
+
+def time_cli(script: str, runs: int) -> dict:
+    """Median and min wall ms of `python <script> --help` over N runs."""
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, script, "--help"],
+            cwd=project_root,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples)}
+
+
+def main():
+    """Run the startup benchmark."""
+
+    from rich.table import Table
+
+    parser = argparse.ArgumentParser(description="CLI startup benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per CLI (default: 10)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs baseline (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write results to {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    results = {}
+    regressed = []
+
+    table = Table(title=f"CLI --help startup (median of {args.runs})")
+    table.add_column("CLI", style="cyan")
+    table.add_column("Median (ms)", justify="right", style="yellow")
+    table.add_column("Min (ms)", justify="right")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Status")
+
+    for script in CLIS:
+        stats = time_cli(script, args.runs)
+        results[script] = stats
+
+        base = baseline.get(script, {}).get("median_ms")
+        status = "-"
+        if base:
+            if stats["median_ms"] > base * (1 + args.threshold):
+                status = "[red]regressed[/red]"
+                regressed.append(script)
+            else:
+                status = "[green]ok[/green]"
+
+        table.add_row(
+            script,
+            f"{stats['median_ms']:.1f}",
+            f"{stats['min_ms']:.1f}",
+            f"{base:.1f}" if base else "-",
+            status,
+        )
+
+    console.print(table)
+
+    if args.save_baseline:
+        BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps(results, indent=2))
+        console.print(f"[green]✓ Baseline saved: {BASELINE_FILE}[/green]")
+
+    if regressed:
+        console.print(f"[red]✗ Startup regressed: {', '.join(regressed)}[/red]")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Typed vs VARCHAR RAW Benchmark
+
+Compares RAW.ADMOB_DAILY (all VARCHAR, cast on read) with
+RAW.ADMOB_DAILY_TYPED (cast at ingest) side by side:
+- Storage bytes per table
+- Scan time and bytes scanned for typical daily aggregations
+
+Result cache is disabled for the session so every run hits storage.
+
+Usage:
+    python scripts/benchmarks/bench_typed_raw.py
+    python scripts/benchmarks/bench_typed_raw.py --backfill --repeat 5
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from rich.console import Console
+from rich.table import Table
+from rich.panel import Panel
+
+from scripts.utils.snowflake_client import get_snowflake_client
+
+console = Console()
+
+VARCHAR_TABLE = "ADMOB_DAILY"
+TYPED_TABLE = "ADMOB_DAILY_TYPED"
+
+# Copy existing VARCHAR rows into the typed table (same data for both sides)
+BACKFILL_SQL = f"""
+INSERT INTO RAW.{TYPED_TABLE}
+SELECT
+    TO_DATE(date, 'YYYYMMDD'),
+    app_id, country_code, platform, ad_format, ad_unit_id,
+    TRY_TO_NUMBER(ad_impressions),
+    TRY_TO_NUMBER(ad_clicks),
+    TRY_TO_NUMBER(ad_requests),
+    TRY_TO_NUMBER(matched_requests),
+    TRY_TO_NUMBER(estimated_earnings),
+    TRY_TO_NUMBER(observed_ecpm),
+    OBJECT_CONSTRUCT_KEEP_NULL(
+        'DATE', date, 'APP_ID', app_id, 'COUNTRY_CODE', country_code,
+        'PLATFORM', platform, 'AD_FORMAT', ad_format, 'AD_UNIT_ID', ad_unit_id,
+        'AD_IMPRESSIONS', ad_impressions, 'AD_CLICKS', ad_clicks,
+        'AD_REQUESTS', ad_requests, 'MATCHED_REQUESTS', matched_requests,
+        'ESTIMATED_EARNINGS', estimated_earnings, 'OBSERVED_ECPM', observed_ecpm
+    ),
+    loaded_at,
+    batch_id
+FROM RAW.{VARCHAR_TABLE}
+"""
+
+# Typical daily aggregations, written the way each layout is queried
+QUERIES = {
+    "revenue_by_app_7d": (
+        f"""
+        SELECT TO_DATE(date, 'YYYYMMDD') AS d, app_id,
+               SUM(TRY_TO_NUMBER(estimated_earnings)) / 1e6 AS revenue_usd
+        FROM RAW.{VARCHAR_TABLE}
+        WHERE TO_DATE(date, 'YYYYMMDD') >= DATEADD(day, -7, CURRENT_DATE())
+        GROUP BY 1, 2
+        """,
+        f"""
+        SELECT date AS d, app_id,
+               SUM(estimated_earnings) / 1e6 AS revenue_usd
+        FROM RAW.{TYPED_TABLE}
+        WHERE date >= DATEADD(day, -7, CURRENT_DATE())
+        GROUP BY 1, 2
+        """,
+    ),
+    "ecpm_by_country_30d": (
+        f"""
+        SELECT country_code,
+               SUM(TRY_TO_NUMBER(estimated_earnings)) / 1e6
+                 / NULLIF(SUM(TRY_TO_NUMBER(ad_impressions)), 0) * 1000 AS ecpm
+        FROM RAW.{VARCHAR_TABLE}
+        WHERE TO_DATE(date, 'YYYYMMDD') >= DATEADD(day, -30, CURRENT_DATE())
+        GROUP BY 1
+        """,
+        f"""
+        SELECT country_code,
+               SUM(estimated_earnings) / 1e6
+                 / NULLIF(SUM(ad_impressions), 0) * 1000 AS ecpm
+        FROM RAW.{TYPED_TABLE}
+        WHERE date >= DATEADD(day, -30, CURRENT_DATE())
+        GROUP BY 1
+        """,
+    ),
+    "fill_rate_by_format_all": (
+        f"""
+        SELECT ad_format,
+               SUM(TRY_TO_NUMBER(matched_requests))
+                 / NULLIF(SUM(TRY_TO_NUMBER(ad_requests)), 0) AS fill_rate
+        FROM RAW.{VARCHAR_TABLE}
+        GROUP BY 1
+        """,
+        f"""
+        SELECT ad_format,
+               SUM(matched_requests) / NULLIF(SUM(ad_requests), 0) AS fill_rate
+        FROM RAW.{TYPED_TABLE}
+        GROUP BY 1
+        """,
+    ),
+}
+
+
+def get_storage(cursor) -> dict:
+    """Return {table_name: (row_count, bytes)} for both layouts."""
+
+    cursor.execute(
+        f"""
+        SELECT TABLE_NAME, ROW_COUNT, BYTES
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = 'RAW'
+        AND TABLE_NAME IN ('{VARCHAR_TABLE}', '{TYPED_TABLE}')
+    """
+    )
+    return {name: (rows or 0, size or 0) for name, rows, size in cursor.fetchall()}
+
+
+def run_query(cursor, sql: str, repeat: int) -> dict:
+    """
+    Run a query `repeat` times and collect timing from query history.
+
+    Returns:
+        Dict with median wall ms, median execution ms and bytes scanned
+    """
+
+    wall_ms = []
+    query_ids = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cursor.execute(sql)
+        cursor.fetchall()
+        wall_ms.append((time.perf_counter() - start) * 1000)
+        query_ids.append(cursor.sfqid)
+
+    id_list = ", ".join(f"'{qid}'" for qid in query_ids)
+    cursor.execute(
+        f"""
+        SELECT EXECUTION_TIME, BYTES_SCANNED
+        FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION(RESULT_LIMIT => 1000))
+        WHERE QUERY_ID IN ({id_list})
+    """
+    )
+    history = cursor.fetchall()
+
+    return {
+        "wall_ms": statistics.median(wall_ms),
+        "exec_ms": statistics.median(row[0] for row in history) if history else None,
+        "bytes_scanned": statistics.median(row[1] for row in history) if history else None,
+    }
+
+
+def main():
+    """Run the side-by-side benchmark."""
+
+    parser = argparse.ArgumentParser(description="Typed vs VARCHAR RAW benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per query (default: 3)")
+    parser.add_argument("--backfill", action="store_true", help=f"Copy {VARCHAR_TABLE} rows into {TYPED_TABLE} first")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]Typed RAW Benchmark[/bold cyan]\n"
+        f"{VARCHAR_TABLE} (VARCHAR) vs {TYPED_TABLE}\n"
+        f"Repeat: {args.repeat}",
+        title="Benchmark"
+    ))
+
+    client = get_snowflake_client()
+
+    try:
+        conn = client.connect()
+        cursor = conn.cursor()
+
+        cursor.execute("ALTER SESSION SET USE_CACHED_RESULT = FALSE")
+
+        if args.backfill:
+            console.print(f"\n[cyan]Backfilling {TYPED_TABLE} from {VARCHAR_TABLE}...[/cyan]")
+            cursor.execute(BACKFILL_SQL)
+            console.print(f"[green]✓ Inserted {cursor.rowcount:,} rows[/green]")
+
+        # 1. Storage
+        storage = get_storage(cursor)
+
+        storage_table = Table(title="Storage")
+        storage_table.add_column("Table", style="cyan")
+        storage_table.add_column("Rows", justify="right", style="green")
+        storage_table.add_column("Size (MB)", justify="right", style="yellow")
+        storage_table.add_column("Bytes/Row", justify="right")
+
+        for name in (VARCHAR_TABLE, TYPED_TABLE):
+            rows, size = storage.get(name, (0, 0))
+            per_row = f"{size / rows:.1f}" if rows else "-"
+            storage_table.add_row(name, f"{rows:,}", f"{size / 1024 / 1024:.2f}", per_row)
+
+        console.print(storage_table)
+
+        # 2. Scan time for daily aggregations
+        scan_table = Table(title=f"Daily Aggregations (median of {args.repeat})")
+        scan_table.add_column("Query", style="cyan")
+        scan_table.add_column("Layout")
+        scan_table.add_column("Wall (ms)", justify="right")
+        scan_table.add_column("Exec (ms)", justify="right")
+        scan_table.add_column("Scanned (MB)", justify="right", style="yellow")
+
+        for query_name, (varchar_sql, typed_sql) in QUERIES.items():
+            for layout, sql in (("VARCHAR", varchar_sql), ("TYPED", typed_sql)):
+                stats = run_query(cursor, sql, args.repeat)
+                scanned = stats["bytes_scanned"]
+                scan_table.add_row(
+                    query_name,
+                    layout,
+                    f"{stats['wall_ms']:.0f}",
+                    f"{stats['exec_ms']:.0f}" if stats["exec_ms"] is not None else "-",
+                    f"{scanned / 1024 / 1024:.2f}" if scanned is not None else "-",
+                )
+
+        console.print(scan_table)
+
+        cursor.close()
+        return 0
+
+    except Exception as e:
+        console.print(f"[red]✗ Benchmark failed: {e}[/red]")
+        return 1
+
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
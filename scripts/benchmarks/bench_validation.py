@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Batch Validation Benchmark
+
+Times validate_batch (PK hash dedup, NOT NULL and type checks) on synthetic
+Adjust-shaped batches (~1% dirty rows), next to the spool write of the same
+batch (Parquet zstd, the cheapest local step of every load) for scale.
+
+Validation must add well under 5% to pipeline time. Pass the wall time of a
+real collector run of the largest size (--pipeline-seconds, e.g. from the
+run_pipeline.py summary) to enforce that; the run also fails if validation
+regresses vs the saved baseline. A typed AdMob batch (cast_admob_typed,
+with the RAW_VALUES VARIANT column) is also validated against
+ADMOB_DAILY_TYPED and must pass unchanged.
+
+Usage:
+    python scripts/benchmarks/bench_validation.py
+    python scripts/benchmarks/bench_validation.py --rows 100000,1000000 --save-baseline
+    python scripts/benchmarks/bench_validation.py --pipeline-seconds 75
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+
+from scripts.benchmarks.bench_pipeline import CATALOG, admob_response
+from scripts.benchmarks.mock_api_server import SyntheticCatalog
+from scripts.collect_admob import cast_admob_typed, parse_admob_response, stamp_admob_frame
+from scripts.utils.batch_validation import validate_batch
+from scripts.utils.console import console
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "validation.json"
+
+
+def make_adjust_batch(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Adjust hourly batch as fetched (string dimensions, ISO hours), ~1% dirty."""
+
+    rng = np.random.default_rng(seed)
+    hours = pd.date_range("2025-10-01", periods=24 * 14, freq="h")
+    hour = hours[rng.integers(0, len(hours), rows)]
+
+    df = pd.DataFrame({
+        "APP": rng.choice([f"app_{i}" for i in range(20)], rows),
+        "STORE_ID": rng.choice([f"com.example.app{i}" for i in range(20)], rows),
+        "DAY": hour.strftime("%Y-%m-%d"),
+        "HOUR": hour.strftime("%Y-%m-%dT%H:%M:%S"),
+        "COUNTRY": rng.choice([f"c{i:03d}" for i in range(200)], rows),
+        "OS_NAME": rng.choice(["ios", "android"], rows),
+        "INSTALLS": rng.integers(0, 500, rows),
+        "CLICKS": rng.integers(0, 5000, rows),
+        "DAUS": rng.random(rows) * 1000,
+        "AD_REVENUE": rng.random(rows) * 10,
+        "AD_IMPRESSIONS": rng.integers(0, 10000, rows),
+        "AD_REVENUE_TOTAL_D0": rng.random(rows) * 10,
+        "AD_IMPRESSIONS_TOTAL_D0": rng.integers(0, 10000, rows),
+        "NETWORK_COST": rng.random(rows) * 10,
+        "NETWORK_COST_DIFF": rng.random(rows),
+    })
+
+    dirty = rng.choice(rows, size=max(rows // 100, 1), replace=False)
+    df.loc[dirty[::2], "APP"] = None
+    df.loc[dirty[1::2], "HOUR"] = "not-a-timestamp"
+    return df
+
+
+def check_typed_batch(rows: int, quarantine_dir: Path) -> str | None:
+    """Validate a typed AdMob batch (dict RAW_VALUES); returns a failure or None."""
+
+    df = cast_admob_typed(stamp_admob_frame(parse_admob_response(admob_response(SyntheticCatalog(**CATALOG), rows)), "bench"))
+    try:
+        clean, report = validate_batch(df, "ADMOB_DAILY_TYPED", quarantine_dir=quarantine_dir)
+    except Exception as e:
+        return f"ADMOB_DAILY_TYPED validation raised {type(e).__name__}: {e}"
+    if len(clean) != len(df):
+        return f"ADMOB_DAILY_TYPED dropped {report['duplicates'] + report['invalid']:,} of {len(df):,} clean rows"
+    return None
+
+
+def time_once(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the validation benchmark."""
+
+    from rich.table import Table
+
+    parser = argparse.ArgumentParser(description="Batch validation benchmark")
+    parser.add_argument("--rows", type=str, default="10000,100000,1000000", help="Comma-separated batch sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size, best kept (default: 3)")
+    parser.add_argument("--pipeline-seconds", type=float, help="Pipeline wall time at the largest size to budget against")
+    parser.add_argument("--budget", type=float, default=0.05, help="Max validation share of --pipeline-seconds (default: 0.05)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs baseline (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write results to {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.rows.split(",")]
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    results = {}
+    failures = []
+
+    table = Table(title=f"validate_batch (best of {args.repeat})")
+    table.add_column("Rows", justify="right", style="cyan")
+    table.add_column("Validate (s)", justify="right", style="yellow")
+    table.add_column("µs/row", justify="right")
+    table.add_column("Spool write (s)", justify="right")
+    table.add_column("vs spool", justify="right")
+    table.add_column("Baseline (s)", justify="right")
+    table.add_column("Status")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+
+        for rows in sizes:
+            df = make_adjust_batch(rows)
+
+            validate_seconds = min(
+                time_once(lambda: validate_batch(df, "ADJUST_HOURLY", quarantine_dir=tmp_dir))
+                for _ in range(args.repeat)
+            )
+            spool_seconds = min(
+                time_once(lambda: df.to_parquet(tmp_dir / "batch.parquet", index=False, compression="zstd"))
+                for _ in range(args.repeat)
+            )
+            ratio = validate_seconds / spool_seconds
+            results[str(rows)] = {"validate_s": validate_seconds, "spool_write_s": spool_seconds}
+
+            base = baseline.get(str(rows), {}).get("validate_s")
+            status = "[green]ok[/green]"
+            if base and validate_seconds > base * (1 + args.threshold):
+                status = "[red]regressed[/red]"
+                failures.append(f"{rows:,} rows regressed")
+            if rows == max(sizes) and args.pipeline_seconds:
+                share = validate_seconds / args.pipeline_seconds
+                console.print(f"Validation share of pipeline at {rows:,} rows: {share:.1%}")
+                if share > args.budget:
+                    status = "[red]over budget[/red]"
+                    failures.append(f"{rows:,} rows over {args.budget:.0%} budget")
+
+            table.add_row(
+                f"{rows:,}",
+                f"{validate_seconds:.3f}",
+                f"{validate_seconds / rows * 1e6:.2f}",
+                f"{spool_seconds:.3f}",
+                f"{ratio:.2f}x",
+                f"{base:.3f}" if base else "-",
+                status,
+            )
+
+        typed_failure = check_typed_batch(min(sizes), tmp_dir)
+
+    console.print(table)
+
+    if typed_failure:
+        failures.append(typed_failure)
+    else:
+        console.print(f"[green]✓ ADMOB_DAILY_TYPED batch of {min(sizes):,} rows validated[/green]")
+
+    if args.save_baseline:
+        BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps(results, indent=2))
+        console.print(f"[green]✓ Baseline saved: {BASELINE_FILE}[/green]")
+
+    if failures:
+        console.print(f"[red]✗ {'; '.join(failures)}[/red]")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Synthetic RAW Data Generator
+
+Writes multi-year ADMOB_DAILY, ADJUST_HOURLY and ADJUST_COHORTS data as
+Parquet, with the exact columns and types of sql/setup/create_raw_tables.sql
+(AdMob metrics as strings, micros included; LOADED_AT, BATCH_ID and ROW_HASH
+as the collectors stamp them), for testing dbt models, clustering and
+queries at warehouse scale without the source APIs.
+
+Volumes follow the DDL (~13.5K AdMob and ~127K Adjust rows/day, so one year
+is ~50M rows), with realistic skew:
+- apps: log-normal sizes with per-app yearly growth; each app ships on
+  Android and iOS
+- countries: Zipf-like mix (a few markets carry most traffic)
+- hours: diurnal curve peaking in each country's local evening
+- weekends: +15% traffic
+
+Each row of the full grain (app × ad unit × country, app × country × hour,
+app × country) appears with probability proportional to its expected
+traffic, calibrated so a day averages the target row count; tail
+combinations come and go from day to day as they do in the API data.
+
+Generation is vectorized per day and parallel across processes: each task
+writes one Parquet file (zstd) of --days-per-file days for one table. Every
+day is seeded from (--seed, table, date), so output does not depend on
+--workers or the range requested.
+
+Load into Snowflake with SnowflakeClient.load_parquet(path, table) per file.
+
+Usage:
+    python scripts/benchmarks/generate_raw_data.py
+    python scripts/benchmarks/generate_raw_data.py --start 2023-01-01 --years 2 --workers 8
+    python scripts/benchmarks/generate_raw_data.py --tables ADJUST_HOURLY --scale 0.1 --out /tmp/raw
+"""
+
+import os
+import sys
+import time
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+
+from scripts.benchmarks.mock_api_server import AD_FORMATS, COUNTRIES, FORMAT_ECPM_USD
+from scripts.utils.console import console
+from scripts.utils.row_hash import add_row_hash
+
+OUTPUT_DIR = project_root / ".state" / "synthetic"
+
+TABLES = ["ADMOB_DAILY", "ADJUST_HOURLY", "ADJUST_COHORTS"]
+
+# Average rows per day at --scale 1 (DDL volume comments; cohorts: app × country with installs)
+ROWS_PER_DAY = {"ADMOB_DAILY": 13_500, "ADJUST_HOURLY": 127_000, "ADJUST_COHORTS": 6_000}
+
+# Metric columns hashed into ROW_HASH (as collect_admob / collect_adjust do)
+ADMOB_HASHED = ["AD_IMPRESSIONS", "AD_CLICKS", "AD_REQUESTS", "MATCHED_REQUESTS", "ESTIMATED_EARNINGS", "OBSERVED_ECPM"]
+ADJUST_HASHED = [
+    "INSTALLS", "CLICKS", "AD_IMPRESSIONS", "AD_IMPRESSIONS_TOTAL_D0",
+    "DAUS", "AD_REVENUE", "AD_REVENUE_TOTAL_D0", "NETWORK_COST", "NETWORK_COST_DIFF",
+]
+
+# DATE columns (written as Parquet date32, not timestamps)
+DATE_COLUMNS = {"ADJUST_HOURLY": ["DAY"], "ADJUST_COHORTS": ["COHORT_DATE"]}
+
+# UTC offsets of the largest markets (the rest are drawn per country)
+UTC_OFFSETS = {"US": -5, "JP": 9, "DE": 1, "GB": 0, "KR": 9, "FR": 1, "CA": -5, "AU": 10, "BR": -3, "IN": 5}
+
+# App growth is measured from here, so a day's data does not depend on --start
+EPOCH = date(2020, 1, 1)
+
+
+class Universe:
+    """Apps, countries and ad units, with each table's per-row presence probability."""
+
+    def __init__(self, apps: int, countries: int, scale: float, seed: int):
+        static = np.random.default_rng([seed, 0])
+
+        codes = [code for code, _ in COUNTRIES]
+        names = [name for _, name in COUNTRIES]
+        # Beyond the named list: unused two-letter codes, named after themselves
+        extra = [a + b for a in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" for b in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if a + b not in codes]
+        self.country_codes = np.array((codes + extra)[:countries], dtype=object)
+        self.country_names = np.array((names + extra[:max(countries - len(names), 0)])[:countries], dtype=object)
+
+        weights = 1 / np.arange(1, countries + 1) ** 1.1
+        self.country_weight = weights / weights.mean()
+        self.country_value = np.linspace(1.6, 0.3, countries)
+        drawn = static.integers(-8, 10, countries)
+        self.utc_offset = np.array([UTC_OFFSETS.get(code, offset) for code, offset in zip(self.country_codes, drawn)])
+
+        # Listings: every app on Android (even) and iOS (odd)
+        listings = apps * 2
+        app = np.arange(listings) // 2
+        android = np.arange(listings) % 2 == 0
+        app_size = static.lognormal(0.0, 1.0, apps)
+        self.listing_size = app_size[app] * np.where(android, 1.3, 0.7)
+        self.listing_growth = np.repeat(static.normal(0.15, 0.25, apps), 2)
+        self.app_names = np.array([f"Synthetic App {i:03d}" for i in app], dtype=object)
+        self.admob_app_ids = np.array([f"ca-app-pub-0000000000000000~{1000000000 + i}" for i in range(listings)], dtype=object)
+        self.platforms = np.where(android, "Android", "iOS").astype(object)
+        self.os_names = np.where(android, "android", "ios").astype(object)
+        self.store_ids = np.array([
+            f"com.synthetic.app{i // 2:03d}" if i % 2 == 0 else f"id{1500000000 + i // 2}" for i in range(listings)
+        ], dtype=object)
+
+        # One ad unit per format per listing
+        units = listings * len(AD_FORMATS)
+        self.unit_listing = np.arange(units) // len(AD_FORMATS)
+        self.unit_formats = np.array([AD_FORMATS[unit % len(AD_FORMATS)] for unit in range(units)], dtype=object)
+        self.unit_ids = np.array([f"ca-app-pub-0000000000000000/{2000000000 + unit}" for unit in range(units)], dtype=object)
+        self.unit_ecpm = np.array([FORMAT_ECPM_USD[fmt] for fmt in self.unit_formats])
+        self.unit_share = np.array([{"BANNER": 2.0, "INTERSTITIAL": 1.2, "REWARDED": 0.8}.get(fmt, 0.5) for fmt in self.unit_formats])
+
+        # Full-grain index arrays and expected traffic (weight) per row
+        countries_ = np.arange(countries)
+        self.admob_unit = np.repeat(np.arange(units), countries)
+        self.admob_country = np.tile(countries_, units)
+        admob_weight = (
+            self.listing_size[self.unit_listing[self.admob_unit]]
+            * self.unit_share[self.admob_unit]
+            * self.country_weight[self.admob_country]
+        )
+
+        self.adjust_listing = np.repeat(np.arange(listings), countries * 24)
+        self.adjust_country = np.tile(np.repeat(countries_, 24), listings)
+        self.adjust_hour = np.tile(np.arange(24), listings * countries)
+        self.adjust_diurnal = diurnal(self.adjust_hour, self.utc_offset[self.adjust_country])
+        adjust_weight = self.listing_size[self.adjust_listing] * self.country_weight[self.adjust_country] * self.adjust_diurnal
+
+        self.cohort_listing = np.repeat(np.arange(listings), countries)
+        self.cohort_country = np.tile(countries_, listings)
+        cohort_weight = self.listing_size[self.cohort_listing] * self.country_weight[self.cohort_country]
+
+        self.weight = {"ADMOB_DAILY": admob_weight, "ADJUST_HOURLY": adjust_weight, "ADJUST_COHORTS": cohort_weight}
+        self.presence = {
+            table: presence_probability(weight, ROWS_PER_DAY[table] * scale)
+            for table, weight in self.weight.items()
+        }
+
+
+def diurnal(hour_utc: np.ndarray, utc_offset: np.ndarray) -> np.ndarray:
+    """Traffic multiplier by hour (mean 1), peaking at 21:00 local, lowest around 05:00."""
+
+    local = (hour_utc + utc_offset) % 24
+    return 1 + 0.7 * np.cos(2 * np.pi * (local - 21) / 24)
+
+
+def presence_probability(weight: np.ndarray, rows: float) -> np.ndarray:
+    """min(1, c × weight), with c chosen (bisection) so the probabilities sum to rows."""
+
+    if rows >= len(weight):
+        return np.ones(len(weight))
+
+    low, high = 0.0, 1.0
+    while np.minimum(1.0, high * weight).sum() < rows:
+        high *= 2
+    for _ in range(50):
+        mid = (low + high) / 2
+        if np.minimum(1.0, mid * weight).sum() < rows:
+            low = mid
+        else:
+            high = mid
+    return np.minimum(1.0, high * weight)
+
+
+@functools.lru_cache(maxsize=4)
+def get_universe(apps: int, countries: int, scale: float, seed: int) -> Universe:
+    """Universe per worker process (built once, reused for every task)."""
+    return Universe(apps, countries, scale, seed)
+
+
+def _day_factor(universe: Universe, listing: np.ndarray, day: date) -> np.ndarray:
+    """Per-row traffic multiplier for the day: app growth since EPOCH and weekends."""
+
+    years = (day - EPOCH).days / 365.25
+    weekend = 1.15 if day.weekday() >= 5 else 1.0
+    return np.exp(universe.listing_growth[listing] * years) * weekend
+
+
+def _loaded_at(rng: np.random.Generator, start: np.datetime64, rows: int, hours: float) -> np.ndarray:
+    """Load timestamps spread over N hours after start (microseconds)."""
+
+    offsets = rng.integers(0, int(hours * 3600 * 1_000_000), rows).astype("timedelta64[us]")
+    return start.astype("datetime64[us]") + offsets
+
+
+def admob_day(universe: Universe, day: date, rng: np.random.Generator) -> pd.DataFrame:
+    """ADMOB_DAILY rows for one day (metrics as API strings)."""
+
+    keep = rng.random(len(universe.admob_unit)) < universe.presence["ADMOB_DAILY"]
+    unit = universe.admob_unit[keep]
+    country = universe.admob_country[keep]
+    listing = universe.unit_listing[unit]
+
+    lam = 600 * universe.weight["ADMOB_DAILY"][keep] * _day_factor(universe, listing, day)
+    requests = 1 + rng.poisson(lam)
+    matched = rng.binomial(requests, rng.uniform(0.6, 0.98, len(unit)))
+    impressions = rng.binomial(matched, 0.85)
+    clicks = rng.binomial(impressions, 0.012)
+
+    ecpm = rng.gamma(4.0, universe.unit_ecpm[unit] * universe.country_value[country] / 4.0)
+    earnings = np.round(impressions * ecpm / 1000 * 1_000_000).astype(np.int64)
+    observed_ecpm = np.round(earnings / np.maximum(impressions, 1) * 1000).astype(np.int64)
+
+    day_string = day.isoformat()
+    return pd.DataFrame({
+        "DATE": day.strftime("%Y%m%d"),
+        "APP_ID": universe.admob_app_ids[listing],
+        "COUNTRY_CODE": universe.country_codes[country],
+        "PLATFORM": universe.platforms[listing],
+        "AD_FORMAT": universe.unit_formats[unit],
+        "AD_UNIT_ID": universe.unit_ids[unit],
+        "AD_IMPRESSIONS": impressions.astype(str).astype(object),
+        "AD_CLICKS": clicks.astype(str).astype(object),
+        "AD_REQUESTS": requests.astype(str).astype(object),
+        "MATCHED_REQUESTS": matched.astype(str).astype(object),
+        "ESTIMATED_EARNINGS": earnings.astype(str).astype(object),
+        "OBSERVED_ECPM": observed_ecpm.astype(str).astype(object),
+        # Daily batch run the next morning
+        "LOADED_AT": _loaded_at(rng, np.datetime64(day + timedelta(days=1)) + np.timedelta64(6, "h"), len(unit), 0.5),
+        "BATCH_ID": f"{day_string}_{day_string}",
+    })
+
+
+def adjust_hourly_day(universe: Universe, day: date, rng: np.random.Generator) -> pd.DataFrame:
+    """ADJUST_HOURLY rows for one day."""
+
+    keep = rng.random(len(universe.adjust_listing)) < universe.presence["ADJUST_HOURLY"]
+    listing = universe.adjust_listing[keep]
+    country = universe.adjust_country[keep]
+    hour = universe.adjust_hour[keep]
+    value = universe.country_value[country]
+
+    lam = 2 * universe.weight["ADJUST_HOURLY"][keep] * _day_factor(universe, listing, day)
+    installs = rng.poisson(lam)
+    clicks = installs + rng.poisson(lam * 8)
+    daus = np.round(1 + rng.poisson(lam * 40) * rng.uniform(0.9, 1.1, len(lam)), 2)
+    ad_impressions = rng.poisson(lam * 240)
+    ad_impressions_d0 = rng.binomial(ad_impressions, 0.1)
+    ecpm = rng.gamma(4.0, 2.0 * value / 4.0)
+    ad_revenue = np.round(ad_impressions * ecpm / 1000, 4)
+    network_cost = np.round(installs * rng.gamma(2.0, 0.6 * value), 4)
+    # Later cost restatements, on a few rows
+    restated = rng.random(len(lam)) < 0.02
+    network_cost_diff = np.where(restated, np.round(network_cost * rng.normal(0, 0.05, len(lam)), 4), 0.0)
+
+    hours = np.datetime64(day, "h") + hour.astype("timedelta64[h]")
+    return pd.DataFrame({
+        "APP": universe.app_names[listing],
+        "STORE_ID": universe.store_ids[listing],
+        "DAY": np.datetime64(day, "D"),
+        "HOUR": hours.astype("datetime64[us]"),
+        "COUNTRY": universe.country_names[country],
+        "OS_NAME": universe.os_names[listing],
+        "INSTALLS": installs,
+        "CLICKS": clicks,
+        "DAUS": daus,
+        "AD_REVENUE": ad_revenue,
+        "AD_IMPRESSIONS": ad_impressions,
+        "AD_REVENUE_TOTAL_D0": np.round(ad_revenue * ad_impressions_d0 / np.maximum(ad_impressions, 1), 4),
+        "AD_IMPRESSIONS_TOTAL_D0": ad_impressions_d0,
+        "NETWORK_COST": network_cost,
+        "NETWORK_COST_DIFF": network_cost_diff,
+        # Hourly runs pick each hour up within the next two hours
+        "LOADED_AT": hours.astype("datetime64[us]") + np.timedelta64(1, "h")
+        + rng.integers(0, 7_200_000_000, len(lam)).astype("timedelta64[us]"),
+    })
+
+
+def adjust_cohorts_day(universe: Universe, day: date, rng: np.random.Generator, as_of: date) -> pd.DataFrame:
+    """ADJUST_COHORTS rows for one cohort date (retention unknown until the day has passed)."""
+
+    keep = rng.random(len(universe.cohort_listing)) < universe.presence["ADJUST_COHORTS"]
+    listing = universe.cohort_listing[keep]
+    country = universe.cohort_country[keep]
+
+    lam = 48 * universe.weight["ADJUST_COHORTS"][keep] * _day_factor(universe, listing, day)
+    size_d0 = 1 + rng.poisson(lam)
+    # Retention curve per row: d1 ~35%, d7 ~12%, d30 ~4% on average
+    quality = rng.beta(8, 8, len(lam)) * 2
+    size_d1 = rng.binomial(size_d0, np.clip(0.35 * quality, 0, 1))
+    size_d7 = rng.binomial(size_d1, np.clip(0.34 * quality, 0, 1))
+    size_d30 = rng.binomial(size_d7, np.clip(0.33 * quality, 0, 1))
+
+    columns = {
+        "COHORT_DATE": np.datetime64(day, "D"),
+        "APP_NAME": universe.app_names[listing],
+        "STORE_ID": universe.store_ids[listing],
+        "COUNTRY_CODE": universe.country_codes[country],
+        "COHORT_SIZE_D0": size_d0,
+    }
+    retained = {days: size for days, size in ((1, size_d1), (7, size_d7), (30, size_d30)) if (as_of - day).days >= days}
+    for days in (1, 7, 30):
+        columns[f"COHORT_SIZE_D{days}"] = pd.array(retained.get(days, [None] * len(lam)), dtype="Int64")
+    for days in (1, 7, 30):
+        size = retained.get(days)
+        columns[f"RETENTION_D{days}_PCT"] = np.round(size / size_d0, 4) if size is not None else np.full(len(lam), np.nan)
+
+    columns["LOADED_AT"] = _loaded_at(rng, np.datetime64(as_of + timedelta(days=1)) + np.timedelta64(7, "h"), len(lam), 0.25)
+    return pd.DataFrame(columns)
+
+
+def add_years(day: date, years: float) -> date:
+    """Same calendar day N whole years later (Feb 29 → Mar 1), plus the fraction in days."""
+
+    whole, fraction = divmod(years, 1)
+    try:
+        later = day.replace(year=day.year + int(whole))
+    except ValueError:
+        later = date(day.year + int(whole), 3, 1)
+    return later + timedelta(days=round(fraction * 365))
+
+
+def generate_file(table: str, start: date, days: int, as_of: date, config: dict, out_dir: Path) -> tuple[str, int, int]:
+    """Generate one table's rows for a run of days and write them as one Parquet file."""
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    universe = get_universe(config["apps"], config["countries"], config["scale"], config["seed"])
+    table_index = TABLES.index(table) + 1
+
+    frames = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        rng = np.random.default_rng([config["seed"], table_index, day.toordinal()])
+        if table == "ADMOB_DAILY":
+            frames.append(admob_day(universe, day, rng))
+        elif table == "ADJUST_HOURLY":
+            frames.append(adjust_hourly_day(universe, day, rng))
+        else:
+            frames.append(adjust_cohorts_day(universe, day, rng, as_of))
+
+    df = pd.concat(frames, ignore_index=True)
+    if table == "ADMOB_DAILY":
+        add_row_hash(df, ADMOB_HASHED)
+    elif table == "ADJUST_HOURLY":
+        add_row_hash(df, ADJUST_HASHED)
+
+    arrow = pa.Table.from_pandas(df, preserve_index=False)
+    for name in DATE_COLUMNS.get(table, []):
+        index = arrow.schema.get_field_index(name)
+        arrow = arrow.set_column(index, name, arrow.column(name).cast(pa.date32()))
+
+    end = start + timedelta(days=days - 1)
+    path = out_dir / table / f"{table}_{start:%Y%m%d}_{end:%Y%m%d}.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Microsecond timestamps: Snowflake misreads Parquet nanosecond ones
+    pq.write_table(arrow, path, compression="zstd", coerce_timestamps="us", allow_truncated_timestamps=True)
+
+    return table, len(df), path.stat().st_size
+
+
+def main():
+    """Generate the synthetic RAW tables."""
+
+    from rich.table import Table
+
+    parser = argparse.ArgumentParser(description="Generate synthetic RAW table data (Parquet) matching the DDL")
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2024, 1, 1), help="First day (default: 2024-01-01)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day (default: --years after --start)")
+    parser.add_argument("--years", type=float, default=1.0, help="Years of data when --end is not given (default: 1)")
+    parser.add_argument("--tables", type=str, default=",".join(TABLES), help="Comma-separated tables (default: all three)")
+    parser.add_argument("--apps", type=int, default=30, help="Apps, each on Android and iOS (default: 30)")
+    parser.add_argument("--countries", type=int, default=240, help="Countries (default: 240)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier on rows per day (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--days-per-file", type=int, default=7, help="Days per Parquet file (default: 7)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR, help=f"Output directory (default: {OUTPUT_DIR.relative_to(project_root)})")
+    args = parser.parse_args()
+
+    tables = [name.strip().upper() for name in args.tables.split(",") if name.strip()]
+    unknown = [name for name in tables if name not in TABLES]
+    if unknown:
+        console.print(f"[red]✗ Unknown table(s): {', '.join(unknown)}[/red]")
+        return 1
+
+    end = args.end or add_years(args.start, args.years) - timedelta(days=1)
+    if end < args.start:
+        console.print("[red]✗ --end is before --start[/red]")
+        return 1
+
+    total_days = (end - args.start).days + 1
+    config = {"apps": args.apps, "countries": args.countries, "scale": args.scale, "seed": args.seed}
+
+    # The grid must hold the requested rows per day
+    universe = get_universe(**config)
+    for name in tables:
+        grid = len(universe.weight[name])
+        if ROWS_PER_DAY[name] * args.scale > grid:
+            console.print(
+                f"[yellow]⚠️  {name}: {ROWS_PER_DAY[name] * args.scale:,.0f} rows/day requested but the grid has "
+                f"{grid:,} combinations; raise --apps or --countries[/yellow]"
+            )
+
+    tasks = [
+        (name, args.start + timedelta(days=offset), min(args.days_per_file, total_days - offset))
+        for name in tables
+        for offset in range(0, total_days, args.days_per_file)
+    ]
+    console.print(
+        f"[cyan]Generating {', '.join(tables)}: {args.start} → {end} ({total_days:,} days), "
+        f"{len(tasks):,} files on {args.workers} workers → {args.out}[/cyan]"
+    )
+
+    rows = {name: 0 for name in tables}
+    sizes = {name: 0 for name in tables}
+    files = {name: 0 for name in tables}
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(generate_file, name, first, days, end, config, args.out) for name, first, days in tasks]
+        with console.status("Writing Parquet files...") as status:
+            for done, future in enumerate(as_completed(futures), 1):
+                name, count, size = future.result()
+                rows[name] += count
+                sizes[name] += size
+                files[name] += 1
+                status.update(f"Writing Parquet files... {done:,}/{len(futures):,} ({sum(rows.values()):,} rows)")
+
+    seconds = time.perf_counter() - start_time
+
+    table = Table(title=f"Synthetic RAW data: {args.start} → {end}")
+    table.add_column("Table", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Rows", justify="right", style="green")
+    table.add_column("Rows/day", justify="right")
+    table.add_column("Size (MB)", justify="right", style="yellow")
+    for name in tables:
+        table.add_row(name, f"{files[name]:,}", f"{rows[name]:,}", f"{rows[name] / total_days:,.0f}", f"{sizes[name] / 1024 ** 2:,.1f}")
+    console.print(table)
+
+    total = sum(rows.values())
+    console.print(f"[green]✓ {total:,} rows in {seconds:.1f}s ({total / seconds:,.0f} rows/s) → {args.out}[/green]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
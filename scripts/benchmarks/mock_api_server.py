@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+"""
+Mock AdMob / Adjust API Server
+
+Local stand-in for both source APIs, so the collectors, run_pipeline.py,
+the daemon and the scripts/validation probes can be load-tested offline:
+- AdMob: v1 discovery document, accounts.mediationReport.generate and
+  accounts.networkReport.generate (JSON array: header, rows, footer)
+- Adjust: /reports-service/csv_report (dimensions, metrics, date_period)
+
+Data is synthetic and deterministic: the same --seed and day always give
+the same rows, whatever range a request covers. Scale per day is
+apps × countries × ad units per app (AdMob) and apps × countries × 24 hours
+(Adjust). Reports are grouped by the requested dimensions, as the APIs do.
+
+AdMob report specs may carry dimension_filters (matches_any), and
+accounts.apps.list returns the catalog's apps.
+
+Faults: --latency-ms / --jitter-ms per request, --error-rate (random 429s),
+--rps-limit (429 above N requests/sec), both with Retry-After,
+--truncate-rate (body cut off mid-stream) and --max-report-rows (503 for
+AdMob reports above N rows). GET /_mock/stats returns counters.
+
+Usage:
+    python scripts/benchmarks/mock_api_server.py
+    python scripts/benchmarks/mock_api_server.py --apps 40 --countries 200 --ad-units 10
+    python scripts/benchmarks/mock_api_server.py --latency-ms 300 --error-rate 0.05 --truncate-rate 0.01
+    python scripts/benchmarks/mock_api_server.py --max-report-rows 5000  # oversized AdMob reports → 503
+
+    # Point the collectors at it (any ADJUST_TOKEN is accepted)
+    export ADMOB_API_URL=http://127.0.0.1:8790 ADJUST_API_URL=http://127.0.0.1:8790 ADJUST_TOKEN=mock
+    python scripts/collect_adjust.py --hours 24 --no-ledger
+"""
+
+import sys
+import json
+import time
+import random
+import signal
+import argparse
+import functools
+import threading
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+
+from scripts.utils.console import console
+
+CACHED_DAYS = 64  # generated day frames kept per source
+
+# ISO code, Adjust country name (most valuable first; weights follow rank)
+COUNTRIES = [
+    ("US", "United States"), ("JP", "Japan"), ("DE", "Germany"), ("GB", "United Kingdom"),
+    ("KR", "South Korea"), ("FR", "France"), ("CA", "Canada"), ("AU", "Australia"),
+    ("BR", "Brazil"), ("IN", "India"), ("IT", "Italy"), ("ES", "Spain"), ("MX", "Mexico"),
+    ("RU", "Russia"), ("TW", "Taiwan"), ("NL", "Netherlands"), ("SE", "Sweden"),
+    ("TR", "Turkey"), ("ID", "Indonesia"), ("TH", "Thailand"), ("VN", "Vietnam"),
+    ("PH", "Philippines"), ("PL", "Poland"), ("SA", "Saudi Arabia"), ("AE", "United Arab Emirates"),
+    ("CH", "Switzerland"), ("AT", "Austria"), ("BE", "Belgium"), ("NO", "Norway"),
+    ("DK", "Denmark"), ("FI", "Finland"), ("IE", "Ireland"), ("PT", "Portugal"),
+    ("AR", "Argentina"), ("CL", "Chile"), ("CO", "Colombia"), ("PE", "Peru"),
+    ("EG", "Egypt"), ("ZA", "South Africa"), ("NG", "Nigeria"), ("PK", "Pakistan"),
+    ("BD", "Bangladesh"), ("MY", "Malaysia"), ("SG", "Singapore"), ("HK", "Hong Kong"),
+    ("NZ", "New Zealand"), ("IL", "Israel"), ("UA", "Ukraine"), ("RO", "Romania"),
+    ("CZ", "Czechia"),
+]
+
+AD_FORMATS = ["BANNER", "INTERSTITIAL", "REWARDED", "NATIVE", "APP_OPEN"]
+FORMAT_ECPM_USD = {"BANNER": 0.4, "INTERSTITIAL": 6.0, "REWARDED": 12.0, "NATIVE": 2.5, "APP_OPEN": 4.0}
+
+# AdMob report dimensions → frame columns (value, display label)
+ADMOB_DIMENSIONS = {
+    "APP": ("APP_ID", "APP_NAME"),
+    "DATE": ("DATE", None),
+    "COUNTRY": ("COUNTRY", None),
+    "PLATFORM": ("PLATFORM", None),
+    "FORMAT": ("FORMAT", None),
+    "AD_UNIT": ("AD_UNIT_ID", "AD_UNIT_NAME"),
+}
+ADMOB_SUMMED = ["AD_REQUESTS", "MATCHED_REQUESTS", "IMPRESSIONS", "CLICKS", "ESTIMATED_EARNINGS"]
+ADMOB_METRICS = ADMOB_SUMMED + ["OBSERVED_ECPM", "IMPRESSION_CTR", "MATCH_RATE"]
+
+ADJUST_DIMENSIONS = ["app", "store_id", "day", "hour", "country", "country_code", "os_name"]
+ADJUST_METRICS = [
+    "installs", "clicks", "daus", "ad_revenue", "ad_impressions",
+    "ad_revenue_total_d0", "ad_impressions_total_d0", "network_cost", "network_cost_diff",
+]
+
+
+class BadRequest(Exception):
+    """Invalid report request (sent back as HTTP 400)."""
+
+
+class ReportTooLarge(Exception):
+    """Report above --max-report-rows (sent back as HTTP 503)."""
+
+
+class SyntheticCatalog:
+    """Deterministic synthetic report data for a fixed set of apps, countries and ad units."""
+
+    def __init__(self, apps: int, countries: int, ad_units: int, seed: int = 0):
+        self.apps = apps
+        self.ad_units = ad_units
+        self.seed = seed
+
+        codes = [code for code, _ in COUNTRIES]
+        names = [name for _, name in COUNTRIES]
+        # Beyond the named list: unused two-letter codes, named after themselves
+        extra = [a + b for a in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" for b in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if a + b not in codes]
+        self.country_codes = np.array((codes + extra)[:countries])
+        self.country_names = np.array((names + extra[:max(countries - len(names), 0)])[:countries])
+
+        # Zipf-like country mix (mean 1): a few markets carry most traffic
+        weights = 1 / np.arange(1, countries + 1) ** 1.1
+        self.country_weight = weights / weights.mean()
+        # Tier-1 markets monetize better
+        self.country_value = np.linspace(1.6, 0.3, countries)
+
+        static = np.random.default_rng([seed, 0])
+        self.app_size = static.lognormal(0.0, 1.0, apps)
+        self.app_names = np.array([f"Mock App {i:03d}" for i in range(apps)])
+        self.app_ids = np.array([f"ca-app-pub-0000000000000000~{1000000000 + i}" for i in range(apps)])
+        self.platforms = np.array(["Android" if i % 2 == 0 else "iOS" for i in range(apps)])
+        self.store_ids = np.array([
+            f"com.mock.app{i:03d}" if i % 2 == 0 else f"id{1500000000 + i}" for i in range(apps)
+        ])
+
+        units = range(apps * ad_units)
+        self.unit_formats = np.array([AD_FORMATS[unit % len(AD_FORMATS)] for unit in units])
+        self.unit_ids = np.array([f"ca-app-pub-0000000000000000/{2000000000 + unit}" for unit in units])
+        self.unit_names = np.array([
+            f"{self.app_names[unit // ad_units]} {self.unit_formats[unit]} {unit % ad_units}" for unit in units
+        ])
+
+        self.admob_day = functools.lru_cache(maxsize=CACHED_DAYS)(self._admob_day)
+        self.adjust_day = functools.lru_cache(maxsize=CACHED_DAYS)(self._adjust_day)
+
+    def admob_rows_per_day(self) -> int:
+        return self.apps * self.ad_units * len(self.country_codes)
+
+    def adjust_rows_per_day(self) -> int:
+        return self.apps * len(self.country_codes) * 24
+
+    def _rng(self, source: int, day: date) -> np.random.Generator:
+        return np.random.default_rng([self.seed, source, day.toordinal()])
+
+    def _admob_day(self, day: date) -> pd.DataFrame:
+        """One day at full grain (app × ad unit × country); rows without requests are dropped."""
+
+        rng = self._rng(1, day)
+        countries = len(self.country_codes)
+        units = self.apps * self.ad_units
+
+        unit = np.repeat(np.arange(units), countries)
+        country = np.tile(np.arange(countries), units)
+        app = unit // self.ad_units
+
+        weekend = 1.15 if day.weekday() >= 5 else 1.0
+        lam = 2000 * self.app_size[app] * self.country_weight[country] * weekend
+        requests = rng.poisson(lam)
+        matched = rng.binomial(requests, rng.uniform(0.6, 0.98, len(unit)))
+        impressions = rng.binomial(matched, 0.85)
+        clicks = rng.binomial(impressions, 0.012)
+
+        base_ecpm = np.array([FORMAT_ECPM_USD[fmt] for fmt in self.unit_formats])[unit]
+        ecpm = rng.gamma(4.0, base_ecpm * self.country_value[country] / 4.0)
+        earnings_micros = np.round(impressions * ecpm / 1000 * 1_000_000).astype(np.int64)
+
+        frame = pd.DataFrame({
+            "APP_ID": self.app_ids[app],
+            "APP_NAME": self.app_names[app],
+            "DATE": day.strftime("%Y%m%d"),
+            "COUNTRY": self.country_codes[country],
+            "PLATFORM": self.platforms[app],
+            "FORMAT": self.unit_formats[unit],
+            "AD_UNIT_ID": self.unit_ids[unit],
+            "AD_UNIT_NAME": self.unit_names[unit],
+            "AD_REQUESTS": requests,
+            "MATCHED_REQUESTS": matched,
+            "IMPRESSIONS": impressions,
+            "CLICKS": clicks,
+            "ESTIMATED_EARNINGS": earnings_micros,
+        })
+        return frame[frame["AD_REQUESTS"] > 0].reset_index(drop=True)
+
+    def _adjust_day(self, day: date) -> pd.DataFrame:
+        """One day at full grain (app × country × hour)."""
+
+        rng = self._rng(2, day)
+        countries = len(self.country_codes)
+
+        app = np.repeat(np.arange(self.apps), countries * 24)
+        country = np.tile(np.repeat(np.arange(countries), 24), self.apps)
+        hour = np.tile(np.arange(24), self.apps * countries)
+
+        # Diurnal curve (UTC), peaking in the evening of the largest markets
+        diurnal = 1 + 0.5 * np.cos(2 * np.pi * (hour - 20) / 24)
+        lam = 5 * self.app_size[app] * self.country_weight[country] * diurnal
+
+        installs = rng.poisson(lam)
+        clicks = rng.poisson(lam * 8)
+        daus = rng.poisson(lam * 40).astype(float)
+        ad_impressions = rng.poisson(lam * 240)
+        ad_impressions_d0 = rng.binomial(ad_impressions, 0.1)
+        ecpm = rng.gamma(4.0, 2.0 * self.country_value[country] / 4.0)
+        ad_revenue = np.round(ad_impressions * ecpm / 1000, 4)
+        network_cost = np.round(installs * rng.gamma(2.0, 0.6 * self.country_value[country]), 2)
+
+        hours = pd.Timestamp(day) + pd.to_timedelta(hour, unit="h")
+
+        return pd.DataFrame({
+            "app": self.app_names[app],
+            "store_id": self.store_ids[app],
+            "day": day.strftime("%Y-%m-%d"),
+            "hour": hours.strftime("%Y-%m-%dT%H:%M:%S"),
+            "country": self.country_names[country],
+            "country_code": self.country_codes[country],
+            "os_name": np.where(self.platforms[app] == "Android", "android", "ios"),
+            "installs": installs,
+            "clicks": clicks,
+            "daus": daus,
+            "ad_revenue": ad_revenue,
+            "ad_impressions": ad_impressions,
+            "ad_revenue_total_d0": np.round(ad_revenue * ad_impressions_d0 / np.maximum(ad_impressions, 1), 4),
+            "ad_impressions_total_d0": ad_impressions_d0,
+            "network_cost": network_cost,
+            "network_cost_diff": 0.0,
+        })
+
+    def admob_report(self, spec: dict) -> list[dict]:
+        """mediationReport/networkReport.generate response items for a report spec."""
+
+        dimensions = spec.get("dimensions", [])
+        metrics = spec.get("metrics", [])
+        unknown = [name for name in dimensions if name not in ADMOB_DIMENSIONS]
+        unknown += [name for name in metrics if name not in ADMOB_METRICS]
+        if unknown:
+            raise BadRequest(f"Unsupported dimensions/metrics for this report: {', '.join(unknown)}")
+        if not metrics:
+            raise BadRequest("At least one metric is required")
+
+        start, end = _admob_date_range(spec)
+        frame = pd.concat([self.admob_day(day) for day in _days(start, end)], ignore_index=True)
+
+        for dimension_filter in spec.get("dimension_filters") or spec.get("dimensionFilters") or []:
+            name = dimension_filter.get("dimension")
+            if name not in ADMOB_DIMENSIONS:
+                raise BadRequest(f"Unsupported dimension filter: {name}")
+            matches = dimension_filter.get("matches_any") or dimension_filter.get("matchesAny") or {}
+            frame = frame[frame[ADMOB_DIMENSIONS[name][0]].isin(matches.get("values", []))]
+
+        keys = [col for name in dimensions for col in ADMOB_DIMENSIONS[name] if col]
+        if {"AD_UNIT", "COUNTRY", "DATE"} <= set(dimensions):
+            pass  # full grain: nothing to group
+        elif keys:
+            frame = frame.groupby(keys, sort=True, as_index=False)[ADMOB_SUMMED].sum()
+        else:
+            frame = frame[ADMOB_SUMMED].sum().to_frame().T
+
+        items = [{"header": {
+            "dateRange": spec.get("date_range") or spec.get("dateRange"),
+            "localizationSettings": {"currencyCode": "USD"},
+        }}]
+
+        for row in frame.to_dict("records"):
+            dimension_values = {}
+            for name in dimensions:
+                value_col, label_col = ADMOB_DIMENSIONS[name]
+                dimension_values[name] = {"value": row[value_col]}
+                if label_col:
+                    dimension_values[name]["displayLabel"] = row[label_col]
+            items.append({"row": {
+                "dimensionValues": dimension_values,
+                "metricValues": {name: _admob_metric(name, row) for name in metrics},
+            }})
+
+        items.append({"footer": {"matchingRowCount": str(len(frame))}})
+        return items
+
+    def admob_apps(self, publisher_id: str) -> dict:
+        """accounts.apps.list response (all apps on one page)."""
+
+        return {"apps": [
+            {
+                "name": f"accounts/{publisher_id}/apps/{app_id.rsplit('~', 1)[1]}",
+                "appId": app_id,
+                "platform": platform.upper(),
+                "manualAppInfo": {"displayName": name},
+            }
+            for app_id, platform, name in zip(self.app_ids, self.platforms, self.app_names)
+        ]}
+
+    def adjust_report(self, params: dict) -> str:
+        """csv_report body for the query parameters."""
+
+        dimensions = [name for name in params.get("dimensions", "").split(",") if name]
+        metrics = [name for name in params.get("metrics", "").split(",") if name]
+        unknown = [name for name in dimensions if name not in ADJUST_DIMENSIONS]
+        unknown += [name for name in metrics if name not in ADJUST_METRICS]
+        if unknown:
+            raise BadRequest(f"Unknown dimensions/metrics: {', '.join(unknown)}")
+        if not metrics:
+            raise BadRequest("metrics is required")
+
+        try:
+            start, end = (datetime.strptime(part, "%Y-%m-%d").date() for part in params["date_period"].split(":"))
+        except (KeyError, ValueError):
+            raise BadRequest("date_period must be YYYY-MM-DD:YYYY-MM-DD")
+
+        frame = pd.concat([self.adjust_day(day) for day in _days(start, end)], ignore_index=True)
+        if {"app", "hour"} <= set(dimensions) and {"country", "country_code"} & set(dimensions):
+            pass  # full grain: nothing to group
+        elif dimensions:
+            frame = frame.groupby(dimensions, sort=False, as_index=False)[metrics].sum()
+        else:
+            frame = frame[metrics].sum().to_frame().T
+
+        return frame[dimensions + metrics].to_csv(index=False)
+
+
+def _days(start: date, end: date) -> list[date]:
+    if end < start:
+        raise BadRequest("date range end is before start")
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def _admob_date_range(spec: dict) -> tuple[date, date]:
+    """Report spec date range (snake_case or camelCase keys)."""
+
+    date_range = spec.get("date_range") or spec.get("dateRange") or {}
+    try:
+        start, end = (
+            date_range.get(f"{edge}_date") or date_range.get(f"{edge}Date")
+            for edge in ("start", "end")
+        )
+        return date(start["year"], start["month"], start["day"]), date(end["year"], end["month"], end["day"])
+    except (TypeError, KeyError):
+        raise BadRequest("report_spec.date_range with start_date and end_date is required")
+
+
+def _admob_metric(name: str, row: dict) -> dict:
+    """AdMob metric value in the API's encoding (int64 and micros as strings)."""
+
+    impressions, requests = row["IMPRESSIONS"], row["AD_REQUESTS"]
+    if name == "ESTIMATED_EARNINGS":
+        return {"microsValue": str(int(row[name]))}
+    if name == "OBSERVED_ECPM":
+        return {"microsValue": str(round(row["ESTIMATED_EARNINGS"] / impressions * 1000) if impressions else 0)}
+    if name == "IMPRESSION_CTR":
+        return {"doubleValue": row["CLICKS"] / impressions if impressions else 0.0}
+    if name == "MATCH_RATE":
+        return {"doubleValue": row["MATCHED_REQUESTS"] / requests if requests else 0.0}
+    return {"integerValue": str(int(row[name]))}
+
+
+def discovery_document(root_url: str) -> dict:
+    """Minimal AdMob v1 discovery document routing both report methods here."""
+
+    def generate(report: str) -> dict:
+        schema = f"Generate{report[0].upper()}{report[1:]}"
+        return {"methods": {"generate": {
+            "id": f"admob.accounts.{report}.generate",
+            "path": f"v1/{{+parent}}/{report}:generate",
+            "flatPath": f"v1/accounts/{{accountsId}}/{report}:generate",
+            "httpMethod": "POST",
+            "parameters": {"parent": {"type": "string", "location": "path", "required": True, "pattern": "^accounts/[^/]+$"}},
+            "parameterOrder": ["parent"],
+            "request": {"$ref": f"{schema}Request"},
+            "response": {"$ref": f"{schema}Response"},
+        }}}
+
+    schemas = {}
+    for report in ("MediationReport", "NetworkReport"):
+        schemas[f"Generate{report}Request"] = {
+            "id": f"Generate{report}Request", "type": "object",
+            "properties": {"reportSpec": {"type": "object"}},
+        }
+        schemas[f"Generate{report}Response"] = {
+            "id": f"Generate{report}Response", "type": "object",
+            "properties": {name: {"type": "object"} for name in ("header", "row", "footer")},
+        }
+
+    schemas["ListAppsResponse"] = {
+        "id": "ListAppsResponse", "type": "object",
+        "properties": {"apps": {"type": "array", "items": {"type": "object"}}, "nextPageToken": {"type": "string"}},
+    }
+    apps = {"methods": {"list": {
+        "id": "admob.accounts.apps.list",
+        "path": "v1/{+parent}/apps",
+        "flatPath": "v1/accounts/{accountsId}/apps",
+        "httpMethod": "GET",
+        "parameters": {
+            "parent": {"type": "string", "location": "path", "required": True, "pattern": "^accounts/[^/]+$"},
+            "pageSize": {"type": "integer", "location": "query"},
+            "pageToken": {"type": "string", "location": "query"},
+        },
+        "parameterOrder": ["parent"],
+        "response": {"$ref": "ListAppsResponse"},
+    }}}
+
+    return {
+        "kind": "discovery#restDescription",
+        "discoveryVersion": "v1",
+        "id": "admob:v1",
+        "name": "admob",
+        "version": "v1",
+        "revision": "mock",
+        "protocol": "rest",
+        "rootUrl": root_url,
+        "servicePath": "",
+        "batchPath": "batch",
+        "parameters": {},
+        "schemas": schemas,
+        "resources": {"accounts": {"resources": {
+            "mediationReport": generate("mediationReport"),
+            "networkReport": generate("networkReport"),
+            "apps": apps,
+        }}},
+    }
+
+
+class FaultInjector:
+    """Latency, 429s (random and above a request rate) and truncated bodies."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        rps_limit: float = None,
+        retry_after: int = 1,
+        truncate_rate: float = 0,
+        seed: int = 0,
+        max_report_rows: int = None
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rps_limit = rps_limit
+        self.retry_after = retry_after
+        self.truncate_rate = truncate_rate
+        self.max_report_rows = max_report_rows
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = rps_limit or 0
+        self._refilled = time.monotonic()
+        self.stats = {"requests": 0, "ok": 0, "throttled": 0, "truncated": 0, "bad_request": 0, "too_large": 0, "bytes": 0}
+
+    def count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def delay(self):
+        """Sleep the configured latency (plus uniform jitter)."""
+
+        if self.latency_ms or self.jitter_ms:
+            with self._lock:
+                jitter = self._random.uniform(0, self.jitter_ms)
+            time.sleep((self.latency_ms + jitter) / 1000)
+
+    def throttled(self) -> bool:
+        """True if this request gets a 429 (random error or over --rps-limit)."""
+
+        with self._lock:
+            if self.rps_limit:
+                now = time.monotonic()
+                self._tokens = min(self.rps_limit, self._tokens + (now - self._refilled) * self.rps_limit)
+                self._refilled = now
+                if self._tokens < 1:
+                    return True
+                self._tokens -= 1
+            return self._random.random() < self.error_rate
+
+    def truncate(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.truncate_rate
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """Routes AdMob and Adjust requests to the catalog, through the fault injector."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, as the real APIs
+    catalog: SyntheticCatalog = None
+    faults: FaultInjector = None
+    verbose = False
+
+    def do_GET(self):
+        url = urlparse(self.path)
+
+        if url.path == "/_mock/stats":
+            self._send(200, json.dumps(self.faults.stats).encode(), "application/json", faults=False)
+        elif url.path == "/$discovery/rest":
+            root_url = f"http://{self.headers.get('Host', '%s:%s' % self.server.server_address[:2])}/"
+            self._send(200, json.dumps(discovery_document(root_url)).encode(), "application/json", faults=False)
+        elif url.path.startswith("/v1/accounts/") and url.path.endswith("/apps"):
+            publisher_id = url.path.split("/")[3]
+            self._send(200, json.dumps(self.catalog.admob_apps(publisher_id)).encode(), "application/json", faults=False)
+        elif url.path == "/reports-service/csv_report":
+            if not self.headers.get("Authorization", "").startswith("Bearer "):
+                self._send(401, b'{"error": "Unauthorized"}', "application/json")
+                return
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            self._report(lambda: self.catalog.adjust_report(params).encode(), "text/csv")
+        else:
+            self._send(404, b'{"error": "Not found"}', "application/json", faults=False)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        payload = self.rfile.read(length) if length else b"{}"
+
+        if not (url.path.startswith("/v1/accounts/") and url.path.endswith(("/mediationReport:generate", "/networkReport:generate"))):
+            self._send(404, b'{"error": "Not found"}', "application/json", faults=False)
+            return
+
+        def build() -> bytes:
+            try:
+                body = json.loads(payload)
+            except ValueError:
+                raise BadRequest("Request body is not JSON")
+            spec = body.get("report_spec") or body.get("reportSpec") or {}
+            items = self.catalog.admob_report(spec)
+            if self.faults.max_report_rows and len(items) - 2 > self.faults.max_report_rows:
+                raise ReportTooLarge(f"Report has {len(items) - 2:,} rows (limit {self.faults.max_report_rows:,})")
+            return json.dumps(items).encode()
+
+        self._report(build, "application/json")
+
+    def _report(self, build, content_type: str):
+        """Apply faults, then send the built report (or a 400)."""
+
+        self.faults.count("requests")
+        self.faults.delay()
+
+        if self.faults.throttled():
+            self.faults.count("throttled")
+            body = json.dumps({"error": {"code": 429, "status": "RESOURCE_EXHAUSTED", "message": "Quota exceeded (mock)"}})
+            self._send(429, body.encode(), "application/json", headers={"Retry-After": str(self.faults.retry_after)})
+            return
+
+        try:
+            body = build()
+        except BadRequest as e:
+            self.faults.count("bad_request")
+            error = json.dumps({"error": {"code": 400, "status": "INVALID_ARGUMENT", "message": str(e)}})
+            self._send(400, error.encode(), "application/json")
+            return
+        except ReportTooLarge as e:
+            self.faults.count("too_large")
+            error = json.dumps({"error": {"code": 503, "status": "UNAVAILABLE", "message": str(e)}})
+            self._send(503, error.encode(), "application/json")
+            return
+
+        self._send(200, body, content_type, truncate=self.faults.truncate())
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None, truncate: bool = False, faults: bool = True):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if truncate:
+            # Full Content-Length announced, half the body sent, then the connection drops
+            self.faults.count("truncated")
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+        if faults and status == 200:
+            self.faults.count("ok")
+            self.faults.count("bytes", len(body))
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def main():
+    """Serve the mock APIs until interrupted."""
+
+    parser = argparse.ArgumentParser(description="Mock AdMob / Adjust API server for offline load testing")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bind host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8790, help="Port (default: 8790)")
+    parser.add_argument("--apps", type=int, default=10, help="Apps (default: 10)")
+    parser.add_argument("--countries", type=int, default=50, help="Countries, max 676 (default: 50)")
+    parser.add_argument("--ad-units", type=int, default=6, help="AdMob ad units per app (default: 6)")
+    parser.add_argument("--seed", type=int, default=0, help="Data seed (default: 0)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added latency per report request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Uniform random extra latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of report requests answered 429")
+    parser.add_argument("--rps-limit", type=float, help="Answer 429 above this many report requests/sec")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429s (default: 1)")
+    parser.add_argument("--truncate-rate", type=float, default=0, help="Fraction of report bodies cut off mid-stream")
+    parser.add_argument("--max-report-rows", type=int, help="Answer 503 for AdMob reports above this many rows")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    if not 1 <= args.countries <= 676:
+        console.print("[red]✗ --countries must be between 1 and 676[/red]")
+        return 1
+
+    from rich.panel import Panel
+
+    catalog = SyntheticCatalog(args.apps, args.countries, args.ad_units, args.seed)
+    faults = FaultInjector(
+        args.latency_ms, args.jitter_ms, args.error_rate, args.rps_limit,
+        args.retry_after, args.truncate_rate, args.seed, args.max_report_rows
+    )
+
+    MockApiHandler.catalog = catalog
+    MockApiHandler.faults = faults
+    MockApiHandler.verbose = args.verbose
+    server = ThreadingHTTPServer((args.host, args.port), MockApiHandler)
+    url = f"http://{args.host}:{args.port}"
+
+    console.print(Panel.fit(
+        "[bold cyan]Mock AdMob / Adjust APIs[/bold cyan]\n"
+        f"AdMob: {catalog.admob_rows_per_day():,} rows/day | Adjust: {catalog.adjust_rows_per_day():,} rows/day\n"
+        f"Faults: latency {args.latency_ms:g}+{args.jitter_ms:g} ms, 429 rate {args.error_rate:g}, "
+        f"rps limit {args.rps_limit or '-'}, truncate rate {args.truncate_rate:g}, "
+        f"max report rows {args.max_report_rows or '-'}\n"
+        f"export ADMOB_API_URL={url} ADJUST_API_URL={url} ADJUST_TOKEN=mock\n"
+        f"Stats: {url}/_mock/stats",
+        title="Benchmarks"
+    ))
+
+    # serve_forever returns on SIGTERM (shutdown must come from another thread)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        console.print(f"\nServed: {json.dumps(faults.stats)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
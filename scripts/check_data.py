@@ -6,26 +6,37 @@ Check what data exists in Snowflake without running collection pipelines.
 
 Usage:
     python scripts/check_data.py
+    python scripts/check_data.py --profile-startup
+    python scripts/check_data.py --profile cpu
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from scripts.utils.console import console
+from scripts.utils.profiling import add_profile_arguments, profile
 from scripts.utils.snowflake_client import get_snowflake_client
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-console = Console()
+# Modules a real run imports on first use (for --profile-startup)
+DEFERRED_MODULES = [
+    "cryptography.hazmat.primitives.serialization",
+    "snowflake.connector",
+    "rich.console",
+    "rich.table",
+]
 
 
 def check_snowflake_data():
     """Check what data exists in Snowflake."""
 
+    from rich.table import Table
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "[bold cyan]Snowflake Data Verification[/bold cyan]\n"
@@ -160,5 +171,23 @@ def check_snowflake_data():
         client.close()
 
 
+def main():
+    """Parse arguments, then check data."""
+
+    parser = argparse.ArgumentParser(description="Check what data exists in Snowflake RAW")
+    parser.add_argument("--profile-startup", action="store_true", help="Print import-time breakdown and exit")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        from scripts.utils.startup import print_startup_profile
+        print_startup_profile("scripts.check_data", DEFERRED_MODULES)
+        return 0
+
+    with profile(args.profile, "check_data", args.profile_output):
+        check_snowflake_data()
+    return 0
+
+
 if __name__ == "__main__":
-    check_snowflake_data()
+    sys.exit(main())
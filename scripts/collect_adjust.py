@@ -8,48 +8,113 @@ NO TRANSFORMATIONS - stores exact API response.
 Usage:
     python scripts/collect_adjust.py --hours 1
     python scripts/collect_adjust.py --hours 24  # Backfill last day
+    python scripts/collect_adjust.py --hours 1 --rollup  # + RAW.ADJUST_DAILY
+    python scripts/collect_adjust.py --hours 1 --sinks snowflake,postgres  # + hot store
+    python scripts/collect_adjust.py --hours 24 --profile cpu  # Collapsed stacks for a flamegraph
+    python scripts/collect_adjust.py --start 2025-01-01 --end 2025-01-07  # Explicit days
 """
 
+from __future__ import annotations
+
 import os
 import sys
+import time
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-import requests
-import pandas as pd
-from rich.console import Console
-from rich.panel import Panel
 from dotenv import load_dotenv
 
-from scripts.utils.snowflake_client import get_snowflake_client
+from scripts.utils.api_endpoints import adjust_report_url
+from scripts.utils.batch_validation import load_table_schemas, validate_batch
+from scripts.utils.console import console
+from scripts.utils.dbt_trigger import touched_dates
+from scripts.utils.fanout import fan_out
+from scripts.utils.postgres_client import get_postgres_client
+from scripts.utils.profiling import add_profile_arguments, checkpoint, profile
+from scripts.utils.rate_limit import THROTTLE_RETRIES, get_limiter, parse_retry_after
+from scripts.utils.row_hash import add_row_hash
+from scripts.utils.run_ledger import StageTimer, batch_bytes, format_partitions, record_cli_run, utc_now
+from scripts.utils.snowflake_client import SnowflakeClientPool, get_snowflake_client
+from scripts.utils.spool import Spool
+from scripts.utils.tracing import add_trace_arguments, configure_from_args, current_span, span, traced
+
+# pandas and requests are imported where first used
+if TYPE_CHECKING:
+    import pandas as pd
+    import requests
 
 # Load environment
 load_dotenv(dotenv_path=".secret/.env")
 
-console = Console()
+# Modules a real run imports on first use (for --profile-startup)
+DEFERRED_MODULES = [
+    "requests",
+    "pandas",
+    "cryptography.hazmat.primitives.serialization",
+    "snowflake.connector",
+    "snowflake.connector.pandas_tools",
+    "pyarrow",
+    "psycopg",
+    "rich.console",
+]
+
+SINKS = ["snowflake", "postgres"]
+
+# RAW.ADJUST_DAILY rollup grain and summed metrics
+ADJUST_DAILY_KEYS = ["DAY", "APP", "STORE_ID", "COUNTRY", "OS_NAME"]
+ADJUST_COUNT_COLUMNS = [
+    "INSTALLS", "CLICKS", "AD_IMPRESSIONS", "AD_IMPRESSIONS_TOTAL_D0",
+]
+ADJUST_AMOUNT_COLUMNS = [
+    "DAUS", "AD_REVENUE", "AD_REVENUE_TOTAL_D0", "NETWORK_COST", "NETWORK_COST_DIFF",
+]
+
+
+def parse_adjust_csv(text: str) -> pd.DataFrame:
+    """Parse a csv_report body into a DataFrame (exact API columns)."""
+
+    import io
+
+    import pandas as pd
+
+    return pd.read_csv(io.StringIO(text))
 
 
-def fetch_adjust_raw(api_token: str, start_date: str, end_date: str) -> pd.DataFrame:
+@traced("adjust.fetch")
+def fetch_adjust_raw(
+    api_token: str,
+    start_date: str,
+    end_date: str,
+    session: requests.Session = None
+) -> pd.DataFrame:
     """
     Fetch raw data from Adjust API (CSV format).
 
+    HTTP errors (including 429s past THROTTLE_RETRIES) and transport
+    failures are raised, so a failed fetch is never taken for an empty
+    report.
+
     Args:
         api_token: Adjust API token
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
+        session: Keep-alive HTTP session to reuse (one-off request if None)
 
     Returns:
-        DataFrame with exact API columns
+        DataFrame with exact API columns (empty only if the report is)
     """
 
+    import requests
+
     console.print(f"[cyan]Fetching Adjust API: {start_date} to {end_date}[/cyan]")
 
-    url = "https://automate.adjust.com/reports-service/csv_report"
+    url = adjust_report_url()
 
     params = {
         "dimensions": "app,store_id,day,hour,country,os_name",
@@ -59,49 +124,191 @@ def fetch_adjust_raw(api_token: str, start_date: str, end_date: str) -> pd.DataF
     }
 
     headers = {"Authorization": f"Bearer {api_token}"}
+    fetch_span = current_span()
+    fetch_span.set(partition=params["date_period"])
 
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=60)
+        http = session or requests
+        limiter = get_limiter("adjust")
+
+        # 429s pause every Adjust caller on the host, then the request is retried
+        for attempt in range(THROTTLE_RETRIES + 1):
+            fetch_span.add("rate_wait_ms", int(limiter.acquire() * 1000))
+            response = http.get(url, params=params, headers=headers, timeout=60)
+            if response.status_code != 429:
+                break
+            pause = limiter.throttled(parse_retry_after(response.headers.get("Retry-After")))
+            fetch_span.add("throttled")
+            if attempt == THROTTLE_RETRIES:
+                break
+            console.print(f"[yellow]⚠ Adjust rate limited (429), retrying in {pause:.1f}s[/yellow]")
+
+        fetch_span.set(status_code=response.status_code, bytes=len(response.content))
         response.raise_for_status()
+        limiter.succeeded()
 
-        # Parse CSV to DataFrame
-        import io
-        df = pd.read_csv(io.StringIO(response.text))
+        with span("adjust.parse") as parse_span:
+            df = parse_adjust_csv(response.text)
+            parse_span.set(rows=len(df))
+        checkpoint("parse: CSV → DataFrame")
 
+        fetch_span.set(rows=len(df))
         console.print(f"[green]✓ Fetched {len(df):,} rows[/green]")
 
         return df
 
     except Exception as e:
+        fetch_span.record_error(e)
         console.print(f"[red]✗ API error: {e}[/red]")
-        return pd.DataFrame()
+        raise
+
+
+def adjust_date_range(hours: int) -> tuple[str, str]:
+    """
+    Date range (YYYY-MM-DD) covering the last N hours.
+
+    Adjust reports by whole days, so sub-day windows fetch yesterday+today.
+    """
+
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=(hours // 24) if hours >= 24 else 1)
+
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
+
+def stamp_adjust_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add LOADED_AT and ROW_HASH and uppercase column names (Snowflake
+    convention), in place.
+
+    Safe to call more than once on the same frame.
+    """
+
+    # Convert column names to UPPERCASE (Snowflake convention)
+    df.columns = df.columns.str.upper()
+
+    # Add loaded_at timestamp
+    if "LOADED_AT" not in df.columns:
+        df["LOADED_AT"] = datetime.now()
+
+    # Fingerprint of the metrics: restated rows are re-merged, unchanged skipped
+    add_row_hash(df, ADJUST_COUNT_COLUMNS + ADJUST_AMOUNT_COLUMNS)
+
+    return df
+
 
+def aggregate_adjust_daily(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Roll hourly rows up to (day, app, store_id, country, os_name).
+
+    Vectorized: metrics are parsed column-wise and summed in one groupby.
+    Adjust reports whole days (see adjust_date_range), so each batch holds
+    every hour of the days it covers and its sums are those days' totals.
+
+    Amount sums are rounded to their DDL scale first: float sums depend
+    on row order in the last bits, which would change the hash of
+    unchanged days.
+
+    Args:
+        df: Hourly DataFrame (API or uppercased column names)
+
+    Returns:
+        DataFrame with ADJUST_DAILY columns and ROW_HASH of the totals
+        (LOADED_AT set by the MERGE)
+    """
+
+    import pandas as pd
+
+    frame = df.rename(columns=str.upper)
+    metric_columns = ADJUST_COUNT_COLUMNS + ADJUST_AMOUNT_COLUMNS
+    metrics = frame[metric_columns].apply(pd.to_numeric, errors="coerce")
+
+    grouped = metrics.groupby([frame[key] for key in ADJUST_DAILY_KEYS], sort=False)
+    daily = grouped.sum(min_count=1)
+    daily["HOURS_REPORTED"] = grouped.size()
+
+    daily[ADJUST_COUNT_COLUMNS] = daily[ADJUST_COUNT_COLUMNS].round().astype("Int64")
+    columns = load_table_schemas()["ADJUST_DAILY"]["columns"]
+    for col in ADJUST_AMOUNT_COLUMNS:
+        daily[col] = daily[col].round(columns[col]["scale"] or 0)
+    add_row_hash(daily, metric_columns + ["HOURS_REPORTED"])
+    return daily.reset_index()
+
+
+def load_daily_rollup(df: pd.DataFrame, client=None) -> int:
+    """
+    Merge the batch's daily totals into RAW.ADJUST_DAILY.
+
+    Only the (day, app, store_id, country, os_name) keys present in the
+    batch are touched, and of those only days whose totals changed.
 
-def load_to_snowflake(df: pd.DataFrame):
+    Args:
+        df: Hourly DataFrame as fetched (or stamped)
+        client: Shared SnowflakeClient (left open); a new one is created
+            and closed if not given
+
+    Returns:
+        Rollup rows inserted or updated
+    """
+
+    if df.empty:
+        return 0
+
+    # Same rows the hourly load kept (duplicates would inflate the sums)
+    df, _ = validate_batch(df, "ADJUST_HOURLY", quarantine=False)
+    daily = aggregate_adjust_daily(df)
+    console.print(f"[cyan]Rolled up {len(df):,} hourly rows to {len(daily):,} daily rows[/cyan]")
+
+    owns_client = client is None
+    if owns_client:
+        client = get_snowflake_client()
+
+    try:
+        return client.merge_dataframe(daily, "ADJUST_DAILY", keys=ADJUST_DAILY_KEYS)
+
+    finally:
+        if owns_client:
+            client.close()
+
+
+def load_to_snowflake(df: pd.DataFrame, client=None, spool: bool = True, validate: bool = True):
     """
     Load raw DataFrame to Snowflake (exact copy, no transformations).
 
     Args:
         df: DataFrame with API columns
+        client: Shared SnowflakeClient (left open); a new one is created
+            and closed if not given
+        spool: Write the batch to the local spool and load from that file;
+            if the load fails it stays pending for replay_spool.py
+        validate: Drop duplicate keys and quarantine rows violating the
+            table DDL before loading
     """
 
     if df.empty:
         console.print("[yellow]⚠ No data to load[/yellow]")
         return
 
-    # Add loaded_at timestamp
-    df["loaded_at"] = datetime.now()
+    stamp_adjust_frame(df)
+    if validate:
+        df, _ = validate_batch(df, "ADJUST_HOURLY")
 
-    # Convert column names to UPPERCASE (Snowflake convention)
-    df.columns = df.columns.str.upper()
-
-    client = get_snowflake_client()
+    owns_client = client is None
+    if owns_client:
+        client = get_snowflake_client()
 
     try:
         conn = client.connect()
 
         console.print(f"[cyan]Loading {len(df):,} rows to RAW.ADJUST_HOURLY...[/cyan]")
 
+        if spool:
+            batch_spool = Spool()
+            manifest = batch_spool.write(df, "ADJUST_HOURLY", source="adjust")
+            client.load_parquet(batch_spool.path_for(manifest), "ADJUST_HOURLY")
+            batch_spool.commit(manifest)
+            return
+
         # Write directly to Snowflake using pandas
         from snowflake.connector.pandas_tools import write_pandas
 
@@ -125,7 +332,129 @@ def load_to_snowflake(df: pd.DataFrame):
         raise
 
     finally:
-        client.close()
+        if owns_client:
+            client.close()
+
+
+def load_to_postgres(df: pd.DataFrame, client=None) -> int:
+    """
+    Upsert raw DataFrame into the PostgreSQL hot store (hot.adjust_hourly).
+
+    Args:
+        df: DataFrame with API columns
+        client: Shared PostgresClient (left open); a new one is created
+            and closed if not given
+
+    Returns:
+        Rows inserted or updated
+    """
+
+    import pandas as pd
+
+    if df.empty:
+        console.print("[yellow]⚠ No data to load[/yellow]")
+        return 0
+
+    stamp_adjust_frame(df)
+
+    owns_client = client is None
+    if owns_client:
+        client = get_postgres_client()
+
+    try:
+        # Partitions are daily; create any the batch needs (e.g. backfills
+        # ahead of the maintenance window) so COPY never hits a missing day
+        days = pd.to_datetime(df["DAY"]).dt.date.unique()
+        client.create_partitions("adjust_hourly", days)
+        return client.load_dataframe(df, "adjust_hourly")
+
+    except Exception as e:
+        console.print(f"[red]✗ PostgreSQL error: {e}[/red]")
+        raise
+
+    finally:
+        if owns_client:
+            client.close()
+
+
+def load_to_sinks(
+    df: pd.DataFrame,
+    sinks: list[str],
+    snowflake_pool: SnowflakeClientPool = None,
+    postgres_client=None,
+    spool: bool = True,
+    validate: bool = True
+) -> dict[str, dict]:
+    """
+    Load one fetched batch into several sinks concurrently.
+
+    The batch is stamped and validated once, frozen as a pyarrow Table and (with spool)
+    written to the spool once with one commit slot per sink. Each sink
+    retries on its own; a sink that still fails leaves only itself pending
+    for replay_spool.py, and reloads are idempotent (COPY load metadata in
+    Snowflake, primary-key upsert in PostgreSQL).
+
+    Args:
+        df: DataFrame with API columns
+        sinks: Sink names from SINKS
+        snowflake_pool: Shared pool (left open); a one-connection pool is
+            created and closed if not given
+        postgres_client: Shared PostgresClient (left open); a new one is
+            created and closed if not given
+        spool: Spool the batch and load Snowflake from the spooled file
+        validate: Drop duplicate keys and quarantine rows violating the
+            RAW DDL before fanning out
+
+    Returns:
+        Per-sink results from fan_out()
+    """
+
+    import pyarrow as pa
+
+    unknown = set(sinks) - set(SINKS)
+    if unknown:
+        raise ValueError(f"Unknown sink(s): {', '.join(sorted(unknown))}")
+
+    stamp_adjust_frame(df)
+    if validate:
+        df, _ = validate_batch(df, "ADJUST_HOURLY")
+    batch = pa.Table.from_pandas(df, preserve_index=False)
+
+    owns_pool = snowflake_pool is None and "snowflake" in sinks
+    if owns_pool:
+        snowflake_pool = SnowflakeClientPool(size=1)
+    owns_postgres = postgres_client is None and "postgres" in sinks
+    if owns_postgres:
+        postgres_client = get_postgres_client()
+
+    batch_spool = manifest = None
+    if spool:
+        batch_spool = Spool()
+        manifest = batch_spool.write(df, "ADJUST_HOURLY", source="adjust", sinks=sinks)
+
+    def load_snowflake(batch: pa.Table) -> int:
+        with snowflake_pool.acquire() as client:
+            if manifest:
+                return client.load_parquet(batch_spool.path_for(manifest), "ADJUST_HOURLY")
+            return client.load_dataframe(batch.to_pandas(), "ADJUST_HOURLY")
+
+    def load_postgres(batch: pa.Table) -> int:
+        return load_to_postgres(batch.to_pandas(), client=postgres_client)
+
+    loaders = {"snowflake": load_snowflake, "postgres": load_postgres}
+
+    try:
+        return fan_out(
+            batch,
+            {name: loaders[name] for name in sinks},
+            on_commit=(lambda name: batch_spool.commit(manifest, sink=name)) if manifest else None
+        )
+
+    finally:
+        if owns_pool:
+            snowflake_pool.close()
+        if owns_postgres:
+            postgres_client.close()
 
 
 def main():
@@ -133,11 +462,44 @@ def main():
 
     parser = argparse.ArgumentParser(description="Adjust Hourly RAW Data Collection")
     parser.add_argument("--hours", type=int, default=1, help="Number of hours to fetch (default: 1)")
+    parser.add_argument("--start", type=str, help="First day to fetch (YYYY-MM-DD; overrides --hours)")
+    parser.add_argument("--end", type=str, help="Last day to fetch (YYYY-MM-DD; default: --start)")
+    parser.add_argument("--sinks", type=str, default="snowflake", help=f"Comma-separated destinations: {', '.join(SINKS)} (default: snowflake)")
+    parser.add_argument("--no-spool", action="store_true", help="Load directly without the local spool")
+    parser.add_argument("--rollup", action="store_true", help="Also merge daily totals into RAW.ADJUST_DAILY")
+    parser.add_argument("--no-ledger", action="store_true", help="Don't record the run in OPS.PIPELINE_RUNS")
+    parser.add_argument("--profile-startup", action="store_true", help="Print import-time breakdown and exit")
+    add_profile_arguments(parser)
+    add_trace_arguments(parser)
     args = parser.parse_args()
 
+    if args.profile_startup:
+        from scripts.utils.startup import print_startup_profile
+        print_startup_profile("scripts.collect_adjust", DEFERRED_MODULES)
+        return 0
+
+    # Calculate date range (whole days; see adjust_date_range)
+    if args.start:
+        start_str, end_str = args.start, args.end or args.start
+        try:
+            if datetime.strptime(end_str, "%Y-%m-%d") < datetime.strptime(start_str, "%Y-%m-%d"):
+                console.print("[red]✗ --end is before --start[/red]")
+                return 1
+        except ValueError:
+            console.print("[red]✗ --start/--end must be YYYY-MM-DD[/red]")
+            return 1
+    else:
+        start_str, end_str = adjust_date_range(args.hours)
+
+    configure_from_args(args)
+
+    from rich.panel import Panel
+
+    window = f"Fetching {start_str} to {end_str}" if args.start else f"Fetching last {args.hours} hour(s)"
+
     console.print(Panel.fit(
         "[bold cyan]Adjust RAW Pipeline[/bold cyan]\n"
-        f"Fetching last {args.hours} hour(s)\n"
+        f"{window}\n"
         "Mode: Pure RAW (no transformations)",
         title="Data Collection"
     ))
@@ -149,40 +511,70 @@ def main():
         console.print("[red]✗ Missing ADJUST_TOKEN in .env[/red]")
         return 1
 
-    # Calculate date range
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=(args.hours // 24) if args.hours >= 24 else 1)
-
-    start_str = start_date.strftime("%Y-%m-%d")
-    end_str = end_date.strftime("%Y-%m-%d")
+    # Run ledger record (written in finally, whatever the outcome)
+    timer = StageTimer()
+    started_at, start = utc_now(), time.perf_counter()
+    rows, error = 0, None
+
+    with profile(args.profile, "collect_adjust", args.profile_output), \
+            span("adjust.run", hours=args.hours, sinks=args.sinks) as run_span:
+        try:
+            # Fetch raw data
+            console.print("\n[bold]Step 1: Fetch from Adjust API[/bold]")
+            with timer.stage("fetch"):
+                raw_df = fetch_adjust_raw(api_token, start_str, end_str)
+
+            if raw_df.empty:
+                console.print("[yellow]⚠ No data fetched[/yellow]")
+                return 0
+
+            timer.record(
+                bytes=batch_bytes(raw_df),
+                partitions=format_partitions(touched_dates(raw_df, "ADJUST_HOURLY"))
+            )
+
+            # Load (no transformations)
+            sinks = [sink.strip() for sink in args.sinks.split(",") if sink.strip()]
+            if sinks == ["snowflake"]:
+                console.print("\n[bold]Step 2: Load to Snowflake RAW[/bold]")
+                with timer.stage("load"):
+                    load_to_snowflake(raw_df, spool=not args.no_spool)
+            else:
+                console.print(f"\n[bold]Step 2: Load to {', '.join(sinks)}[/bold]")
+                with timer.stage("load"):
+                    results = load_to_sinks(raw_df, sinks, spool=not args.no_spool)
+                timer.record(retries=sum(result["attempts"] - 1 for result in results.values()))
+                failed = [name for name, result in results.items() if result["status"] != "ok"]
+                if failed:
+                    raise RuntimeError(f"Sink(s) failed: {', '.join(failed)}")
+
+            rows = len(raw_df)
+
+            if args.rollup:
+                console.print("\n[bold]Step 3: Merge daily rollup[/bold]")
+                with timer.stage("rollup"):
+                    load_daily_rollup(raw_df)
+
+            # Success
+            console.print(Panel.fit(
+                f"[bold green]✓ Pipeline Complete[/bold green]\n"
+                f"Date Range: {start_str} to {end_str}\n"
+                f"Rows Loaded: {len(raw_df):,}\n"
+                f"Loaded At: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                title="Success"
+            ))
 
-    try:
-        # Fetch raw data
-        console.print("\n[bold]Step 1: Fetch from Adjust API[/bold]")
-        raw_df = fetch_adjust_raw(api_token, start_str, end_str)
-
-        if raw_df.empty:
-            console.print("[yellow]⚠ No data fetched[/yellow]")
             return 0
 
-        # Load to Snowflake (no transformations)
-        console.print("\n[bold]Step 2: Load to Snowflake RAW[/bold]")
-        load_to_snowflake(raw_df)
+        except Exception as e:
+            error = str(e)
+            run_span.record_error(e)
+            console.print(f"\n[bold red]✗ Pipeline failed: {e}[/bold red]")
+            return 1
 
-        # Success
-        console.print(Panel.fit(
-            f"[bold green]✓ Pipeline Complete[/bold green]\n"
-            f"Date Range: {start_str} to {end_str}\n"
-            f"Rows Loaded: {len(raw_df):,}\n"
-            f"Loaded At: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            title="Success"
-        ))
-
-        return 0
-
-    except Exception as e:
-        console.print(f"\n[bold red]✗ Pipeline failed: {e}[/bold red]")
-        return 1
+        finally:
+            if not args.no_ledger:
+                record_cli_run("collect_adjust", "adjust", timer, started_at, time.perf_counter() - start, rows, error)
 
 
 if __name__ == "__main__":
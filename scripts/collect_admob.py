@@ -7,39 +7,163 @@ NO TRANSFORMATIONS - stores exact API response (flattened).
 
 Usage:
     python scripts/collect_admob.py --days 7
+    python scripts/collect_admob.py --days 7 --typed  # Load RAW.ADMOB_DAILY_TYPED
+    python scripts/collect_admob.py --days 7 --profile mem  # Memory per stage
+    python scripts/collect_admob.py --start 2025-01-01 --end 2025-01-07  # Explicit days
 """
 
+from __future__ import annotations
+
 import os
 import sys
+import json
+import time
 import pickle
 import argparse
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-import pandas as pd
-from rich.console import Console
-from rich.panel import Panel
 from dotenv import load_dotenv
 
+from scripts.utils.api_endpoints import admob_discovery_url, admob_is_live
+from scripts.utils.console import console
 from scripts.utils.snowflake_client import get_snowflake_client
+from scripts.utils.batch_validation import validate_batch
+from scripts.utils.row_hash import add_row_hash
+from scripts.utils.dbt_trigger import touched_dates
+from scripts.utils.profiling import add_profile_arguments, checkpoint, profile
+from scripts.utils.rate_limit import THROTTLE_RETRIES, get_limiter, parse_retry_after
+from scripts.utils.report_shards import (
+    TARGET_ROWS, estimate_rows, known_apps, load_sizes, plan_shards, record_sizes,
+    report_filters, shard_days, shard_label, split_shard,
+)
+from scripts.utils.run_ledger import StageTimer, batch_bytes, format_partitions, record_cli_run, utc_now
+from scripts.utils.spool import Spool
+from scripts.utils.tracing import add_trace_arguments, configure_from_args, current_span, span, traced
+
+# pandas and the Google client libraries are imported where first used
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Load environment
 load_dotenv(dotenv_path=".secret/.env")
 
-console = Console()
+# Modules a real run imports on first use (for --profile-startup)
+DEFERRED_MODULES = [
+    "pandas",
+    "requests",
+    "google.auth.transport.requests",
+    "googleapiclient.discovery",
+    "cryptography.hazmat.primitives.serialization",
+    "snowflake.connector",
+    "snowflake.connector.pandas_tools",
+    "pyarrow",
+    "rich.console",
+]
+
+# API columns as loaded (uppercased), in DDL order
+ADMOB_API_COLUMNS = [
+    "DATE", "APP_ID", "COUNTRY_CODE", "PLATFORM", "AD_FORMAT", "AD_UNIT_ID",
+    "AD_IMPRESSIONS", "AD_CLICKS", "AD_REQUESTS", "MATCHED_REQUESTS",
+    "ESTIMATED_EARNINGS", "OBSERVED_ECPM",
+]
+ADMOB_COUNT_COLUMNS = ["AD_IMPRESSIONS", "AD_CLICKS", "AD_REQUESTS", "MATCHED_REQUESTS"]
+ADMOB_MICROS_COLUMNS = ["ESTIMATED_EARNINGS", "OBSERVED_ECPM"]
+
+# Discovery document cache (avoids fetching/parsing it on every run)
+DISCOVERY_CACHE = Path(".cache") / "admob_v1_discovery.json"
+DISCOVERY_MAX_AGE = 7 * 24 * 3600  # seconds before revalidating the revision
+
+# Authenticated services per publisher: (service, credentials, persisted token)
+_services = {}
+_service_lock = threading.Lock()
+
+# Report shards (oversized requests split by date, platform or app)
+SHARD_WORKERS = 4  # shards fetched in parallel
+SHARD_RETRIES = 2  # retries of a failing shard before splitting it
+SHARD_TIMEOUT = 300  # seconds per shard request
+_shard_local = threading.local()
+
+
+def load_discovery_document(refresh: bool = False) -> dict:
+    """
+    AdMob v1 discovery document from the local cache.
+
+    The cache is revalidated after DISCOVERY_MAX_AGE: the live document is
+    fetched and replaces the cache only if its revision changed. If the
+    fetch fails, a stale cache is still used. A stand-in server
+    (ADMOB_API_URL) serves its own document, which is never cached.
+
+    Args:
+        refresh: Revalidate now regardless of cache age
+
+    Returns:
+        Parsed discovery document
+    """
+
+    import requests
+
+    if not admob_is_live():
+        response = requests.get(admob_discovery_url(), timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    cached = None
+    if DISCOVERY_CACHE.exists():
+        cached = json.loads(DISCOVERY_CACHE.read_text())
+        age = time.time() - DISCOVERY_CACHE.stat().st_mtime
+        if cached.get("version") == "v1" and age < DISCOVERY_MAX_AGE and not refresh:
+            return cached
 
+    try:
+        response = requests.get(admob_discovery_url(), timeout=30)
+        response.raise_for_status()
+        document = response.json()
+    except Exception as e:
+        if cached is None:
+            raise
+        console.print(f"[yellow]⚠ Discovery refresh failed, using cache: {e}[/yellow]")
+        return cached
+
+    DISCOVERY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    if cached is not None and cached.get("revision") == document.get("revision"):
+        # Unchanged: just mark the cache as fresh
+        DISCOVERY_CACHE.touch()
+        return cached
+
+    tmp_path = DISCOVERY_CACHE.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(document))
+    tmp_path.replace(DISCOVERY_CACHE)
+    return document
+
+
+def save_credentials(credentials, token_file: Path):
+    """Write credentials back to their pickle atomically."""
 
+    tmp_path = token_file.with_suffix(".tmp")
+    with open(tmp_path, "wb") as token:
+        pickle.dump(credentials, token)
+    tmp_path.replace(token_file)
+
+
+@traced("admob.authenticate")
 def authenticate_admob(publisher_id: str):
     """
     Authenticate with AdMob using saved credentials.
 
+    The service is built from the cached discovery document and reused for
+    later calls in the same process. Refreshed credentials are written back
+    to the token pickle so later runs don't refresh again. Against a
+    stand-in server (ADMOB_API_URL) no token is needed.
+
     Args:
         publisher_id: AdMob publisher ID (pub-xxxxx)
 
@@ -47,28 +171,128 @@ def authenticate_admob(publisher_id: str):
         AdMob API service object
     """
 
+    from google.auth.transport.requests import Request
+    from googleapiclient.discovery import build_from_document
+
     secret_dir = Path(".secret")
     token_file = secret_dir / f"token_{publisher_id}.pickle"
+    current_span().set(publisher=publisher_id)
 
-    if not token_file.exists():
-        raise FileNotFoundError(f"Token file not found: {token_file}")
+    with _service_lock:
+        cached = _services.get(publisher_id)
+        current_span().set(cached=cached is not None)
+        if cached is not None:
+            service, credentials, saved_token = cached
+            # The transport refreshes expired tokens in memory; persist them
+            if credentials.token != saved_token:
+                save_credentials(credentials, token_file)
+                _services[publisher_id] = (service, credentials, credentials.token)
+            return service
 
-    try:
-        with open(token_file, "rb") as token:
-            credentials = pickle.load(token)
+        if not admob_is_live():
+            from google.auth.credentials import AnonymousCredentials
 
-        # Refresh if expired
-        if credentials and credentials.expired and credentials.refresh_token:
-            credentials.refresh(Request())
+            credentials = AnonymousCredentials()
+            service = build_from_document(load_discovery_document(), credentials=credentials)
+            _services[publisher_id] = (service, credentials, credentials.token)
+            console.print(f"[green]✓ Using stand-in AdMob API: {publisher_id}[/green]")
+            return service
 
-        service = build("admob", "v1", credentials=credentials)
-        console.print(f"[green]✓ Authenticated: {publisher_id}[/green]")
-        return service
+        if not token_file.exists():
+            raise FileNotFoundError(f"Token file not found: {token_file}")
 
-    except Exception as e:
-        raise RuntimeError(f"AdMob authentication failed: {str(e)}")
+        try:
+            with open(token_file, "rb") as token:
+                credentials = pickle.load(token)
+
+            # Refresh if expired, and keep the refreshed token
+            if credentials and credentials.expired and credentials.refresh_token:
+                current_span().set(refreshed=True)
+                credentials.refresh(Request())
+                save_credentials(credentials, token_file)
+
+            service = build_from_document(load_discovery_document(), credentials=credentials)
+            _services[publisher_id] = (service, credentials, credentials.token)
+
+            console.print(f"[green]✓ Authenticated: {publisher_id}[/green]")
+            return service
+
+        except Exception as e:
+            raise RuntimeError(f"AdMob authentication failed: {str(e)}")
+
+
+def parse_admob_response(response: list) -> pd.DataFrame:
+    """
+    Flatten a mediationReport.generate response into one row per report row.
+
+    Values are kept exactly as returned (strings, no conversions); the
+    header and footer items are skipped.
+
+    Args:
+        response: JSON array returned by the API (header, rows, footer)
+
+    Returns:
+        DataFrame with lowercase API field names (empty if no rows)
+    """
+
+    import pandas as pd
+
+    rows = []
+
+    if isinstance(response, list):
+        # Skip first item (header)
+        for item in response[1:]:
+            if "row" in item:
+                row = item["row"]
+                dim = row.get("dimensionValues", {})
+                met = row.get("metricValues", {})
+
+                # Extract raw values (keep as strings, no conversions)
+                rows.append({
+                    "date": dim.get("DATE", {}).get("value"),
+                    "app_id": dim.get("APP", {}).get("displayLabel"),
+                    "country_code": dim.get("COUNTRY", {}).get("value"),
+                    "platform": dim.get("PLATFORM", {}).get("value"),
+                    "ad_format": dim.get("FORMAT", {}).get("value"),
+                    "ad_unit_id": dim.get("AD_UNIT", {}).get("displayLabel"),
+                    "ad_impressions": met.get("IMPRESSIONS", {}).get("integerValue"),
+                    "ad_clicks": met.get("CLICKS", {}).get("integerValue"),
+                    "ad_requests": met.get("AD_REQUESTS", {}).get("integerValue"),
+                    "matched_requests": met.get("MATCHED_REQUESTS", {}).get("integerValue"),
+                    "estimated_earnings": met.get("ESTIMATED_EARNINGS", {}).get("microsValue"),
+                    "observed_ecpm": met.get("OBSERVED_ECPM", {}).get("microsValue"),
+                })
+
+    checkpoint("parse: list of dicts")
+    df = pd.DataFrame(rows)
+    checkpoint("parse: DataFrame")
+
+    return df
+
+
+def stamp_admob_frame(df: pd.DataFrame, batch_id: str) -> pd.DataFrame:
+    """
+    Add LOADED_AT, BATCH_ID and ROW_HASH and uppercase column names
+    (Snowflake convention), in place. Empty frames are returned as is.
+    """
+
+    if df.empty:
+        return df
+
+    # Add metadata
+    df["loaded_at"] = datetime.now()
+    df["batch_id"] = batch_id
+
+    # Convert column names to UPPERCASE (Snowflake convention)
+    df.columns = df.columns.str.upper()
 
+    # Fingerprint of the metric strings (shared by the typed table)
+    add_row_hash(df, ADMOB_COUNT_COLUMNS + ADMOB_MICROS_COLUMNS)
 
+    return df
+
+
+@traced("admob.fetch")
 def fetch_admob_raw(
     service,
     publisher_id: str,
@@ -78,6 +302,12 @@ def fetch_admob_raw(
     """
     Fetch raw AdMob data (exact API response, flattened).
 
+    Requests whose response would be oversized (estimated from earlier
+    runs) are split into shards fetched in parallel; a shard that keeps
+    failing is split again (see scripts/utils/report_shards.py). API
+    errors (including 429s past THROTTLE_RETRIES) and transport failures
+    are raised, so a failed fetch is never taken for an empty report.
+
     Args:
         service: AdMob API service
         publisher_id: Publisher ID
@@ -85,113 +315,367 @@ def fetch_admob_raw(
         end_date: End date (YYYY-MM-DD)
 
     Returns:
-        DataFrame with exact API fields (no transformations)
+        DataFrame with exact API fields, no transformations (empty only
+        if the report is)
     """
 
     console.print(f"[cyan]Fetching AdMob API: {start_date} to {end_date}[/cyan]")
-
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-    request_body = {
-        "report_spec": {
-            "date_range": {
-                "start_date": {
-                    "year": start_dt.year,
-                    "month": start_dt.month,
-                    "day": start_dt.day
-                },
-                "end_date": {
-                    "year": end_dt.year,
-                    "month": end_dt.month,
-                    "day": end_dt.day
-                }
-            },
-            "dimensions": ["APP", "DATE", "COUNTRY", "PLATFORM", "FORMAT", "AD_UNIT"],
-            "metrics": [
-                "ESTIMATED_EARNINGS",
-                "IMPRESSIONS",
-                "CLICKS",
-                "AD_REQUESTS",
-                "MATCHED_REQUESTS",
-                "OBSERVED_ECPM"
-            ],
-            "localization_settings": {"currency_code": "USD"}
-        }
-    }
+    current_span().set(publisher=publisher_id, partition=f"{start_date}:{end_date}")
 
     try:
-        response = (
-            service.accounts()
-            .mediationReport()
-            .generate(parent=f"accounts/{publisher_id}", body=request_body)
-            .execute()
-        )
+        root = {"start": start_date, "end": end_date, "filters": {}}
+        sizes = load_sizes(publisher_id)
+        apps = None
+        if (estimate_rows(root, sizes) or 0) > TARGET_ROWS:
+            apps = known_apps(list_admob_apps(service, publisher_id), sizes)
 
-        # Parse response - extract raw values (no transformations)
-        rows = []
-
-        if isinstance(response, list):
-            # Skip first item (header)
-            for item in response[1:]:
-                if "row" in item:
-                    row = item["row"]
-                    dim = row.get("dimensionValues", {})
-                    met = row.get("metricValues", {})
-
-                    # Extract raw values (keep as strings, no conversions)
-                    rows.append({
-                        "date": dim.get("DATE", {}).get("value"),
-                        "app_id": dim.get("APP", {}).get("displayLabel"),
-                        "country_code": dim.get("COUNTRY", {}).get("value"),
-                        "platform": dim.get("PLATFORM", {}).get("value"),
-                        "ad_format": dim.get("FORMAT", {}).get("value"),
-                        "ad_unit_id": dim.get("AD_UNIT", {}).get("displayLabel"),
-                        "ad_impressions": met.get("IMPRESSIONS", {}).get("integerValue"),
-                        "ad_clicks": met.get("CLICKS", {}).get("integerValue"),
-                        "ad_requests": met.get("AD_REQUESTS", {}).get("integerValue"),
-                        "matched_requests": met.get("MATCHED_REQUESTS", {}).get("integerValue"),
-                        "estimated_earnings": met.get("ESTIMATED_EARNINGS", {}).get("microsValue"),
-                        "observed_ecpm": met.get("OBSERVED_ECPM", {}).get("microsValue"),
-                    })
-
-        df = pd.DataFrame(rows)
+        shards = plan_shards(root, sizes, apps, TARGET_ROWS)
+        current_span().set(shards=len(shards))
+        if len(shards) > 1:
+            console.print(f"  Split into {len(shards)} shards (~{estimate_rows(root, sizes):,.0f} rows estimated)")
 
-        if not df.empty:
-            # Add metadata
-            df["loaded_at"] = datetime.now()
-            df["batch_id"] = f"{start_date}_{end_date}"
+        responses = fetch_shards(service, publisher_id, shards, apps)
+        record_sizes(publisher_id, responses, shard_days(root))
+
+        # One response: first header, every shard's rows, a footer
+        response = [responses[0][0]] + [item for shard_response in responses for item in shard_response[1:] if "row" in item]
+        response.append({"footer": {"matchingRowCount": str(len(response) - 1)}})
 
-            # Convert column names to UPPERCASE (Snowflake convention)
-            df.columns = df.columns.str.upper()
+        with span("admob.parse") as parse_span:
+            df = stamp_admob_frame(parse_admob_response(response), f"{start_date}_{end_date}")
+            parse_span.set(rows=len(df))
 
+        current_span().set(rows=len(df))
         console.print(f"[green]✓ Fetched {len(df):,} rows[/green]")
 
         return df
 
     except Exception as e:
+        current_span().record_error(e)
         console.print(f"[red]✗ API error: {e}[/red]")
+        raise
+
+
+def admob_report_body(shard: dict) -> dict:
+    """mediationReport.generate request body for a shard."""
+
+    start_dt = datetime.strptime(shard["start"], "%Y-%m-%d")
+    end_dt = datetime.strptime(shard["end"], "%Y-%m-%d")
+
+    report_spec = {
+        "date_range": {
+            "start_date": {
+                "year": start_dt.year,
+                "month": start_dt.month,
+                "day": start_dt.day
+            },
+            "end_date": {
+                "year": end_dt.year,
+                "month": end_dt.month,
+                "day": end_dt.day
+            }
+        },
+        "dimensions": ["APP", "DATE", "COUNTRY", "PLATFORM", "FORMAT", "AD_UNIT"],
+        "metrics": [
+            "ESTIMATED_EARNINGS",
+            "IMPRESSIONS",
+            "CLICKS",
+            "AD_REQUESTS",
+            "MATCHED_REQUESTS",
+            "OBSERVED_ECPM"
+        ],
+        "localization_settings": {"currency_code": "USD"}
+    }
+    if shard["filters"]:
+        report_spec["dimension_filters"] = report_filters(shard)
+
+    return {"report_spec": report_spec}
+
+
+def fetch_shards(service, publisher_id: str, shards: list, apps: dict | None) -> list:
+    """
+    Fetch report shards, in parallel when there are several.
+
+    Each worker thread sends its requests over its own connection (the
+    service's httplib2 transport is not thread-safe); without the
+    publisher's credentials the shards are fetched one at a time.
+
+    Returns:
+        Responses in shard order (a split shard contributes several)
+    """
+
+    if len(shards) == 1:
+        return fetch_shard(service, publisher_id, shards[0], apps)
+
+    credentials = _services.get(publisher_id, (None, None, None))[1]
+    workers = min(SHARD_WORKERS, len(shards)) if credentials is not None else 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, fetch_shard, service, publisher_id, shard, apps, credentials)
+            for shard in shards
+        ]
+        return [response for future in futures for response in future.result()]
+
+
+def fetch_shard(service, publisher_id: str, shard: dict, apps: dict | None, credentials=None) -> list:
+    """
+    Fetch one shard, retrying server errors and timeouts.
+
+    A shard still failing after SHARD_RETRIES retries is split and its
+    parts fetched instead; client errors (4xx, including 429s past the
+    rate limiter's retries) are raised as is.
+
+    Returns:
+        Responses covering the shard
+    """
+
+    with span("admob.shard", shard=shard_label(shard)) as shard_span:
+        request = service.accounts().mediationReport().generate(
+            parent=f"accounts/{publisher_id}", body=admob_report_body(shard)
+        )
+        http = shard_http(credentials) if credentials is not None else None
+
+        for attempt in range(SHARD_RETRIES + 1):
+            try:
+                response = execute_rate_limited(request, http=http)
+                shard_span.set(rows=sum(1 for item in response if "row" in item))
+                return [response]
+            except Exception as e:
+                if not is_shard_error(e):
+                    raise
+                shard_span.add("errors")
+                failure = e
+
+        parts = split_shard(shard, apps, load_sizes(publisher_id))
+        if not parts:
+            raise failure
+        shard_span.set(split=len(parts))
+        console.print(f"[yellow]⚠ AdMob shard {shard_label(shard)} failed ({failure}), splitting in {len(parts)}[/yellow]")
+
+    return fetch_shards(service, publisher_id, parts, apps)
+
+
+def shard_http(credentials):
+    """This thread's authorized connection (created on first use)."""
+
+    http = getattr(_shard_local, "http", None)
+    if http is None or getattr(_shard_local, "credentials", None) is not credentials:
+        import httplib2
+        import google_auth_httplib2
+
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=SHARD_TIMEOUT))
+        _shard_local.http, _shard_local.credentials = http, credentials
+    return http
+
+
+def is_shard_error(e: Exception) -> bool:
+    """Errors worth retrying or splitting on: 5xx, timeouts, dropped or truncated responses."""
+
+    import httplib2
+    from http.client import HTTPException
+
+    status = getattr(getattr(e, "resp", None), "status", None)
+    if status is not None:
+        return status >= 500
+    return isinstance(e, (OSError, ValueError, HTTPException, httplib2.HttpLib2Error))
+
+
+def list_admob_apps(service, publisher_id: str) -> dict | None:
+    """
+    The account's apps as {app ID: platform} (accounts.apps.list).
+
+    Returns:
+        App inventory, or None if it couldn't be listed
+    """
+
+    apps = {}
+    try:
+        request = service.accounts().apps().list(parent=f"accounts/{publisher_id}", pageSize=1000)
+        while request is not None:
+            response = execute_rate_limited(request)
+            for app in response.get("apps", []):
+                apps[app["appId"]] = {"ANDROID": "Android", "IOS": "iOS"}.get(app.get("platform"), app.get("platform"))
+            request = service.accounts().apps().list_next(request, response)
+    except Exception as e:
+        console.print(f"[yellow]⚠ Could not list AdMob apps ({e}); not splitting by app[/yellow]")
+        return None
+
+    return apps
+
+
+def execute_rate_limited(request, http=None):
+    """
+    Execute an API request under the host-wide AdMob rate limit.
+
+    A 429 pauses every AdMob caller for its Retry-After and the request is
+    retried (up to THROTTLE_RETRIES times); other errors are raised as is.
+
+    Args:
+        request: googleapiclient HttpRequest
+        http: Connection to send it over (default: the service's)
+    """
+
+    limiter = get_limiter("admob")
+    fetch_span = current_span()
+
+    for attempt in range(THROTTLE_RETRIES + 1):
+        fetch_span.add("rate_wait_ms", int(limiter.acquire() * 1000))
+        try:
+            response = request.execute(http=http)
+        except Exception as e:
+            # googleapiclient HttpError: status and headers on e.resp
+            resp = getattr(e, "resp", None)
+            if getattr(resp, "status", None) != 429:
+                raise
+            pause = limiter.throttled(parse_retry_after(resp.get("retry-after")))
+            fetch_span.add("throttled")
+            if attempt == THROTTLE_RETRIES:
+                raise
+            console.print(f"[yellow]⚠ AdMob rate limited (429), retrying in {pause:.1f}s[/yellow]")
+            continue
+
+        limiter.succeeded()
+        return response
+
+
+def cast_admob_typed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast raw AdMob strings to the RAW.ADMOB_DAILY_TYPED layout.
+
+    Casting is column-wise (no per-row Python): DATE YYYYMMDD -> date,
+    counts -> nullable Int64, micros -> nullable Int64 (NUMBER(38,0)).
+    The original strings are kept per row in RAW_VALUES for lineage.
+
+    Args:
+        df: DataFrame from fetch_admob_raw (uppercase string columns)
+
+    Returns:
+        New DataFrame matching RAW.ADMOB_DAILY_TYPED
+    """
+
+    import pandas as pd
+
+    typed = df.copy()
+
+    # Exact API strings -> VARIANT (object per row)
+    typed["RAW_VALUES"] = df[ADMOB_API_COLUMNS].to_dict(orient="records")
+
+    typed["DATE"] = pd.to_datetime(df["DATE"], format="%Y%m%d").dt.date
+
+    for col in ADMOB_COUNT_COLUMNS + ADMOB_MICROS_COLUMNS:
+        typed[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+
+    return typed
+
+
+def collect_admob_days(
+    service,
+    publisher_id: str,
+    days: int,
+    start_offset: int = 3
+) -> pd.DataFrame:
+    """
+    Fetch the last N finalized days, one API call per day.
+
+    Args:
+        service: AdMob API service
+        publisher_id: Publisher ID
+        days: Number of days to fetch
+        start_offset: Days back to start from (AdMob finalization delay)
+
+    Returns:
+        Combined DataFrame (empty if no day returned data)
+    """
+
+    today = datetime.now().date()
+    dates = [today - timedelta(days=i + start_offset) for i in range(days)]
+
+    return collect_admob_dates(service, publisher_id, dates)
+
+
+def collect_admob_dates(service, publisher_id: str, dates: list) -> pd.DataFrame:
+    """
+    Fetch the given days, one API call per day.
+
+    A day whose fetch fails raises, so no partial batch is loaded as if
+    complete.
+
+    Args:
+        service: AdMob API service
+        publisher_id: Publisher ID
+        dates: Days to fetch (date objects)
+
+    Returns:
+        Combined DataFrame (empty if no day returned data)
+    """
+
+    import pandas as pd
+
+    all_data = []
+
+    for target_date in dates:
+        date_str = target_date.strftime("%Y-%m-%d")
+
+        df = fetch_admob_raw(service, publisher_id, date_str, date_str)
+
+        if not df.empty:
+            all_data.append(df)
+            console.print(f"  ✓ {date_str}: {len(df):,} rows")
+        else:
+            console.print(f"  ⚠ {date_str}: No data")
+
+    if not all_data:
         return pd.DataFrame()
 
+    combined = pd.concat(all_data, ignore_index=True)
+    checkpoint("after concat")
+    return combined
 
-def load_to_snowflake(df: pd.DataFrame):
+
+def load_to_snowflake(
+    df: pd.DataFrame,
+    table_name: str = "ADMOB_DAILY",
+    client=None,
+    spool: bool = True,
+    validate: bool = True
+):
     """
     Load raw DataFrame to Snowflake (exact copy, no transformations).
 
     Args:
         df: DataFrame with API columns
+        table_name: Target RAW table (ADMOB_DAILY or ADMOB_DAILY_TYPED)
+        client: Shared SnowflakeClient (left open); a new one is created
+            and closed if not given
+        spool: Write the batch to the local spool and load from that file;
+            if the load fails it stays pending for replay_spool.py
+        validate: Drop duplicate keys and quarantine rows violating the
+            table DDL before loading
     """
 
     if df.empty:
         console.print("[yellow]⚠ No data to load[/yellow]")
         return
 
-    client = get_snowflake_client()
+    if validate:
+        df, _ = validate_batch(df, table_name)
+
+    owns_client = client is None
+    if owns_client:
+        client = get_snowflake_client()
 
     try:
         conn = client.connect()
 
-        console.print(f"[cyan]Loading {len(df):,} rows to RAW.ADMOB_DAILY...[/cyan]")
+        console.print(f"[cyan]Loading {len(df):,} rows to RAW.{table_name}...[/cyan]")
+
+        if spool:
+            batch_spool = Spool()
+            manifest = batch_spool.write(df, table_name, source="admob")
+            client.load_parquet(batch_spool.path_for(manifest), table_name)
+            batch_spool.commit(manifest)
+            return
 
         # Write directly to Snowflake using pandas
         from snowflake.connector.pandas_tools import write_pandas
@@ -199,7 +683,7 @@ def load_to_snowflake(df: pd.DataFrame):
         success, nchunks, nrows, _ = write_pandas(
             conn=conn,
             df=df,
-            table_name="ADMOB_DAILY",
+            table_name=table_name,
             database="DB_T34",
             schema="RAW",
             auto_create_table=False,
@@ -207,7 +691,7 @@ def load_to_snowflake(df: pd.DataFrame):
         )
 
         if success:
-            console.print(f"[green]✓ Loaded {nrows:,} rows to RAW.ADMOB_DAILY[/green]")
+            console.print(f"[green]✓ Loaded {nrows:,} rows to RAW.{table_name}[/green]")
         else:
             console.print(f"[red]✗ Load failed[/red]")
 
@@ -216,7 +700,8 @@ def load_to_snowflake(df: pd.DataFrame):
         raise
 
     finally:
-        client.close()
+        if owns_client:
+            client.close()
 
 
 def main():
@@ -224,65 +709,111 @@ def main():
 
     parser = argparse.ArgumentParser(description="AdMob Daily RAW Data Collection")
     parser.add_argument("--days", type=int, default=7, help="Number of days to fetch (default: 7)")
+    parser.add_argument("--start", type=str, help="First day to fetch (YYYY-MM-DD; overrides --days)")
+    parser.add_argument("--end", type=str, help="Last day to fetch (YYYY-MM-DD; default: --start)")
     parser.add_argument("--publisher", type=str, default="pub-4738062221647171", help="Publisher ID")
+    parser.add_argument("--typed", action="store_true", help="Cast at ingest and load RAW.ADMOB_DAILY_TYPED")
+    parser.add_argument("--no-spool", action="store_true", help="Load directly without the local spool")
+    parser.add_argument("--no-ledger", action="store_true", help="Don't record the run in OPS.PIPELINE_RUNS")
+    parser.add_argument("--profile-startup", action="store_true", help="Print import-time breakdown and exit")
+    add_profile_arguments(parser)
+    add_trace_arguments(parser)
     args = parser.parse_args()
 
-    console.print(Panel.fit(
-        "[bold cyan]AdMob RAW Pipeline[/bold cyan]\n"
-        f"Fetching last {args.days} day(s)\n"
-        "Mode: Pure RAW (no transformations)",
-        title="Data Collection"
-    ))
+    if args.profile_startup:
+        from scripts.utils.startup import print_startup_profile
+        print_startup_profile("scripts.collect_admob", DEFERRED_MODULES)
+        return 0
 
-    try:
-        # Authenticate
-        console.print("\n[bold]Step 1: Authenticate[/bold]")
-        service = authenticate_admob(args.publisher)
+    dates = None
+    if args.start:
+        try:
+            first = datetime.strptime(args.start, "%Y-%m-%d").date()
+            last = datetime.strptime(args.end or args.start, "%Y-%m-%d").date()
+        except ValueError:
+            console.print("[red]✗ --start/--end must be YYYY-MM-DD[/red]")
+            return 1
+        dates = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+        if not dates:
+            console.print("[red]✗ --end is before --start[/red]")
+            return 1
 
-        # Fetch data (start from 3 days ago - AdMob data finalization delay)
-        console.print("\n[bold]Step 2: Fetch from AdMob API[/bold]")
+    configure_from_args(args)
 
-        all_data = []
-        start_offset = 3
+    from rich.panel import Panel
 
-        for i in range(args.days):
-            target_date = (datetime.now() - timedelta(days=i+start_offset)).date()
-            date_str = target_date.strftime("%Y-%m-%d")
+    mode = "Typed RAW (cast at ingest)" if args.typed else "Pure RAW (no transformations)"
+    window = f"Fetching {dates[0]} to {dates[-1]}" if dates else f"Fetching last {args.days} day(s)"
 
-            df = fetch_admob_raw(service, args.publisher, date_str, date_str)
+    console.print(Panel.fit(
+        "[bold cyan]AdMob RAW Pipeline[/bold cyan]\n"
+        f"{window}\n"
+        f"Mode: {mode}",
+        title="Data Collection"
+    ))
 
-            if not df.empty:
-                all_data.append(df)
-                console.print(f"  ✓ {date_str}: {len(df):,} rows")
-            else:
-                console.print(f"  ⚠ {date_str}: No data")
+    # Run ledger record (written in finally, whatever the outcome)
+    timer = StageTimer()
+    started_at, start = utc_now(), time.perf_counter()
+    rows, error = 0, None
+
+    with profile(args.profile, "collect_admob", args.profile_output), \
+            span("admob.run", days=len(dates) if dates else args.days, typed=args.typed) as run_span:
+        try:
+            # Authenticate
+            console.print("\n[bold]Step 1: Authenticate[/bold]")
+            with timer.stage("authenticate"):
+                service = authenticate_admob(args.publisher)
+
+            # Fetch data (start from 3 days ago - AdMob data finalization delay)
+            console.print("\n[bold]Step 2: Fetch from AdMob API[/bold]")
+
+            with timer.stage("fetch"):
+                if dates:
+                    combined_df = collect_admob_dates(service, args.publisher, dates)
+                else:
+                    combined_df = collect_admob_days(service, args.publisher, args.days)
+
+            if combined_df.empty:
+                console.print("[yellow]⚠ No data fetched[/yellow]")
+                return 0
+
+            console.print(f"\n[green]✓ Total rows: {len(combined_df):,}[/green]")
+            timer.record(
+                bytes=batch_bytes(combined_df),
+                partitions=format_partitions(touched_dates(combined_df, "ADMOB_DAILY"))
+            )
+
+            # Load to Snowflake (no transformations unless --typed)
+            console.print("\n[bold]Step 3: Load to Snowflake RAW[/bold]")
+            with timer.stage("load"):
+                if args.typed:
+                    load_to_snowflake(cast_admob_typed(combined_df), table_name="ADMOB_DAILY_TYPED", spool=not args.no_spool)
+                else:
+                    load_to_snowflake(combined_df, spool=not args.no_spool)
+
+            rows = len(combined_df)
+
+            # Success
+            console.print(Panel.fit(
+                f"[bold green]✓ Pipeline Complete[/bold green]\n"
+                f"Days: {len(dates) if dates else args.days}\n"
+                f"Rows Loaded: {len(combined_df):,}\n"
+                f"Loaded At: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                title="Success"
+            ))
 
-        if not all_data:
-            console.print("[yellow]⚠ No data fetched[/yellow]")
             return 0
 
-        # Combine all batches
-        combined_df = pd.concat(all_data, ignore_index=True)
-        console.print(f"\n[green]✓ Total rows: {len(combined_df):,}[/green]")
+        except Exception as e:
+            error = str(e)
+            run_span.record_error(e)
+            console.print(f"\n[bold red]✗ Pipeline failed: {e}[/bold red]")
+            return 1
 
-        # Load to Snowflake (no transformations)
-        console.print("\n[bold]Step 3: Load to Snowflake RAW[/bold]")
-        load_to_snowflake(combined_df)
-
-        # Success
-        console.print(Panel.fit(
-            f"[bold green]✓ Pipeline Complete[/bold green]\n"
-            f"Days: {args.days}\n"
-            f"Rows Loaded: {len(combined_df):,}\n"
-            f"Loaded At: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            title="Success"
-        ))
-
-        return 0
-
-    except Exception as e:
-        console.print(f"\n[bold red]✗ Pipeline failed: {e}[/bold red]")
-        return 1
+        finally:
+            if not args.no_ledger:
+                record_cli_run("collect_admob", "admob", timer, started_at, time.perf_counter() - start, rows, error)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Collection Daemon - warm, in-process scheduling
+
+Long-running alternative to cron-invoked CLIs. Keeps the interpreter,
+imports, the Adjust HTTP session, AdMob services and Snowflake connections
+warm, and runs the jobs from config/pipeline_jobs.toml on their schedules,
+so each tick costs only the work itself.
+
+- Slots aligned to UTC midnight with per-slot jitter
+- Missed slots caught up on start-up in one widened run (state in .state/)
+- Local endpoint: /health (JSON) and /metrics (Prometheus text format)
+- Optional dbt run per tick for the sources and dates just loaded (--dbt)
+- Each tick's job runs recorded in OPS.PIPELINE_RUNS (SQLite fallback)
+
+Usage:
+    python scripts/daemon.py
+    python scripts/daemon.py --port 8765 --no-catch-up
+    python scripts/daemon.py --dbt
+"""
+
+import sys
+import json
+import time
+import random
+import signal
+import tomllib
+import argparse
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from rich.panel import Panel
+
+from scripts.utils.console import console
+from scripts.utils.dbt_trigger import merge_touched, run_dbt
+from scripts.utils.run_ledger import build_record, new_run_id, record_runs
+from scripts.utils.tracing import add_trace_arguments, configure_from_args, current_span, traced
+from scripts.run_pipeline import (
+    DEFAULT_JOBS_FILE,
+    PipelineContext,
+    load_jobs,
+    print_summary,
+    run_jobs,
+)
+
+STATE_FILE = project_root / ".state" / "daemon_state.json"
+
+
+def load_schedules(path: Path) -> dict:
+    """Load [schedules.*] tables from the job list file."""
+
+    with open(path, "rb") as f:
+        return tomllib.load(f).get("schedules", {})
+
+
+def slot_index(now_ts: float, schedule: dict) -> int:
+    """Index of the latest slot at or before now_ts (slots since the epoch)."""
+
+    interval = schedule["interval_minutes"] * 60
+    offset = schedule.get("offset_minutes", 0) * 60
+    return int((now_ts - offset) // interval)
+
+
+def slot_time(index: int, schedule: dict) -> float:
+    """Epoch seconds at which slot `index` starts."""
+
+    return index * schedule["interval_minutes"] * 60 + schedule.get("offset_minutes", 0) * 60
+
+
+def widen_job(job: dict, slots: int) -> dict:
+    """Copy of a job whose window covers `slots` consecutive slots."""
+
+    widened = dict(job)
+    if "days" in widened:
+        widened["days"] = widened["days"] * slots
+    if "hours" in widened:
+        widened["hours"] = widened["hours"] * slots
+    return widened
+
+
+class DaemonMetrics:
+    """Thread-safe run counters served by the health endpoint."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.jobs = {}
+        self.ticks = {}
+        self.schedules = {}
+        self.tick_errors = {}
+        self._lock = threading.Lock()
+
+    def record_tick(self, schedule_names: list[str], results: list[dict], seconds: float):
+        """Record one tick's job results and latency."""
+
+        now = time.time()
+
+        with self._lock:
+            for name in schedule_names:
+                tick = self.ticks.setdefault(name, {"count": 0})
+                tick["count"] += 1
+                tick["last_seconds"] = seconds
+                tick["last_at"] = now
+
+            for result in results:
+                job = self.jobs.setdefault(result["name"], {"ok": 0, "failed": 0, "rows": 0})
+                job[result["status"]] += 1
+                job["rows"] += result["rows"]
+                job["last_status"] = result["status"]
+                job["last_rows"] = result["rows"]
+                job["last_seconds"] = result["seconds"]
+                job["last_run_at"] = now
+                if result["status"] == "ok":
+                    job["last_success_at"] = now
+
+    def record_tick_errors(self, failed: dict):
+        """Record the tick steps (jobs, ledger, dbt) that failed: {step: error}."""
+
+        with self._lock:
+            for step, errors in self.tick_errors.items():
+                errors["failing"] = step in failed
+            for step, error in failed.items():
+                errors = self.tick_errors.setdefault(step, {"count": 0})
+                errors["count"] += 1
+                errors["failing"] = True
+                errors["last_error"] = error[:500]
+                errors["last_at"] = time.time()
+
+    def set_next_run(self, schedule_name: str, next_run_at: float):
+        """Record when a schedule will next run."""
+
+        with self._lock:
+            self.schedules[schedule_name] = next_run_at
+
+    def health(self) -> dict:
+        """Health document: degraded if any job's last run or the last tick's ledger/dbt step failed."""
+
+        with self._lock:
+            degraded = any(job.get("last_status") == "failed" for job in self.jobs.values()) or any(
+                errors["failing"] for errors in self.tick_errors.values()
+            )
+            return {
+                "status": "degraded" if degraded else "ok",
+                "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "next_runs": {
+                    name: datetime.fromtimestamp(ts, timezone.utc).isoformat()
+                    for name, ts in self.schedules.items()
+                },
+                "jobs": json.loads(json.dumps(self.jobs)),
+                "tick_errors": json.loads(json.dumps(self.tick_errors)),
+            }
+
+    def prometheus(self) -> str:
+        """Metrics in Prometheus text exposition format."""
+
+        lines = [
+            "# TYPE pipeline_daemon_uptime_seconds gauge",
+            f"pipeline_daemon_uptime_seconds {time.time() - self.started_at:.1f}",
+            "# TYPE pipeline_job_runs_total counter",
+            "# TYPE pipeline_job_rows_total counter",
+            "# TYPE pipeline_job_last_duration_seconds gauge",
+            "# TYPE pipeline_job_last_success_timestamp_seconds gauge",
+            "# TYPE pipeline_tick_last_duration_seconds gauge",
+            "# TYPE pipeline_tick_errors_total counter",
+        ]
+
+        with self._lock:
+            for name, job in self.jobs.items():
+                for status in ("ok", "failed"):
+                    lines.append(f'pipeline_job_runs_total{{job="{name}",status="{status}"}} {job[status]}')
+                lines.append(f'pipeline_job_rows_total{{job="{name}"}} {job["rows"]}')
+                lines.append(f'pipeline_job_last_duration_seconds{{job="{name}"}} {job["last_seconds"]:.3f}')
+                if "last_success_at" in job:
+                    lines.append(
+                        f'pipeline_job_last_success_timestamp_seconds{{job="{name}"}} {job["last_success_at"]:.0f}'
+                    )
+
+            for name, tick in self.ticks.items():
+                lines.append(f'pipeline_tick_last_duration_seconds{{schedule="{name}"}} {tick["last_seconds"]:.3f}')
+
+            for step, errors in self.tick_errors.items():
+                lines.append(f'pipeline_tick_errors_total{{step="{step}"}} {errors["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    """Serves /health and /metrics from the daemon's DaemonMetrics."""
+
+    metrics: DaemonMetrics = None
+
+    def do_GET(self):
+        if self.path == "/health":
+            body = json.dumps(self.metrics.health()).encode()
+            content_type = "application/json"
+        elif self.path == "/metrics":
+            body = self.metrics.prometheus().encode()
+            content_type = "text/plain; version=0.0.4"
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep scrapes out of the console
+        pass
+
+
+class CollectionDaemon:
+    """Runs scheduled jobs in-process against one warm PipelineContext."""
+
+    def __init__(
+        self,
+        jobs: list[dict],
+        schedules: dict,
+        ctx: PipelineContext,
+        metrics: DaemonMetrics,
+        state_path: Path = STATE_FILE,
+        catch_up: bool = True,
+        dbt: bool = False,
+        ledger: bool = True
+    ):
+        self.jobs = jobs
+        self.schedules = {
+            name: schedule for name, schedule in schedules.items()
+            if any(job.get("schedule") == name for job in jobs)
+        }
+        self.ctx = ctx
+        self.metrics = metrics
+        self.state_path = state_path
+        self.dbt = dbt
+        self.ledger = ledger
+        self.stop_event = threading.Event()
+
+        now = time.time()
+        state = self._load_state()
+        self.last_slots = {}
+        self.jitter = {}
+
+        for name, schedule in self.schedules.items():
+            current = slot_index(now, schedule)
+            # First start: treat the current slot as due
+            last = state.get(name, current - 1)
+            if not catch_up:
+                last = max(last, current - 1)
+            self.last_slots[name] = last
+            self.jitter[name] = random.uniform(0, schedule.get("jitter_seconds", 0))
+
+    def _load_state(self) -> dict:
+        """Last completed slot per schedule."""
+
+        if not self.state_path.exists():
+            return {}
+        return json.loads(self.state_path.read_text())
+
+    def _save_state(self):
+        """Persist last completed slots atomically."""
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.last_slots))
+        tmp_path.replace(self.state_path)
+
+    def _next_run_at(self, name: str) -> float:
+        """When the next not-yet-run slot of a schedule becomes due."""
+
+        return slot_time(self.last_slots[name] + 1, self.schedules[name]) + self.jitter[name]
+
+    @traced("daemon.tick")
+    def tick(self, due: dict):
+        """
+        Run all jobs of the due schedules concurrently.
+
+        A failing step (jobs, ledger write, dbt) is logged and counted in
+        the metrics; the slots still advance and the state is saved, so a
+        broken step never stops the daemon or reruns the tick on restart.
+
+        Args:
+            due: {schedule_name: (current_slot, missed_slots)}
+        """
+
+        jobs = []
+        for name, (_, missed) in due.items():
+            slots = min(missed, self.schedules[name].get("max_catch_up", 1))
+            if slots > 1:
+                console.print(f"[yellow]⚠ {name}: catching up {slots} missed slot(s)[/yellow]")
+            jobs += [widen_job(job, slots) for job in self.jobs if job.get("schedule") == name]
+
+        console.print(f"\n[bold]Tick: {', '.join(due)} @ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/bold]")
+        current_span().set(schedules=",".join(due), jobs=len(jobs))
+
+        failed = {}
+        try:
+            start = time.perf_counter()
+            results = run_jobs(jobs, self.ctx)
+            seconds = time.perf_counter() - start
+
+            print_summary(results, seconds)
+            self.metrics.record_tick(list(due), results, seconds)
+
+            if self.ledger:
+                try:
+                    run_id = new_run_id()
+                    record_runs([build_record(run_id, "daemon", result) for result in results], pool=self.ctx.pool)
+                except Exception as e:
+                    self._tick_error(failed, "ledger", e)
+
+            if self.dbt:
+                try:
+                    exit_code = run_dbt(merge_touched([result["touched"] for result in results if result["status"] == "ok"]))
+                    if exit_code:
+                        self._tick_error(failed, "dbt", RuntimeError(f"dbt run exited {exit_code}"))
+                except Exception as e:
+                    self._tick_error(failed, "dbt", e)
+
+        except Exception as e:
+            self._tick_error(failed, "jobs", e)
+
+        finally:
+            for name, (current, _) in due.items():
+                self.last_slots[name] = current
+                self.jitter[name] = random.uniform(0, self.schedules[name].get("jitter_seconds", 0))
+                self.metrics.set_next_run(name, self._next_run_at(name))
+
+            self.metrics.record_tick_errors(failed)
+            self._save_state()
+
+    def _tick_error(self, failed: dict, step: str, error: Exception):
+        """Log a failed tick step and add it to the tick's failures."""
+
+        current_span().record_error(error)
+        failed[step] = str(error)
+        console.print(f"[red]✗ Tick {step} failed: {error}[/red]")
+
+    def run_forever(self):
+        """Sleep until the next due slot, run it, repeat until stopped."""
+
+        for name in self.schedules:
+            self.metrics.set_next_run(name, self._next_run_at(name))
+
+        while not self.stop_event.is_set():
+            now = time.time()
+            due = {}
+
+            for name, schedule in self.schedules.items():
+                current = slot_index(now, schedule)
+                if current > self.last_slots[name] and now >= slot_time(current, schedule) + self.jitter[name]:
+                    due[name] = (current, current - self.last_slots[name])
+
+            if due:
+                self.tick(due)
+                continue
+
+            next_wake = min(self._next_run_at(name) for name in self.schedules)
+            self.stop_event.wait(timeout=min(max(next_wake - now, 1), 60))
+
+    def stop(self, *_):
+        """Signal handler: finish the current tick, then exit."""
+        console.print("\n[cyan]Stopping daemon after current tick...[/cyan]")
+        self.stop_event.set()
+
+
+def main():
+    """Start the daemon."""
+
+    parser = argparse.ArgumentParser(description="Long-running collection daemon")
+    parser.add_argument("--jobs-file", type=Path, default=DEFAULT_JOBS_FILE, help="TOML job list with schedules")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Health endpoint host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Health endpoint port (default: 8765)")
+    parser.add_argument("--pool-size", type=int, default=2, help="Max Snowflake connections (default: 2)")
+    parser.add_argument("--no-catch-up", action="store_true", help="Skip slots missed while stopped")
+    parser.add_argument("--dbt", action="store_true", help="Run dbt for the sources and dates each tick loaded")
+    parser.add_argument("--no-ledger", action="store_true", help="Don't record runs in OPS.PIPELINE_RUNS")
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    configure_from_args(args)
+
+    try:
+        jobs = load_jobs(args.jobs_file)
+        schedules = load_schedules(args.jobs_file)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]✗ Invalid job list: {e}[/red]")
+        return 1
+
+    metrics = DaemonMetrics()
+    HealthHandler.metrics = metrics
+    server = ThreadingHTTPServer((args.host, args.port), HealthHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with PipelineContext(pool_size=args.pool_size, keep_alive=True) as ctx:
+        daemon = CollectionDaemon(
+            jobs, schedules, ctx, metrics,
+            catch_up=not args.no_catch_up, dbt=args.dbt, ledger=not args.no_ledger
+        )
+
+        if not daemon.schedules:
+            console.print("[yellow]⚠ No scheduled jobs[/yellow]")
+            return 0
+
+        signal.signal(signal.SIGTERM, daemon.stop)
+        signal.signal(signal.SIGINT, daemon.stop)
+
+        console.print(Panel.fit(
+            "[bold cyan]Collection Daemon[/bold cyan]\n"
+            f"Schedules: {', '.join(daemon.schedules)}\n"
+            f"Health: http://{args.host}:{args.port}/health\n"
+            f"Metrics: http://{args.host}:{args.port}/metrics",
+            title="Daemon"
+        ))
+
+        daemon.run_forever()
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Gap-Detecting Backfill Planner
+
+Finds the partitions missing from RAW.ADMOB_DAILY (days) and
+RAW.ADJUST_HOURLY (hours) over a lookback window and refetches only those,
+instead of rerunning --days 30 "to be safe" (which refetches, and appends a
+second copy of, every day that was fine):
+1. Expected calendar per source: every day (AdMob, up to the finalization
+   delay) or hour (Adjust, up to the last complete hour) in the window, and
+   per app every day between its first and last day seen
+2. Existing partitions: one grouped query over both tables (app × partition
+   row counts)
+3. Gaps: partitions no app has (source outages, failed runs) and app-days
+   missing inside an app's calendar (partial loads)
+4. Ranges: gap days merged into contiguous ranges of at most
+   --max-range-days, fetched in parallel; each fetched batch is filtered to
+   the missing partitions before loading, so rows already in RAW are not
+   loaded twice
+
+Each range is recorded in OPS.PIPELINE_RUNS (runner "backfill"). dbt is then
+run for the loaded days (their date window passed as vars, as run_pipeline.py
+--dbt does), since staging models only pick up rows of other days from a
+windowed run over them; --no-dbt skips it.
+
+Usage:
+    python scripts/maintenance/backfill_gaps.py --dry-run
+    python scripts/maintenance/backfill_gaps.py --days 90 --workers 4
+    python scripts/maintenance/backfill_gaps.py --days 7 --no-dbt
+    python scripts/maintenance/backfill_gaps.py --sources adjust --start 2025-01-01 --end 2025-01-31
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd
+from rich.table import Table
+from rich.panel import Panel
+
+from scripts.utils.console import console
+from scripts.utils.dbt_trigger import merge_touched, run_dbt, touched_dates
+from scripts.utils.snowflake_client import get_snowflake_client
+from scripts.utils.tracing import add_trace_arguments, configure_from_args, span
+
+# Source → RAW table, app column, partition grain and how the partition is read
+SOURCES = {
+    "admob": {
+        "table": "ADMOB_DAILY",
+        "app": "APP_ID",
+        "grain": "day",
+        "partition_sql": "TO_TIMESTAMP_NTZ(TO_DATE(DATE, 'YYYYMMDD'))",
+        "window_sql": "DATE BETWEEN '{start:%Y%m%d}' AND '{end:%Y%m%d}'",
+    },
+    "adjust": {
+        "table": "ADJUST_HOURLY",
+        "app": "APP",
+        "grain": "hour",
+        "partition_sql": "HOUR",
+        "window_sql": "DAY BETWEEN '{start}' AND '{end}'",
+    },
+}
+
+ADMOB_LAG_DAYS = 3  # AdMob finalization delay (collect_admob_days start_offset)
+ADJUST_LAG_HOURS = 1  # the current hour is still filling
+
+# The discovery-built AdMob service (httplib2) is not thread-safe
+_admob_lock = threading.Lock()
+
+
+def window_end(source: str, end: date = None, now: datetime = None) -> pd.Timestamp:
+    """Last partition expected to be complete (day or hour start)."""
+
+    now = now or datetime.now()
+    if source == "admob":
+        last = now.date() - timedelta(days=ADMOB_LAG_DAYS)
+        return pd.Timestamp(min(last, end) if end else last)
+
+    last = pd.Timestamp(now).floor("h") - pd.Timedelta(hours=ADJUST_LAG_HOURS)
+    if end:
+        last = min(last, pd.Timestamp(end) + pd.Timedelta(hours=23))
+    return last
+
+
+def expected_partitions(source: str, start: date, last: pd.Timestamp) -> pd.DatetimeIndex:
+    """Every partition start from the first day of the window through last."""
+
+    freq = "D" if SOURCES[source]["grain"] == "day" else "h"
+    return pd.date_range(pd.Timestamp(start), last, freq=freq)
+
+
+def load_partitions(client, windows: dict) -> pd.DataFrame:
+    """
+    Existing partitions of every source in one grouped query.
+
+    Args:
+        client: SnowflakeClient
+        windows: {source: (first day, last partition)}
+
+    Returns:
+        DataFrame with SOURCE, APP, PARTITION_AT (day or hour start) and ROWS
+    """
+
+    selects = []
+    for source, (start, last) in windows.items():
+        spec = SOURCES[source]
+        window = spec["window_sql"].format(start=start, end=last.date())
+        selects.append(
+            f"SELECT '{source}' AS SOURCE, {spec['app']} AS APP, {spec['partition_sql']} AS PARTITION_AT, COUNT(*) AS ROWS "
+            f"FROM RAW.{spec['table']} WHERE {window} GROUP BY 1, 2, 3"
+        )
+
+    df = client.execute_query("\nUNION ALL\n".join(selects))
+    df["PARTITION_AT"] = pd.to_datetime(df["PARTITION_AT"])
+    return df
+
+
+def find_gaps(existing: pd.DataFrame, expected: pd.DatetimeIndex) -> dict:
+    """
+    Missing partitions of one source.
+
+    Args:
+        existing: APP and PARTITION_AT rows of the source (load_partitions)
+        expected: Partitions the window should have (expected_partitions)
+
+    Returns:
+        {"partitions": partitions no app has, "app_days": [(app, day)] days
+        missing inside an app's first-to-last calendar, "expected": count}
+    """
+
+    present = pd.DatetimeIndex(existing["PARTITION_AT"].unique())
+    missing = expected.difference(present)
+
+    # Days with no partition at all are refetched whole; skip their app-days
+    missing_per_day = missing.normalize().value_counts()
+    expected_per_day = expected.normalize().value_counts().reindex(missing_per_day.index)
+    empty_days = set(missing_per_day.index[missing_per_day == expected_per_day])
+
+    app_days = []
+    days = existing.assign(DAY=existing["PARTITION_AT"].dt.normalize())
+    for app, seen in days.groupby("APP")["DAY"]:
+        seen_days = pd.DatetimeIndex(seen.unique())
+        calendar = pd.date_range(seen_days.min(), seen_days.max(), freq="D")
+        app_days.extend((app, day) for day in calendar.difference(seen_days) if day not in empty_days)
+
+    return {"partitions": list(missing), "app_days": sorted(app_days), "expected": len(expected)}
+
+
+def gap_ranges(source: str, gaps: dict, max_days: int) -> list[dict]:
+    """
+    Contiguous day ranges covering every gap (at most max_days each).
+
+    Returns:
+        [{"source", "start", "end", "partitions", "app_days"}] with each
+        range's own share of the gaps
+    """
+
+    days = sorted({partition.normalize() for partition in gaps["partitions"]} | {day for _, day in gaps["app_days"]})
+
+    runs = []
+    for day in days:
+        if runs and day - runs[-1][-1] == pd.Timedelta(days=1) and len(runs[-1]) < max_days:
+            runs[-1].append(day)
+        else:
+            runs.append([day])
+
+    ranges = []
+    for run in runs:
+        first, last = run[0], run[-1]
+        ranges.append({
+            "source": source,
+            "start": first.date(),
+            "end": last.date(),
+            "partitions": [p for p in gaps["partitions"] if first <= p.normalize() <= last],
+            "app_days": [(app, day) for app, day in gaps["app_days"] if first <= day <= last],
+        })
+    return ranges
+
+
+def row_partitions(df: pd.DataFrame, source: str) -> tuple[pd.Series, pd.Series]:
+    """App and partition timestamp of every row of a fetched batch."""
+
+    if source == "admob":
+        return df["APP_ID"], pd.to_datetime(df["DATE"].astype(str), format="%Y%m%d")
+    return df["app"], pd.to_datetime(df["hour"])
+
+
+def missing_rows(df: pd.DataFrame, gap: dict) -> pd.DataFrame:
+    """Rows of a fetched batch that fall in the range's missing partitions."""
+
+    if df.empty:
+        return df
+
+    app, partition = row_partitions(df, gap["source"])
+
+    keep = partition.isin(gap["partitions"])
+    if gap["app_days"]:
+        keep |= pd.MultiIndex.from_arrays([app, partition.dt.normalize()]).isin(gap["app_days"])
+
+    return df[keep.to_numpy()].reset_index(drop=True)
+
+
+def uncovered(df: pd.DataFrame, gap: dict) -> tuple[list, list]:
+    """Missing partitions and app-days of a range that the rows to load still don't cover."""
+
+    if df.empty:
+        return list(gap["partitions"]), list(gap["app_days"])
+
+    app, partition = row_partitions(df, gap["source"])
+    present = set(partition.unique())
+    seen = set(zip(app, partition.dt.normalize()))
+    return (
+        [p for p in gap["partitions"] if p not in present],
+        [app_day for app_day in gap["app_days"] if app_day not in seen],
+    )
+
+
+def run_gap(gap: dict, ctx, publisher_id: str, spool: bool = True) -> dict:
+    """
+    Fetch one range, keep its missing partitions and load them, never raising.
+
+    A failed fetch marks the range failed; a fetch that succeeds without
+    covering every planned partition (the API has no data for it yet, or
+    an app had none) loads what it got and warns.
+
+    Returns:
+        Result dict in run_pipeline.run_job's shape (for the run ledger)
+    """
+
+    from scripts import collect_admob, collect_adjust
+    from scripts.utils.run_ledger import StageTimer, batch_bytes, format_partitions, utc_now
+
+    source, start_str, end_str = gap["source"], gap["start"].isoformat(), gap["end"].isoformat()
+    timer = StageTimer()
+    start = time.perf_counter()
+    result = {
+        "name": f"backfill_{source}_{start_str}_{end_str}", "source": source, "rows": 0, "touched": {},
+        "uncovered": 0, "status": "ok", "error": None, "started_at": utc_now(),
+    }
+
+    with span("backfill.range", source=source, start=start_str, end=end_str) as range_span:
+        try:
+            if source == "admob":
+                with timer.stage("authenticate"):
+                    service = ctx.admob_service(publisher_id)
+                with timer.stage("fetch"), _admob_lock:
+                    df = collect_admob.fetch_admob_raw(service, publisher_id, start_str, end_str)
+            else:
+                api_token = os.getenv("ADJUST_TOKEN")
+                if not api_token:
+                    raise RuntimeError("Missing ADJUST_TOKEN in .env")
+                with timer.stage("fetch"):
+                    df = collect_adjust.fetch_adjust_raw(api_token, start_str, end_str, session=ctx.http)
+
+            with timer.stage("filter"):
+                fetched = len(df)
+                df = missing_rows(df, gap)
+
+            range_span.set(fetched=fetched, rows=len(df))
+            console.print(f"  {source} {start_str} → {end_str}: {len(df):,} of {fetched:,} fetched rows missing from RAW")
+
+            partitions, app_days = uncovered(df, gap)
+            result["uncovered"] = len(partitions) + len(app_days)
+            if result["uncovered"]:
+                range_span.set(uncovered=result["uncovered"])
+                console.print(
+                    f"[yellow]⚠ {result['name']}: fetched rows don't cover {len(partitions):,} partition(s) "
+                    f"and {len(app_days):,} app-day(s) planned; they stay gaps[/yellow]"
+                )
+
+            if not df.empty:
+                table_name = SOURCES[source]["table"]
+                result["touched"] = touched_dates(df, table_name)
+                timer.record(bytes=batch_bytes(df), partitions=format_partitions(result["touched"]))
+
+                with timer.stage("load"), ctx.pool.acquire() as client:
+                    if source == "admob":
+                        collect_admob.load_to_snowflake(df, client=client, spool=spool)
+                    else:
+                        collect_adjust.load_to_snowflake(df, client=client, spool=spool)
+
+                result["rows"] = len(df)
+
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+            range_span.record_error(e)
+            console.print(f"[red]✗ {result['name']} failed: {e}[/red]")
+
+    result["stages"] = timer.stages
+    result["metrics"] = timer.metrics
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def dispatch(ranges: list[dict], workers: int, publisher_id: str, pool_size: int, spool: bool, ledger: bool) -> list[dict]:
+    """Run every range concurrently (bounded by workers) with shared connections."""
+
+    from scripts.run_pipeline import PipelineContext
+    from scripts.utils.run_ledger import build_record, new_run_id, record_runs
+
+    with PipelineContext(pool_size=min(pool_size, len(ranges))) as ctx:
+        with ThreadPoolExecutor(max_workers=max(min(workers, len(ranges)), 1)) as executor:
+            # Each range runs in a copy of this context: its spans nest under the run span
+            futures = [
+                executor.submit(contextvars.copy_context().run, run_gap, gap, ctx, publisher_id, spool)
+                for gap in ranges
+            ]
+            results = [future.result() for future in futures]
+
+        if ledger:
+            run_id = new_run_id()
+            record_runs([build_record(run_id, "backfill", result) for result in results], pool=ctx.pool)
+
+    return results
+
+
+def print_plan(plans: dict, ranges: list[dict]):
+    """Per-source gap summary and the ranges to fetch."""
+
+    summary = Table(title="Partition gaps")
+    summary.add_column("Source", style="cyan")
+    summary.add_column("Window")
+    summary.add_column("Expected", justify="right")
+    summary.add_column("Missing partitions", justify="right", style="red")
+    summary.add_column("Missing app-days", justify="right", style="yellow")
+    summary.add_column("Ranges", justify="right", style="green")
+
+    for source, plan in plans.items():
+        gaps = plan["gaps"]
+        last = f"{plan['last']:%Y-%m-%d %H:%M}" if SOURCES[source]["grain"] == "hour" else f"{plan['last']:%Y-%m-%d}"
+        summary.add_row(
+            source,
+            f"{plan['start']} → {last}",
+            f"{gaps['expected']:,} {SOURCES[source]['grain']}s",
+            f"{len(gaps['partitions']):,}",
+            f"{len(gaps['app_days']):,}",
+            f"{sum(1 for gap in ranges if gap['source'] == source):,}",
+        )
+    console.print(summary)
+
+    if not ranges:
+        return
+
+    table = Table(title="Backfill ranges")
+    table.add_column("Source", style="cyan")
+    table.add_column("Start")
+    table.add_column("End")
+    table.add_column("Days", justify="right")
+    table.add_column("Missing partitions", justify="right", style="red")
+    table.add_column("Missing app-days", justify="right", style="yellow")
+
+    for gap in ranges:
+        table.add_row(
+            gap["source"],
+            gap["start"].isoformat(),
+            gap["end"].isoformat(),
+            str((gap["end"] - gap["start"]).days + 1),
+            f"{len(gap['partitions']):,}",
+            f"{len(gap['app_days']):,}",
+        )
+    console.print(table)
+
+
+def main():
+    """Plan and run backfills for missing RAW partitions."""
+
+    parser = argparse.ArgumentParser(description="Detect missing RAW partitions and backfill only those")
+    parser.add_argument("--days", type=int, default=30, help="Lookback window in days (default: 30)")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day of the window (overrides --days)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day of the window (default: latest complete partition)")
+    parser.add_argument("--sources", type=str, default="admob,adjust", help="Comma-separated sources (default: admob,adjust)")
+    parser.add_argument("--max-range-days", type=int, default=7, help="Longest range fetched in one request (default: 7)")
+    parser.add_argument("--workers", type=int, default=4, help="Ranges fetched concurrently (default: 4)")
+    parser.add_argument("--pool-size", type=int, default=2, help="Max Snowflake connections (default: 2)")
+    parser.add_argument("--publisher", type=str, default="pub-4738062221647171", help="AdMob publisher ID")
+    parser.add_argument("--no-spool", action="store_true", help="Load directly without the local spool")
+    parser.add_argument("--no-ledger", action="store_true", help="Don't record runs in OPS.PIPELINE_RUNS")
+    parser.add_argument("--dry-run", action="store_true", help="Print the plan without fetching")
+    parser.add_argument("--no-dbt", action="store_true", help="Don't run dbt for the backfilled days")
+    parser.add_argument("--dbt-dry-run", action="store_true", help="Print the dbt commands instead of running them")
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    configure_from_args(args)
+
+    sources = [source.strip() for source in args.sources.split(",") if source.strip()]
+    unknown = [source for source in sources if source not in SOURCES]
+    if unknown:
+        console.print(f"[red]✗ Unknown source(s): {', '.join(unknown)}[/red]")
+        return 1
+
+    windows = {}
+    for source in sources:
+        last = window_end(source, args.end)
+        windows[source] = (args.start or last.date() - timedelta(days=args.days - 1), last)
+
+    console.print(Panel.fit(
+        "[bold cyan]Backfill Planner[/bold cyan]\n"
+        f"Sources: {', '.join(sources)}\n"
+        + (f"Window: {args.start} → {args.end or 'latest complete partition'}" if args.start else f"Window: last {args.days} days")
+        + ("\n[yellow]Dry run[/yellow]" if args.dry_run else ""),
+        title="RAW Gaps"
+    ))
+
+    with span("backfill.run", sources=",".join(sources)):
+        with span("backfill.plan"):
+            client = get_snowflake_client()
+            try:
+                existing = load_partitions(client, windows)
+            except Exception as e:
+                console.print(f"[red]✗ Could not read partitions: {e}[/red]")
+                return 1
+            finally:
+                client.close()
+
+            plans = {}
+            ranges = []
+            for source, (start, last) in windows.items():
+                gaps = find_gaps(existing[existing["SOURCE"] == source], expected_partitions(source, start, last))
+                plans[source] = {"start": start, "last": last, "gaps": gaps}
+                ranges.extend(gap_ranges(source, gaps, args.max_range_days))
+
+        print_plan(plans, ranges)
+
+        if not ranges:
+            console.print("[green]✓ No gaps: nothing to backfill[/green]")
+            return 0
+
+        if args.dry_run:
+            return 0
+
+        console.print(f"\n[bold]Backfilling {len(ranges)} range(s) on {min(args.workers, len(ranges))} worker(s)[/bold]")
+        results = dispatch(
+            ranges, args.workers, args.publisher, args.pool_size,
+            spool=not args.no_spool, ledger=not args.no_ledger
+        )
+
+    # Stage the backfilled days (a windowed run picks up rows of any load time)
+    dbt_exit = 0
+    if not args.no_dbt:
+        touched = merge_touched([result["touched"] for result in results if result["status"] == "ok"])
+        dbt_exit = run_dbt(touched, dry_run=args.dbt_dry_run)
+
+    rows = sum(result["rows"] for result in results)
+    failed = [result["name"] for result in results if result["status"] != "ok"]
+    if failed:
+        console.print(f"\n[red]✗ {rows:,} rows backfilled; failed: {', '.join(failed)}[/red]")
+        return 1
+    if dbt_exit:
+        return dbt_exit
+
+    still_missing = sum(result["uncovered"] for result in results)
+    if still_missing:
+        console.print(
+            f"\n[yellow]⚠ {rows:,} rows backfilled across {len(results)} range(s); "
+            f"{still_missing:,} planned partition(s)/app-day(s) returned no rows[/yellow]"
+        )
+        return dbt_exit
+
+    console.print(f"\n[green]✓ {rows:,} rows backfilled across {len(results)} range(s)[/green]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
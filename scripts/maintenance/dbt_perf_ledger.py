@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+dbt Performance Ledger
+
+Records where dbt run time and warehouse spend go, per model and per run:
+- run_results.json: status, execution time, rows affected
+- manifest.json: model name, layer (models/ subfolder), materialization
+- INFORMATION_SCHEMA.QUERY_HISTORY: bytes scanned, partitions pruned and
+  spill, summed over every query a model issued (matched on the node_id in
+  dbt's default query comment, within the run's time window)
+
+Rows are appended to OPS.DBT_RUN_LEDGER. Each model is compared with the
+median of its last N ledger runs and flagged when run time or bytes scanned
+grew by more than the threshold.
+
+Usage:
+    cd my_dbt_project && dbt run && cd ..
+    python scripts/maintenance/dbt_perf_ledger.py
+    python scripts/maintenance/dbt_perf_ledger.py --threshold 0.5 --fail-on-regression
+"""
+
+import sys
+import json
+import argparse
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd
+from rich.table import Table
+from rich.panel import Panel
+
+from scripts.utils.console import console
+from scripts.utils.dbt_trigger import DBT_PROJECT_DIR
+from scripts.utils.snowflake_client import get_snowflake_client
+
+LEDGER_TABLE = "DBT_RUN_LEDGER"
+
+# Minimum earlier runs before a model can be flagged
+MIN_HISTORY = 3
+
+QUERY_STAT_COLUMNS = [
+    "UNIQUE_ID", "QUERY_COUNT", "BYTES_SCANNED", "PARTITIONS_SCANNED",
+    "PARTITIONS_TOTAL", "BYTES_SPILLED_LOCAL", "BYTES_SPILLED_REMOTE",
+]
+MEDIAN_COLUMNS = ["UNIQUE_ID", "MEDIAN_EXECUTION_TIME_S", "MEDIAN_BYTES_SCANNED", "HISTORY_RUNS"]
+
+
+def parse_run_results(target_dir: Path) -> pd.DataFrame:
+    """
+    One row per executed model from run_results.json and manifest.json.
+
+    Returns:
+        DataFrame with run, model and timing columns (started_at /
+        completed_at span the model's execute phase)
+    """
+
+    run_results = json.loads((target_dir / "run_results.json").read_text())
+    manifest = json.loads((target_dir / "manifest.json").read_text())
+    nodes = manifest.get("nodes", {})
+
+    metadata = run_results["metadata"]
+    rows = []
+
+    for result in run_results["results"]:
+        unique_id = result["unique_id"]
+        if not unique_id.startswith("model."):
+            continue
+
+        node = nodes.get(unique_id, {})
+        fqn = node.get("fqn", [])
+        execute = next((t for t in result.get("timing", []) if t["name"] == "execute"), {})
+        adapter_response = result.get("adapter_response") or {}
+
+        rows.append({
+            "INVOCATION_ID": metadata["invocation_id"],
+            # UTC, as text: Snowflake parses it on load (no ns Parquet timestamps)
+            "GENERATED_AT": pd.Timestamp(metadata["generated_at"]).strftime("%Y-%m-%d %H:%M:%S.%f"),
+            "DBT_COMMAND": run_results.get("args", {}).get("which"),
+            "UNIQUE_ID": unique_id,
+            "MODEL_NAME": node.get("name", unique_id.split(".")[-1]),
+            # fqn: [project, <subfolder>..., model]
+            "LAYER": fqn[1] if len(fqn) > 2 else None,
+            "MATERIALIZED": node.get("config", {}).get("materialized"),
+            "STATUS": result["status"],
+            "EXECUTION_TIME_S": float(result.get("execution_time") or 0.0),
+            "ROWS_AFFECTED": adapter_response.get("rows_affected"),
+            "started_at": execute.get("started_at"),
+            "completed_at": execute.get("completed_at"),
+        })
+
+    return pd.DataFrame(rows)
+
+
+def get_query_stats(client, runs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Warehouse stats per model from query history over the run's window.
+
+    dbt prefixes every statement with a JSON comment carrying node_id, so
+    all of a model's queries (temp table, merge, ...) are summed.
+    """
+
+    started = pd.to_datetime(runs["started_at"].dropna(), utc=True)
+    completed = pd.to_datetime(runs["completed_at"].dropna(), utc=True)
+    if started.empty or completed.empty:
+        return pd.DataFrame(columns=QUERY_STAT_COLUMNS)
+
+    # Small margin: history timestamps and dbt's clock differ slightly
+    window_start = (started.min() - timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M:%S")
+    window_end = (completed.max() + timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M:%S")
+
+    return client.execute_query(
+        f"""
+        SELECT
+            REGEXP_SUBSTR(query_text, '"node_id": "([^"]+)"', 1, 1, 'e', 1) AS unique_id,
+            COUNT(*) AS query_count,
+            SUM(bytes_scanned) AS bytes_scanned,
+            SUM(partitions_scanned) AS partitions_scanned,
+            SUM(partitions_total) AS partitions_total,
+            SUM(bytes_spilled_to_local_storage) AS bytes_spilled_local,
+            SUM(bytes_spilled_to_remote_storage) AS bytes_spilled_remote
+        FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY(
+            END_TIME_RANGE_START => '{window_start}'::TIMESTAMP_LTZ,
+            END_TIME_RANGE_END => '{window_end}'::TIMESTAMP_LTZ,
+            RESULT_LIMIT => 10000
+        ))
+        WHERE query_text LIKE '/* {{"app": "dbt"%'
+        GROUP BY 1
+        HAVING unique_id IS NOT NULL
+        """
+    )
+
+
+def get_trailing_medians(client, unique_ids: list[str], history: int) -> pd.DataFrame:
+    """Median run time and bytes scanned of each model's last N successful runs."""
+
+    if not unique_ids:
+        return pd.DataFrame(columns=MEDIAN_COLUMNS)
+
+    id_list = ", ".join(f"'{unique_id}'" for unique_id in unique_ids)
+    past = client.execute_query(
+        f"""
+        SELECT unique_id, execution_time_s, bytes_scanned
+        FROM {client.schema}.{LEDGER_TABLE}
+        WHERE unique_id IN ({id_list})
+          AND status = 'success'
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY unique_id ORDER BY generated_at DESC) <= {history}
+        """
+    )
+
+    grouped = past.groupby("UNIQUE_ID")
+    medians = grouped[["EXECUTION_TIME_S", "BYTES_SCANNED"]].median()
+    medians.columns = ["MEDIAN_EXECUTION_TIME_S", "MEDIAN_BYTES_SCANNED"]
+    medians["HISTORY_RUNS"] = grouped.size()
+    return medians.reset_index()
+
+
+def flag_regressions(ledger: pd.DataFrame, threshold: float) -> pd.DataFrame:
+    """Flag models more than `threshold` above their trailing medians."""
+
+    # NUMBER columns arrive as Decimal objects; missing joins as object NaN
+    numeric = QUERY_STAT_COLUMNS[1:] + MEDIAN_COLUMNS[1:]
+    ledger[numeric] = ledger[numeric].apply(pd.to_numeric, errors="coerce")
+
+    has_history = ledger["HISTORY_RUNS"].fillna(0) >= MIN_HISTORY
+    limit = 1 + threshold
+
+    ledger["RUNTIME_REGRESSED"] = has_history & (
+        ledger["EXECUTION_TIME_S"] > ledger["MEDIAN_EXECUTION_TIME_S"] * limit
+    )
+    ledger["SCAN_REGRESSED"] = has_history & (
+        ledger["BYTES_SCANNED"].fillna(0) > ledger["MEDIAN_BYTES_SCANNED"].fillna(0) * limit
+    ) & (ledger["MEDIAN_BYTES_SCANNED"].fillna(0) > 0)
+
+    return ledger
+
+
+def print_ledger(ledger: pd.DataFrame):
+    """Models by run time, with scan stats and regression flags."""
+
+    table = Table(title=f"dbt run {ledger['INVOCATION_ID'].iloc[0][:8]}")
+    table.add_column("Model", style="cyan")
+    table.add_column("Layer")
+    table.add_column("Status")
+    table.add_column("Time (s)", justify="right", style="yellow")
+    table.add_column("Median (s)", justify="right")
+    table.add_column("Scanned (MB)", justify="right")
+    table.add_column("Pruned %", justify="right", style="green")
+    table.add_column("Spill (MB)", justify="right")
+    table.add_column("Flags")
+
+    # Models without query history (e.g. ephemeral, skipped) show zeros
+    ledger = ledger.copy()
+    ledger[QUERY_STAT_COLUMNS[1:]] = ledger[QUERY_STAT_COLUMNS[1:]].fillna(0)
+
+    for row in ledger.sort_values("EXECUTION_TIME_S", ascending=False).itertuples():
+        total = row.PARTITIONS_TOTAL
+        pruned = f"{(1 - row.PARTITIONS_SCANNED / total) * 100:.1f}" if total else "-"
+        spill = (row.BYTES_SPILLED_LOCAL + row.BYTES_SPILLED_REMOTE) / 1e6
+        flags = [name for name, flagged in (("runtime", row.RUNTIME_REGRESSED), ("scan", row.SCAN_REGRESSED)) if flagged]
+
+        table.add_row(
+            row.MODEL_NAME,
+            row.LAYER or "-",
+            row.STATUS,
+            f"{row.EXECUTION_TIME_S:.2f}",
+            f"{row.MEDIAN_EXECUTION_TIME_S:.2f}" if pd.notna(row.MEDIAN_EXECUTION_TIME_S) else "-",
+            f"{row.BYTES_SCANNED / 1e6:,.1f}",
+            pruned,
+            f"{spill:,.1f}" if spill else "-",
+            f"[red]{', '.join(flags)}[/red]" if flags else "",
+        )
+
+    console.print(table)
+
+
+def main():
+    """Record the latest dbt run in the performance ledger."""
+
+    parser = argparse.ArgumentParser(description="dbt run performance ledger")
+    parser.add_argument("--target-dir", type=Path, default=DBT_PROJECT_DIR / "target", help="dbt target/ directory")
+    parser.add_argument("--history", type=int, default=10, help="Trailing runs for the median (default: 10)")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Allowed growth vs median (default: 0.5 = +50%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 if any model regressed")
+    parser.add_argument("--no-load", action="store_true", help="Report only; don't append to the ledger")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]dbt Performance Ledger[/bold cyan]\n"
+        f"Target: {args.target_dir}\n"
+        f"Table: OPS.{LEDGER_TABLE}",
+        title="Maintenance"
+    ))
+
+    try:
+        runs = parse_run_results(args.target_dir)
+    except (OSError, KeyError, ValueError) as e:
+        console.print(f"[red]✗ Cannot read dbt artifacts: {e}[/red]")
+        return 1
+
+    if runs.empty:
+        console.print("[yellow]⚠ No models in run_results.json[/yellow]")
+        return 0
+
+    client = get_snowflake_client(schema="OPS")
+
+    try:
+        stats = get_query_stats(client, runs)
+        medians = get_trailing_medians(client, runs["UNIQUE_ID"].tolist(), args.history)
+
+        ledger = (
+            runs.drop(columns=["started_at", "completed_at"])
+            .merge(stats, on="UNIQUE_ID", how="left")
+            .merge(medians, on="UNIQUE_ID", how="left")
+        )
+        ledger = flag_regressions(ledger, args.threshold)
+        print_ledger(ledger)
+
+        if not args.no_load:
+            client.load_dataframe(ledger.drop(columns=["HISTORY_RUNS"]), LEDGER_TABLE)
+
+    except Exception as e:
+        console.print(f"[red]✗ Ledger failed: {e}[/red]")
+        return 1
+
+    finally:
+        client.close()
+
+    regressed = ledger[ledger["RUNTIME_REGRESSED"] | ledger["SCAN_REGRESSED"]]
+    if not regressed.empty:
+        console.print(f"[red]✗ Regressed: {', '.join(regressed['MODEL_NAME'])}[/red]")
+        return 1 if args.fail_on_regression else 0
+
+    console.print("[green]✓ No regressions[/green]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
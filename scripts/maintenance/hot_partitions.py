@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Hot Store Partition Maintenance
+
+Keeps hot.adjust_hourly at a rolling retention window using its daily range
+partitions. The expected partition set (today - retention + 1 through
+today + premake) is reconciled against the partitions that exist in
+pg_inherits:
+- Missing days in the window are created ahead of the loads that need them
+- Days before the window are dropped whole (metadata only, no DELETE)
+
+Safe to run repeatedly; run daily (cron or the daemon host).
+
+Usage:
+    python scripts/maintenance/hot_partitions.py
+    python scripts/maintenance/hot_partitions.py --retention-days 14 --dry-run
+"""
+
+import sys
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from rich.panel import Panel
+
+from scripts.utils.console import console
+from scripts.utils.postgres_client import get_postgres_client
+
+HOT_TABLES = ["adjust_hourly"]
+
+
+def expected_days(today: date, retention_days: int, premake_days: int) -> list[date]:
+    """Days that should have a partition: the retention window plus premade days."""
+
+    first = today - timedelta(days=retention_days - 1)
+    return [first + timedelta(days=i) for i in range(retention_days + premake_days)]
+
+
+def reconcile_partitions(
+    client,
+    table_name: str,
+    retention_days: int = 14,
+    premake_days: int = 3,
+    dry_run: bool = False,
+    today: date = None
+) -> dict:
+    """
+    Create missing and drop expired daily partitions of one table.
+
+    Returns:
+        {"created": [...], "dropped": [...]} partition names
+    """
+
+    days = expected_days(today or date.today(), retention_days, premake_days)
+    existing = client.get_partitions(table_name)
+
+    if dry_run:
+        return {
+            "created": [client.partition_name(table_name, day) for day in days if day not in existing],
+            "dropped": [name for day, name in sorted(existing.items()) if day < days[0]],
+        }
+
+    return {
+        "created": client.create_partitions(table_name, days),
+        "dropped": client.drop_partitions(table_name, before=days[0]),
+    }
+
+
+def main():
+    """Reconcile hot store partitions."""
+
+    parser = argparse.ArgumentParser(description="Hot store partition maintenance")
+    parser.add_argument("--retention-days", type=int, default=14, help="Days of data to keep (default: 14)")
+    parser.add_argument("--premake-days", type=int, default=3, help="Future days to pre-create (default: 3)")
+    parser.add_argument("--dry-run", action="store_true", help="Show changes without applying them")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]Hot Store Partition Maintenance[/bold cyan]\n"
+        f"Retention: {args.retention_days} days, pre-create: {args.premake_days} days"
+        + ("\n[yellow]Dry run[/yellow]" if args.dry_run else ""),
+        title="PostgreSQL"
+    ))
+
+    try:
+        with get_postgres_client() as client:
+            for table_name in HOT_TABLES:
+                changes = reconcile_partitions(
+                    client,
+                    table_name,
+                    retention_days=args.retention_days,
+                    premake_days=args.premake_days,
+                    dry_run=args.dry_run
+                )
+
+                console.print(f"\n[bold]{client.schema}.{table_name}[/bold]")
+                for name in changes["created"]:
+                    console.print(f"  [green]+ {name}[/green]")
+                for name in changes["dropped"]:
+                    console.print(f"  [red]- {name}[/red]")
+                if not changes["created"] and not changes["dropped"]:
+                    console.print("  [cyan]✓ Up to date[/cyan]")
+
+    except Exception as e:
+        console.print(f"\n[red]✗ Maintenance failed: {e}[/red]")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Pipeline Runs Report
+
+Charts collector throughput and latency trends from the run ledger
+(OPS.PIPELINE_RUNS, written by run_pipeline.py, daemon.py and the collector
+CLIs), per job and day:
+- Runs, failures, rows loaded and retries
+- Median rows/sec and p50 / p95 run time, with inline bar charts
+- Median seconds per stage (fetch, load, ...) and peak RSS
+
+Records still waiting in the local SQLite fallback are included, so runs
+made during a warehouse outage show up before they are flushed.
+
+Usage:
+    python scripts/maintenance/pipeline_runs_report.py
+    python scripts/maintenance/pipeline_runs_report.py --days 30 --job adjust_hourly
+    python scripts/maintenance/pipeline_runs_report.py --local   # SQLite ledger only
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd
+from rich.table import Table
+from rich.panel import Panel
+
+from scripts.utils.console import console
+from scripts.utils.run_ledger import LEDGER_COLUMNS, LEDGER_TABLE, LOCAL_LEDGER, read_local
+from scripts.utils.snowflake_client import get_snowflake_client
+
+BAR_BLOCKS = " ▏▎▍▌▋▊▉█"
+
+
+def load_runs(days: int, local: bool = False) -> pd.DataFrame:
+    """
+    Ledger records of the last N days (Snowflake plus unsynced local ones).
+
+    Falls back to the SQLite ledger alone if Snowflake is unreachable.
+    """
+
+    frames = []
+
+    if not local:
+        try:
+            with get_snowflake_client(schema="OPS") as client:
+                frames.append(client.execute_query(
+                    f"""
+                    SELECT {', '.join(LEDGER_COLUMNS)}
+                    FROM OPS.{LEDGER_TABLE}
+                    WHERE started_at >= DATEADD(day, -{days}, SYSDATE())
+                    """
+                ))
+        except Exception as e:
+            console.print(f"[yellow]⚠ Snowflake unavailable ({e}); using {LOCAL_LEDGER.name} only[/yellow]")
+            local = True
+
+    frames.append(pd.DataFrame(read_local(unsynced_only=not local), columns=LEDGER_COLUMNS))
+
+    frames = [frame for frame in frames if not frame.empty]
+    runs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=LEDGER_COLUMNS)
+
+    runs["STARTED_AT"] = pd.to_datetime(runs["STARTED_AT"])
+    numeric = ["ROWS_LOADED", "BATCH_BYTES", "TOTAL_SECONDS", "ROWS_PER_SECOND", "RETRIES", "PEAK_RSS_MB"]
+    runs[numeric] = runs[numeric].apply(pd.to_numeric, errors="coerce")
+
+    cutoff = pd.Timestamp.utcnow().tz_localize(None) - pd.Timedelta(days=days)
+    return runs[runs["STARTED_AT"] >= cutoff].sort_values("STARTED_AT")
+
+
+def daily_trends(runs: pd.DataFrame) -> pd.DataFrame:
+    """Per job and day: runs, failures, rows, median rows/sec, p50/p95 seconds."""
+
+    runs = runs.assign(DAY=runs["STARTED_AT"].dt.date, FAILED=runs["STATUS"] != "ok")
+    grouped = runs.groupby(["JOB_NAME", "DAY"])
+
+    trends = grouped.agg(
+        RUNS=("RUN_ID", "size"),
+        FAILED=("FAILED", "sum"),
+        ROWS=("ROWS_LOADED", "sum"),
+        RETRIES=("RETRIES", "sum"),
+        ROWS_PER_SECOND=("ROWS_PER_SECOND", "median"),
+        P50_SECONDS=("TOTAL_SECONDS", "median"),
+        P95_SECONDS=("TOTAL_SECONDS", lambda seconds: seconds.quantile(0.95)),
+        PEAK_RSS_MB=("PEAK_RSS_MB", "max"),
+    )
+    return trends.reset_index()
+
+
+def stage_medians(runs: pd.DataFrame) -> pd.DataFrame:
+    """Median seconds per stage per job (from STAGE_SECONDS JSON)."""
+
+    stages = pd.DataFrame(
+        [json.loads(value) if value else {} for value in runs["STAGE_SECONDS"]],
+        index=runs.index
+    )
+    return stages.groupby(runs["JOB_NAME"]).median()
+
+
+def bar(value: float, max_value: float, width: int = 16) -> str:
+    """Horizontal bar of value relative to max_value (eighth-block resolution)."""
+
+    if not max_value or pd.isna(value):
+        return ""
+
+    eighths = round(value / max_value * width * 8)
+    full, remainder = divmod(eighths, 8)
+    return "█" * full + (BAR_BLOCKS[remainder] if remainder else "")
+
+
+def print_job_trends(job_name: str, trends: pd.DataFrame, stages: pd.Series):
+    """One table per job: a row per day with throughput and latency bars."""
+
+    table = Table(title=f"{job_name}")
+    table.add_column("Day", style="cyan")
+    table.add_column("Runs", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Rows", justify="right", style="green")
+    table.add_column("Rows/s", justify="right")
+    table.add_column("Throughput", style="green")
+    table.add_column("p50 (s)", justify="right")
+    table.add_column("p95 (s)", justify="right", style="yellow")
+    table.add_column("Latency", style="yellow")
+    table.add_column("Peak RSS (MB)", justify="right")
+
+    max_rate = trends["ROWS_PER_SECOND"].max()
+    max_p95 = trends["P95_SECONDS"].max()
+
+    for row in trends.itertuples():
+        table.add_row(
+            str(row.DAY),
+            f"{row.RUNS:,}",
+            f"[red]{row.FAILED:,}[/red]" if row.FAILED else "0",
+            f"{row.ROWS:,.0f}",
+            f"{row.ROWS_PER_SECOND:,.0f}" if pd.notna(row.ROWS_PER_SECOND) else "-",
+            bar(row.ROWS_PER_SECOND, max_rate),
+            f"{row.P50_SECONDS:.1f}",
+            f"{row.P95_SECONDS:.1f}",
+            bar(row.P95_SECONDS, max_p95),
+            f"{row.PEAK_RSS_MB:,.0f}" if pd.notna(row.PEAK_RSS_MB) else "-",
+        )
+
+    console.print(table)
+
+    stages = stages.dropna()
+    if not stages.empty:
+        breakdown = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in stages.sort_values(ascending=False).items())
+        console.print(f"  Median stage time: {breakdown}")
+
+
+def main():
+    """Print the run ledger trends."""
+
+    parser = argparse.ArgumentParser(description="Pipeline run throughput and latency trends")
+    parser.add_argument("--days", type=int, default=14, help="Days of history (default: 14)")
+    parser.add_argument("--job", type=str, help="Only this job name")
+    parser.add_argument("--local", action="store_true", help=f"Read only the local SQLite ledger ({LOCAL_LEDGER.name})")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]Pipeline Runs Report[/bold cyan]\n"
+        f"Ledger: {'local ' + LOCAL_LEDGER.name if args.local else 'OPS.' + LEDGER_TABLE}\n"
+        f"History: {args.days} day(s)",
+        title="Maintenance"
+    ))
+
+    runs = load_runs(args.days, local=args.local)
+    if args.job:
+        runs = runs[runs["JOB_NAME"] == args.job]
+
+    if runs.empty:
+        console.print("[yellow]⚠ No runs recorded in this window[/yellow]")
+        return 0
+
+    trends = daily_trends(runs)
+    stages = stage_medians(runs)
+
+    for job_name, job_trends in trends.groupby("JOB_NAME"):
+        print_job_trends(job_name, job_trends, stages.loc[job_name])
+
+    failed = runs[runs["STATUS"] != "ok"]
+    console.print(
+        f"\nRuns: [bold]{len(runs):,}[/bold] "
+        f"({len(failed):,} failed), rows loaded: {runs['ROWS_LOADED'].sum():,.0f}"
+    )
+    if not failed.empty:
+        last = failed.iloc[-1]
+        console.print(f"[red]Last failure: {last['JOB_NAME']} @ {last['STARTED_AT']}: {last['ERROR']}[/red]")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
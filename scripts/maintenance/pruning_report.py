@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+RAW Table Clustering & Pruning Report
+
+Measures how well RAW tables prune for the date-ranged queries the pipeline
+and dbt actually run:
+- Clustering depth/overlaps via SYSTEM$CLUSTERING_INFORMATION
+- Partitions scanned vs total per query via GET_QUERY_OPERATOR_STATS
+- Automatic Clustering credits over the last N days
+
+Clustering info is always computed for the intended key, so the report gives
+a baseline before clustering is enabled and a comparison after.
+
+Usage:
+    python scripts/maintenance/pruning_report.py
+    python scripts/maintenance/pruning_report.py --output pruning_report.json
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from rich.console import Console
+from rich.table import Table
+from rich.panel import Panel
+
+from scripts.utils.snowflake_client import get_snowflake_client
+
+console = Console()
+
+# Intended clustering keys (must match sql/setup/create_raw_tables.sql)
+CLUSTERING_KEYS = {
+    "ADMOB_DAILY": "(date, app_id)",
+    "ADJUST_HOURLY": "(day, app)",
+}
+
+# Standard query set: check_data.py, get_latest_timestamp and the
+# date-ranged reads dbt incrementals will issue. {placeholders} are
+# literals resolved by resolve_query_params, so a lookup subquery's own
+# TableScan doesn't count against the measured query.
+STANDARD_QUERIES = {
+    "admob_date_range": (
+        "ADMOB_DAILY",
+        "SELECT MIN(date), MAX(date) FROM RAW.ADMOB_DAILY",
+    ),
+    "admob_latest_loaded_at": (
+        "ADMOB_DAILY",
+        "SELECT MAX(loaded_at) FROM RAW.ADMOB_DAILY",
+    ),
+    "admob_last_7d_by_app": (
+        "ADMOB_DAILY",
+        """
+        SELECT date, app_id, COUNT(*)
+        FROM RAW.ADMOB_DAILY
+        WHERE date >= TO_CHAR(DATEADD(day, -7, CURRENT_DATE()), 'YYYYMMDD')
+        GROUP BY 1, 2
+        """,
+    ),
+    "admob_one_day_one_app": (
+        "ADMOB_DAILY",
+        """
+        SELECT COUNT(*)
+        FROM RAW.ADMOB_DAILY
+        WHERE date = TO_CHAR(DATEADD(day, -3, CURRENT_DATE()), 'YYYYMMDD')
+        AND app_id = '{app_id}'
+        """,
+    ),
+    "adjust_latest_loaded_at": (
+        "ADJUST_HOURLY",
+        "SELECT MAX(loaded_at) FROM RAW.ADJUST_HOURLY",
+    ),
+    "adjust_last_24h": (
+        "ADJUST_HOURLY",
+        """
+        SELECT hour, app, SUM(installs)
+        FROM RAW.ADJUST_HOURLY
+        WHERE day >= DATEADD(day, -1, CURRENT_DATE())
+        GROUP BY 1, 2
+        """,
+    ),
+    "adjust_last_7d_daily": (
+        "ADJUST_HOURLY",
+        """
+        SELECT day, app, country, SUM(installs), SUM(ad_revenue)
+        FROM RAW.ADJUST_HOURLY
+        WHERE day >= DATEADD(day, -7, CURRENT_DATE())
+        GROUP BY 1, 2, 3
+        """,
+    ),
+}
+
+
+def resolve_query_params(cursor) -> dict:
+    """Literal values for the standard queries' {placeholders} (None if unavailable)."""
+
+    cursor.execute(
+        """
+        SELECT MIN(app_id)
+        FROM RAW.ADMOB_DAILY
+        WHERE date = TO_CHAR(DATEADD(day, -3, CURRENT_DATE()), 'YYYYMMDD')
+    """
+    )
+    app_id = cursor.fetchone()[0]
+    return {"app_id": app_id.replace("'", "''") if app_id else None}
+
+
+def get_clustering_info(cursor, table_name: str) -> dict:
+    """Return parsed SYSTEM$CLUSTERING_INFORMATION for a table."""
+
+    key = CLUSTERING_KEYS[table_name]
+    cursor.execute(f"SELECT SYSTEM$CLUSTERING_INFORMATION('RAW.{table_name}', '{key}')")
+    info = json.loads(cursor.fetchone()[0])
+    info["key"] = key
+    return info
+
+
+def get_pruning_stats(cursor, sql: str) -> dict:
+    """
+    Run a query and read partition pruning from its operator stats.
+
+    Returns:
+        Dict with query_id, partitions_scanned and partitions_total
+    """
+
+    cursor.execute(sql)
+    cursor.fetchall()
+    query_id = cursor.sfqid
+
+    cursor.execute(
+        f"""
+        SELECT
+            SUM(OPERATOR_STATISTICS:pruning:partitions_scanned::NUMBER),
+            SUM(OPERATOR_STATISTICS:pruning:partitions_total::NUMBER)
+        FROM TABLE(GET_QUERY_OPERATOR_STATS('{query_id}'))
+        WHERE OPERATOR_TYPE = 'TableScan'
+    """
+    )
+    scanned, total = cursor.fetchone()
+
+    return {
+        "query_id": query_id,
+        "partitions_scanned": int(scanned or 0),
+        "partitions_total": int(total or 0),
+    }
+
+
+def get_clustering_credits(cursor, table_name: str, days: int) -> float:
+    """Automatic Clustering credits used by a table over the last N days."""
+
+    try:
+        cursor.execute(
+            f"""
+            SELECT COALESCE(SUM(CREDITS_USED), 0)
+            FROM TABLE(INFORMATION_SCHEMA.AUTOMATIC_CLUSTERING_HISTORY(
+                DATE_RANGE_START => DATEADD(day, -{days}, CURRENT_TIMESTAMP()),
+                TABLE_NAME => 'DB_T34.RAW.{table_name}'
+            ))
+        """
+        )
+        return float(cursor.fetchone()[0])
+    except Exception:
+        # Not available until clustering has run at least once
+        return 0.0
+
+
+def main():
+    """Generate the clustering and pruning report."""
+
+    parser = argparse.ArgumentParser(description="RAW clustering & pruning report")
+    parser.add_argument("--days", type=int, default=7, help="Clustering credit window in days (default: 7)")
+    parser.add_argument("--output", type=str, help="Write the report as JSON to this path")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]Clustering & Pruning Report[/bold cyan]\n"
+        "Database: DB_T34\n"
+        "Schema: RAW",
+        title="Maintenance"
+    ))
+
+    client = get_snowflake_client()
+    report = {"generated_at": datetime.now().isoformat(), "tables": {}, "queries": {}}
+
+    try:
+        conn = client.connect()
+        cursor = conn.cursor()
+
+        # Measure storage, not the result cache
+        cursor.execute("ALTER SESSION SET USE_CACHED_RESULT = FALSE")
+
+        # 1. Clustering depth per table
+        depth_table = Table(title="Clustering Information")
+        depth_table.add_column("Table", style="cyan")
+        depth_table.add_column("Key")
+        depth_table.add_column("Partitions", justify="right")
+        depth_table.add_column("Avg Overlaps", justify="right")
+        depth_table.add_column("Avg Depth", justify="right", style="yellow")
+        depth_table.add_column(f"Credits ({args.days}d)", justify="right", style="magenta")
+
+        for table_name in CLUSTERING_KEYS:
+            info = get_clustering_info(cursor, table_name)
+            info["clustering_credits"] = get_clustering_credits(cursor, table_name, args.days)
+            report["tables"][table_name] = info
+
+            depth_table.add_row(
+                table_name,
+                info["key"],
+                f"{info.get('total_partition_count', 0):,}",
+                f"{info.get('average_overlaps', 0):.2f}",
+                f"{info.get('average_depth', 0):.2f}",
+                f"{info['clustering_credits']:.3f}",
+            )
+
+        console.print(depth_table)
+
+        # 2. Partitions scanned vs total for the standard query set
+        pruning_table = Table(title="Partition Pruning (standard queries)")
+        pruning_table.add_column("Query", style="cyan")
+        pruning_table.add_column("Table")
+        pruning_table.add_column("Scanned", justify="right")
+        pruning_table.add_column("Total", justify="right")
+        pruning_table.add_column("Pruned %", justify="right", style="green")
+
+        params = resolve_query_params(cursor)
+
+        for query_name, (table_name, sql) in STANDARD_QUERIES.items():
+            missing = [name for name, value in params.items() if value is None and f"{{{name}}}" in sql]
+            if missing:
+                console.print(f"[yellow]⚠ {query_name}: skipped, no data for {', '.join(missing)}[/yellow]")
+                continue
+
+            stats = get_pruning_stats(cursor, sql.format(**params))
+            total = stats["partitions_total"]
+            # 0/0 (empty table or no TableScan) has no pruning ratio
+            pruned_pct = (1 - stats["partitions_scanned"] / total) * 100 if total else None
+            stats["pruned_pct"] = pruned_pct
+            report["queries"][query_name] = {"table": table_name, **stats}
+
+            pruning_table.add_row(
+                query_name,
+                table_name,
+                f"{stats['partitions_scanned']:,}",
+                f"{total:,}",
+                f"{pruned_pct:.1f}" if pruned_pct is not None else "n/a",
+            )
+
+        console.print(pruning_table)
+        cursor.close()
+
+        if args.output:
+            Path(args.output).write_text(json.dumps(report, indent=2, default=str))
+            console.print(f"[green]✓ Report written: {args.output}[/green]")
+
+        return 0
+
+    except Exception as e:
+        console.print(f"[red]✗ Report failed: {e}[/red]")
+        return 1
+
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
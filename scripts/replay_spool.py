@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Spool Replay - drain uncommitted batches to their sinks
+
+Loads every pending batch in .state/spool (left there when a load failed) in
+parallel, into only the sinks that have not committed it, marking each sink
+committed after its load succeeds. No API calls are made: recovery costs
+only the load.
+
+Usage:
+    python scripts/replay_spool.py
+    python scripts/replay_spool.py --table ADJUST_HOURLY --workers 4
+    python scripts/replay_spool.py --purge-days 7  # Also delete old committed batches
+"""
+
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.utils.console import console
+from scripts.utils.postgres_client import PostgresClient
+from scripts.utils.snowflake_client import SnowflakeClientPool
+from scripts.utils.spool import Spool
+
+
+def replay_batch(spool: Spool, manifest: dict, pool: SnowflakeClientPool, postgres: PostgresClient) -> dict:
+    """Load one spooled batch into its pending sinks, committing each. Never raises."""
+
+    sinks = spool.pending_sinks(manifest)
+    rows = 0
+
+    try:
+        for sink in sinks:
+            if sink == "snowflake":
+                with pool.acquire() as client:
+                    rows = client.load_parquet(spool.path_for(manifest), manifest["table_name"])
+            elif sink == "postgres" and manifest["table_name"] == "ADJUST_HOURLY":
+                from scripts.collect_adjust import load_to_postgres
+                rows = load_to_postgres(spool.read(manifest), client=postgres)
+            else:
+                raise ValueError(f"No {sink} loader for {manifest['table_name']}")
+            spool.commit(manifest, sink=sink)
+        return {"id": manifest["id"], "table": manifest["table_name"], "sinks": sinks, "rows": rows, "error": None}
+    except Exception as e:
+        return {"id": manifest["id"], "table": manifest["table_name"], "sinks": sinks, "rows": rows, "error": str(e)}
+
+
+def main():
+    """Drain pending spool batches."""
+
+    from rich.panel import Panel
+    from rich.table import Table
+
+    parser = argparse.ArgumentParser(description="Replay uncommitted spool batches")
+    parser.add_argument("--table", type=str, help="Only batches for this RAW table")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel loads (default: 4)")
+    parser.add_argument("--purge-days", type=int, help="Delete committed batches older than N days")
+    args = parser.parse_args()
+
+    spool = Spool()
+    pending = spool.pending(args.table)
+
+    console.print(Panel.fit(
+        "[bold cyan]Spool Replay[/bold cyan]\n"
+        f"Pending batches: {len(pending)}\n"
+        f"Rows: {sum(m['rows'] for m in pending):,}",
+        title="Recovery"
+    ))
+
+    results = []
+    if pending:
+        workers = min(args.workers, len(pending))
+        postgres = PostgresClient(max_size=workers)
+        with SnowflakeClientPool(size=workers) as pool:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda m: replay_batch(spool, m, pool, postgres), pending))
+        postgres.close()
+
+        table = Table(title="Replayed Batches")
+        table.add_column("Batch", style="cyan")
+        table.add_column("Table")
+        table.add_column("Sinks")
+        table.add_column("Rows", justify="right", style="green")
+        table.add_column("Status")
+        for result in results:
+            status = "[green]committed[/green]" if result["error"] is None else f"[red]{result['error'][:60]}[/red]"
+            table.add_row(result["id"], result["table"], ", ".join(result["sinks"]), f"{result['rows']:,}", status)
+        console.print(table)
+
+    if args.purge_days is not None:
+        removed = spool.purge(args.purge_days)
+        console.print(f"[cyan]✓ Purged {removed} committed batch(es)[/cyan]")
+
+    failed = [result for result in results if result["error"] is not None]
+    if failed:
+        console.print(f"[red]✗ {len(failed)} batch(es) still pending[/red]")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Unified Pipeline Runner - AdMob + Adjust in one process
+
+Runs the declarative job list in config/pipeline_jobs.toml. Selected jobs
+run concurrently in one interpreter: heavy imports, credential loading and
+the Snowflake session pool are paid once, so a scheduled run takes as long
+as its slowest source instead of the sum of separate CLI runs.
+
+Usage:
+    python scripts/run_pipeline.py                       # All jobs
+    python scripts/run_pipeline.py --schedule hourly     # Jobs tagged hourly
+    python scripts/run_pipeline.py --jobs admob_daily,adjust_hourly
+    python scripts/run_pipeline.py --schedule hourly --dbt  # + dbt for touched sources
+"""
+
+import os
+import sys
+import time
+import tomllib
+import argparse
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import requests
+from rich.table import Table
+from rich.panel import Panel
+
+from scripts import collect_admob, collect_adjust
+from scripts.utils.console import console
+from scripts.utils.dbt_trigger import merge_touched, run_dbt, touched_dates
+from scripts.utils.postgres_client import PostgresClient
+from scripts.utils.run_ledger import (
+    StageTimer,
+    batch_bytes,
+    build_record,
+    format_partitions,
+    new_run_id,
+    record_runs,
+    utc_now,
+)
+from scripts.utils.snowflake_client import SnowflakeClientPool
+from scripts.utils.tracing import add_trace_arguments, configure_from_args, span
+
+DEFAULT_JOBS_FILE = project_root / "config" / "pipeline_jobs.toml"
+
+
+class PipelineContext:
+    """
+    Shared, long-lived resources for job runs.
+
+    Holds the Snowflake pool, the PostgreSQL hot-store pool, a keep-alive
+    HTTP session for Adjust and one authenticated AdMob service per
+    publisher. The runner builds one per
+    invocation; the daemon keeps one warm across ticks (keep_alive, so
+    idle pooled Snowflake sessions aren't expired between ticks).
+    """
+
+    def __init__(self, pool_size: int = 2, keep_alive: bool = False):
+        self.pool = SnowflakeClientPool(size=pool_size, keep_alive=keep_alive)
+        self.http = requests.Session()
+        # Hot store pool (opens on first load)
+        self.postgres = PostgresClient()
+
+    def admob_service(self, publisher_id: str):
+        """
+        Authenticated AdMob service for a publisher.
+
+        authenticate_admob builds it once per process and persists any
+        token refreshes on later calls.
+        """
+
+        return collect_admob.authenticate_admob(publisher_id)
+
+    def close(self):
+        """Close pooled connections and the HTTP session."""
+        self.pool.close()
+        self.postgres.close()
+        self.http.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+def run_admob_job(job: dict, ctx: PipelineContext, timer: StageTimer) -> tuple[int, dict]:
+    """AdMob stages: authenticate → fetch → (cast) → load. Returns rows loaded and touched dates."""
+
+    publisher_id = job["publisher"]
+
+    with timer.stage("authenticate"):
+        service = ctx.admob_service(publisher_id)
+
+    with timer.stage("fetch"):
+        df = collect_admob.collect_admob_days(service, publisher_id, job.get("days", 1))
+
+    if df.empty:
+        return 0, {}
+
+    touched = touched_dates(df, "ADMOB_DAILY")
+    timer.record(bytes=batch_bytes(df), partitions=format_partitions(touched))
+
+    table_name = "ADMOB_DAILY"
+    if job.get("typed"):
+        with timer.stage("cast"):
+            df = collect_admob.cast_admob_typed(df)
+        table_name = "ADMOB_DAILY_TYPED"
+
+    with timer.stage("load"):
+        with ctx.pool.acquire() as client:
+            collect_admob.load_to_snowflake(df, table_name=table_name, client=client, spool=job.get("spool", True))
+
+    # The typed variant has no dbt source
+    return len(df), touched if table_name == "ADMOB_DAILY" else {}
+
+
+def run_adjust_job(job: dict, ctx: PipelineContext, timer: StageTimer) -> tuple[int, dict]:
+    """Adjust stages: fetch → load (fanned out to the job's sinks) → (rollup). Returns rows loaded and touched dates."""
+
+    api_token = os.getenv("ADJUST_TOKEN")
+    if not api_token:
+        raise RuntimeError("Missing ADJUST_TOKEN in .env")
+
+    start_str, end_str = collect_adjust.adjust_date_range(job.get("hours", 1))
+
+    with timer.stage("fetch"):
+        df = collect_adjust.fetch_adjust_raw(api_token, start_str, end_str, session=ctx.http)
+
+    if df.empty:
+        return 0, {}
+
+    sinks = job.get("sinks", ["snowflake"])
+    adjust_touched = touched_dates(df, "ADJUST_HOURLY")
+    touched = adjust_touched if "snowflake" in sinks else {}
+    timer.record(bytes=batch_bytes(df), partitions=format_partitions(adjust_touched))
+
+    with timer.stage("load"):
+        results = collect_adjust.load_to_sinks(
+            df,
+            sinks,
+            snowflake_pool=ctx.pool,
+            postgres_client=ctx.postgres,
+            spool=job.get("spool", True)
+        )
+
+    timer.record(retries=sum(result["attempts"] - 1 for result in results.values()))
+    failed = [name for name, result in results.items() if result["status"] != "ok"]
+    if failed:
+        raise RuntimeError(f"Sink(s) failed: {', '.join(failed)}")
+
+    if job.get("rollup"):
+        with timer.stage("rollup"):
+            with ctx.pool.acquire() as client:
+                collect_adjust.load_daily_rollup(df, client=client)
+
+    return len(df), touched
+
+
+JOB_RUNNERS = {
+    "admob": run_admob_job,
+    "adjust": run_adjust_job,
+}
+
+
+def load_jobs(path: Path, names: list[str] = None, schedule: str = None) -> list[dict]:
+    """
+    Load and select jobs from a TOML job list.
+
+    Args:
+        path: Job list file
+        names: Only these job names (all if None)
+        schedule: Only jobs with this schedule tag (all if None)
+
+    Returns:
+        Selected job dicts
+    """
+
+    with open(path, "rb") as f:
+        jobs = tomllib.load(f).get("jobs", [])
+
+    for job in jobs:
+        if job.get("source") not in JOB_RUNNERS:
+            raise ValueError(f"Job {job.get('name')}: unknown source {job.get('source')!r}")
+
+    if names:
+        unknown = set(names) - {job["name"] for job in jobs}
+        if unknown:
+            raise ValueError(f"Unknown job(s): {', '.join(sorted(unknown))}")
+        jobs = [job for job in jobs if job["name"] in names]
+
+    if schedule:
+        jobs = [job for job in jobs if job.get("schedule") == schedule]
+
+    return jobs
+
+
+def run_job(job: dict, ctx: PipelineContext) -> dict:
+    """
+    Run one job's stages, never raising.
+
+    Returns:
+        Result dict with rows, touched ({RAW table: [start, end]} dates
+        loaded), status, error, per-stage seconds, start time and run
+        metrics (bytes, retries, partitions) for the run ledger
+    """
+
+    timer = StageTimer()
+    start = time.perf_counter()
+    result = {
+        "name": job["name"], "source": job["source"], "rows": 0, "touched": {},
+        "status": "ok", "error": None, "started_at": utc_now(),
+    }
+
+    with span("job", job=job["name"], source=job["source"]) as job_span:
+        try:
+            result["rows"], result["touched"] = JOB_RUNNERS[job["source"]](job, ctx, timer)
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+            job_span.record_error(e)
+            console.print(f"[red]✗ {job['name']} failed: {e}[/red]")
+
+        job_span.set(rows=result["rows"])
+
+    result["stages"] = timer.stages
+    result["metrics"] = timer.metrics
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def run_jobs(jobs: list[dict], ctx: PipelineContext) -> list[dict]:
+    """Run jobs concurrently (one thread per job) and return their results."""
+
+    with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as executor:
+        # Each job thread runs in a copy of this context: its spans nest
+        # under the caller's (run or tick) span
+        futures = [executor.submit(contextvars.copy_context().run, run_job, job, ctx) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def print_summary(results: list[dict], wall_seconds: float):
+    """Print one table with per-stage timings for every job."""
+
+    stage_names = []
+    for result in results:
+        for name in result["stages"]:
+            if name not in stage_names:
+                stage_names.append(name)
+
+    summary = Table(title="Pipeline Summary")
+    summary.add_column("Job", style="cyan")
+    summary.add_column("Source")
+    summary.add_column("Status")
+    summary.add_column("Rows", justify="right", style="green")
+    for name in stage_names:
+        summary.add_column(f"{name} (s)", justify="right")
+    summary.add_column("Total (s)", justify="right", style="yellow")
+
+    for result in results:
+        status = "[green]ok[/green]" if result["status"] == "ok" else "[red]failed[/red]"
+        stage_cells = [
+            f"{result['stages'][name]:.2f}" if name in result["stages"] else "-"
+            for name in stage_names
+        ]
+        summary.add_row(
+            result["name"],
+            result["source"],
+            status,
+            f"{result['rows']:,}",
+            *stage_cells,
+            f"{result['seconds']:.2f}",
+        )
+
+    console.print(summary)
+
+    serial_seconds = sum(result["seconds"] for result in results)
+    console.print(
+        f"Wall time: [bold]{wall_seconds:.2f}s[/bold] "
+        f"(sum of jobs: {serial_seconds:.2f}s)"
+    )
+
+
+def main():
+    """Main runner execution."""
+
+    parser = argparse.ArgumentParser(description="Unified AdMob + Adjust pipeline runner")
+    parser.add_argument("--jobs-file", type=Path, default=DEFAULT_JOBS_FILE, help="TOML job list")
+    parser.add_argument("--jobs", type=str, help="Comma-separated job names (default: all)")
+    parser.add_argument("--schedule", type=str, help="Only jobs with this schedule tag (e.g. hourly, daily)")
+    parser.add_argument("--pool-size", type=int, default=2, help="Max Snowflake connections (default: 2)")
+    parser.add_argument("--dbt", action="store_true", help="Run dbt for the sources and dates loaded")
+    parser.add_argument("--dbt-dry-run", action="store_true", help="Print the dbt commands --dbt would run")
+    parser.add_argument("--no-ledger", action="store_true", help="Don't record runs in OPS.PIPELINE_RUNS")
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    configure_from_args(args)
+
+    try:
+        names = args.jobs.split(",") if args.jobs else None
+        jobs = load_jobs(args.jobs_file, names=names, schedule=args.schedule)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]✗ Invalid job list: {e}[/red]")
+        return 1
+
+    if not jobs:
+        console.print("[yellow]⚠ No jobs selected[/yellow]")
+        return 0
+
+    console.print(Panel.fit(
+        "[bold cyan]Unified Pipeline Runner[/bold cyan]\n"
+        f"Jobs: {', '.join(job['name'] for job in jobs)}\n"
+        "Mode: Concurrent sources, shared Snowflake pool",
+        title="Data Collection"
+    ))
+
+    start = time.perf_counter()
+
+    with span("pipeline.run", jobs=",".join(job["name"] for job in jobs)):
+        with PipelineContext(pool_size=min(args.pool_size, len(jobs))) as ctx:
+            results = run_jobs(jobs, ctx)
+
+            if not args.no_ledger:
+                run_id = new_run_id()
+                record_runs([build_record(run_id, "pipeline", result) for result in results], pool=ctx.pool)
+
+    print_summary(results, time.perf_counter() - start)
+
+    exit_code = 0 if all(result["status"] == "ok" for result in results) else 1
+
+    # Rebuild only what this run's successful loads feed
+    if args.dbt or args.dbt_dry_run:
+        touched = merge_touched([result["touched"] for result in results if result["status"] == "ok"])
+        exit_code = run_dbt(touched, dry_run=args.dbt_dry_run) or exit_code
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
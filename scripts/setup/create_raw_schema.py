@@ -6,9 +6,19 @@ Tables:
 - RAW.ADMOB_DAILY: AdMob batch data (~13.5K rows/day)
 - RAW.ADJUST_HOURLY: Adjust incremental data (~39 rows/hour)
 - RAW.ADJUST_COHORTS: Adjust cohort retention data
+- RAW.ADMOB_DAILY_TYPED: Typed AdMob variant (optional, --typed)
+- RAW.ADJUST_DAILY: Daily rollup of ADJUST_HOURLY (optional, --rollup)
+- OPS.DBT_RUN_LEDGER: dbt performance history (optional, --ops)
+- OPS.PIPELINE_RUNS: collector job run history (optional, --ops)
+
+Options:
+- --cluster-existing: Add clustering keys to existing tables (no recreate)
+- --row-hash-existing: Add ROW_HASH columns to existing tables (no recreate)
+- --search-optimization: Enable search optimization on RAW tables
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Add project root to path for imports
@@ -105,11 +115,44 @@ def execute_sql_file(conn, sql_file_path):
 def main():
     """Create RAW schema tables."""
 
+    parser = argparse.ArgumentParser(description="Create RAW schema tables")
+    parser.add_argument("--typed", action="store_true", help="Also create typed variant tables (ADMOB_DAILY_TYPED)")
+    parser.add_argument("--rollup", action="store_true", help="Also create rollup tables (ADJUST_DAILY)")
+    parser.add_argument("--ops", action="store_true", help="Also create OPS tables (DBT_RUN_LEDGER, PIPELINE_RUNS)")
+    parser.add_argument("--cluster-existing", action="store_true", help="Only add clustering keys to existing tables")
+    parser.add_argument("--row-hash-existing", action="store_true", help="Only add ROW_HASH columns to existing tables")
+    parser.add_argument("--search-optimization", action="store_true", help="Enable search optimization on RAW tables")
+    args = parser.parse_args()
+
+    setup_dir = project_root / 'sql' / 'setup'
+
+    if args.cluster_existing:
+        tables = "ADMOB_DAILY, ADJUST_HOURLY (clustering only)"
+        sql_files = [setup_dir / 'alter_raw_clustering.sql']
+    elif args.row_hash_existing:
+        tables = "ADMOB_DAILY, ADMOB_DAILY_TYPED, ADJUST_HOURLY, ADJUST_DAILY (ROW_HASH only)"
+        sql_files = [setup_dir / 'alter_raw_row_hash.sql']
+    else:
+        tables = "ADMOB_DAILY, ADJUST_HOURLY, ADJUST_COHORTS"
+        sql_files = [setup_dir / 'create_raw_tables.sql']
+        if args.typed:
+            tables += ", ADMOB_DAILY_TYPED"
+            sql_files.append(setup_dir / 'create_raw_typed_tables.sql')
+        if args.rollup:
+            tables += ", ADJUST_DAILY"
+            sql_files.append(setup_dir / 'create_rollup_tables.sql')
+        if args.ops:
+            tables += ", OPS.DBT_RUN_LEDGER, OPS.PIPELINE_RUNS"
+            sql_files.append(setup_dir / 'create_ops_tables.sql')
+
+    if args.search_optimization:
+        sql_files.append(setup_dir / 'enable_search_optimization.sql')
+
     console.print(Panel.fit(
         "[bold cyan]Creating RAW Schema Tables[/bold cyan]\n"
         "Database: DB_T34\n"
         "Schema: RAW\n"
-        "Tables: ADMOB_DAILY, ADJUST_HOURLY, ADJUST_COHORTS",
+        f"Tables: {tables}",
         title="Snowflake Setup"
     ))
 
@@ -119,11 +162,11 @@ def main():
         conn = get_snowflake_connection()
         console.print("[green]✓ Connected to Snowflake[/green]")
 
-        # Execute SQL file
-        sql_file = project_root / 'sql' / 'setup' / 'create_raw_tables.sql'
-        console.print(f"\n[cyan]Executing SQL file: {sql_file}[/cyan]")
-
-        results = execute_sql_file(conn, sql_file)
+        # Execute SQL files
+        results = []
+        for sql_file in sql_files:
+            console.print(f"\n[cyan]Executing SQL file: {sql_file}[/cyan]")
+            results += execute_sql_file(conn, sql_file)
 
         # Display verification results
         if results and len(results) > 0:
@@ -1,5 +1,12 @@
 """Utility modules for data collection pipeline."""
 
-from .snowflake_client import SnowflakeClient, get_snowflake_client
+from .postgres_client import PostgresClient, get_postgres_client
+from .snowflake_client import SnowflakeClient, SnowflakeClientPool, get_snowflake_client
 
-__all__ = ['SnowflakeClient', 'get_snowflake_client']
+__all__ = [
+    'PostgresClient',
+    'SnowflakeClient',
+    'SnowflakeClientPool',
+    'get_postgres_client',
+    'get_snowflake_client',
+]
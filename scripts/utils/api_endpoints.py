@@ -0,0 +1,42 @@
+"""
+Source API endpoints for the collectors.
+
+The live AdMob and Adjust hosts are used unless ADMOB_API_URL /
+ADJUST_API_URL are set (in .secret/.env or the shell), e.g. to run every
+collector against the local mock server for offline load testing:
+
+    python scripts/benchmarks/mock_api_server.py --port 8790 &
+    export ADMOB_API_URL=http://127.0.0.1:8790 ADJUST_API_URL=http://127.0.0.1:8790
+
+The variables are read on each call, so they can be set after import.
+"""
+
+import os
+
+ADMOB_LIVE_URL = "https://admob.googleapis.com"
+ADJUST_LIVE_URL = "https://automate.adjust.com"
+
+
+def admob_url() -> str:
+    """AdMob API root (no trailing slash)."""
+    return os.getenv("ADMOB_API_URL", ADMOB_LIVE_URL).rstrip("/")
+
+
+def adjust_url() -> str:
+    """Adjust API root (no trailing slash)."""
+    return os.getenv("ADJUST_API_URL", ADJUST_LIVE_URL).rstrip("/")
+
+
+def admob_is_live() -> bool:
+    """False when AdMob calls go to a stand-in server (no OAuth needed)."""
+    return admob_url() == ADMOB_LIVE_URL
+
+
+def admob_discovery_url() -> str:
+    """AdMob v1 discovery document URL."""
+    return f"{admob_url()}/$discovery/rest?version=v1"
+
+
+def adjust_report_url() -> str:
+    """Adjust Report Service CSV endpoint."""
+    return f"{adjust_url()}/reports-service/csv_report"
@@ -0,0 +1,271 @@
+"""
+Pre-load validation of collector batches against the RAW table DDL.
+
+Constraints come from sql/setup/*.sql (the Snowflake RAW tables), so the
+checks can't drift from the tables they protect:
+- Primary key: composite key hashed to one uint64 per row, in-batch
+  duplicates dropped (last occurrence kept) in a single O(n) pass
+- NOT NULL: null dimension values
+- Types: values that won't cast to the column's INTEGER / DECIMAL / DATE /
+  TIMESTAMP type, and strings longer than VARCHAR(n)
+
+All checks are whole-column operations. Rows failing a NOT NULL or type
+check are removed and written, with a _REASON column, to
+`.state/quarantine/<TABLE>/<batch>.parquet` for inspection.
+"""
+
+from __future__ import annotations
+
+import re
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .console import console
+from .tracing import current_span, traced
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+project_root = Path(__file__).parent.parent.parent
+
+SQL_SETUP_DIR = project_root / "sql" / "setup"
+QUARANTINE_DIR = project_root / ".state" / "quarantine"
+
+# Snowflake RAW DDL (the hot store DDL is PostgreSQL, same columns)
+DDL_FILES = ["create_raw_tables.sql", "create_raw_typed_tables.sql", "create_rollup_tables.sql"]
+
+_TABLE_RE = re.compile(
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\n\)",
+    re.IGNORECASE | re.DOTALL,
+)
+_COLUMN_RE = re.compile(r"^\s*(\w+)\s+([A-Z_]+)(?:\s*\((\d+)(?:\s*,\s*(\d+))?\))?(.*)$", re.IGNORECASE)
+_PRIMARY_KEY_RE = re.compile(r"PRIMARY\s+KEY\s*\(([^)]*)\)", re.IGNORECASE)
+
+NUMERIC_TYPES = {"INTEGER", "INT", "BIGINT", "NUMBER", "DECIMAL", "NUMERIC", "FLOAT", "DOUBLE"}
+TEMPORAL_TYPES = {"DATE", "TIMESTAMP", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ", "TIMESTAMP_TZ"}
+STRING_TYPES = {"VARCHAR", "STRING", "TEXT", "CHAR"}
+SEMI_STRUCTURED_TYPES = {"VARIANT", "OBJECT", "ARRAY"}
+
+
+@lru_cache(maxsize=None)
+def load_table_schemas(setup_dir: Path = SQL_SETUP_DIR) -> dict:
+    """
+    Column constraints of every table defined in the RAW DDL files.
+
+    Returns:
+        {TABLE: {"columns": {COLUMN: {"type", "length", "scale", "not_null"}},
+                 "primary_key": [COLUMN, ...]}} (names upper-cased)
+    """
+
+    schemas = {}
+
+    for file_name in DDL_FILES:
+        path = Path(setup_dir) / file_name
+        if not path.exists():
+            continue
+
+        for table_name, body in _TABLE_RE.findall(path.read_text()):
+            columns = {}
+            primary_key = []
+
+            for line in body.split("\n"):
+                line = line.split("--")[0].strip().rstrip(",")
+                if not line:
+                    continue
+
+                key_match = _PRIMARY_KEY_RE.match(line)
+                if key_match:
+                    primary_key = [col.strip().upper() for col in key_match.group(1).split(",")]
+                    continue
+
+                column_match = _COLUMN_RE.match(line)
+                if column_match:
+                    name, col_type, length, scale, rest = column_match.groups()
+                    columns[name.upper()] = {
+                        "type": col_type.upper(),
+                        "length": int(length) if length and col_type.upper() in STRING_TYPES else None,
+                        "scale": int(scale) if scale else None,
+                        "not_null": "NOT NULL" in rest.upper(),
+                    }
+
+            schemas[table_name.upper()] = {"columns": columns, "primary_key": primary_key}
+
+    return schemas
+
+
+def hash_keys(codes: list) -> pd.Series:
+    """One uint64 hash per row over per-column integer codes (vectorized)."""
+
+    import pandas as pd
+
+    return pd.util.hash_pandas_object(pd.DataFrame(dict(enumerate(codes))), index=False)
+
+
+def _bad_values(values: pd.Series, spec: dict):
+    """Boolean array: which distinct (non-null) values don't fit the column type."""
+
+    import pandas as pd
+
+    col_type = spec["type"]
+
+    if col_type in NUMERIC_TYPES:
+        return pd.to_numeric(values, errors="coerce").isna().to_numpy()
+    if col_type in TEMPORAL_TYPES:
+        return pd.to_datetime(values, errors="coerce", format="ISO8601").isna().to_numpy()
+    if spec["length"]:
+        return (values.astype(str).str.len() > spec["length"]).to_numpy()
+    return None
+
+
+def _has_type_check(spec: dict) -> bool:
+    """Whether _bad_values checks values of this column type."""
+
+    return spec["type"] in NUMERIC_TYPES | TEMPORAL_TYPES or bool(spec["length"])
+
+
+def _scan_column(series: pd.Series, spec: dict) -> tuple:
+    """
+    Null mask, type-violation mask and integer codes for one column.
+
+    String (object) columns are factorized once: the codes give the null
+    mask (-1) and the key codes, and the type check runs on the distinct
+    values only (dimensions repeat heavily), mapped back through the codes.
+    Semi-structured values (dicts, lists) aren't hashable and are
+    factorized by their string form.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    if spec["type"] in SEMI_STRUCTURED_TYPES:
+        codes, _ = pd.factorize(series.astype(str).where(series.notna()))
+        return codes == -1, None, codes
+
+    if series.dtype != object:
+        # Typed columns (numbers, datetimes) already fit numeric/temporal types
+        codes, _ = pd.factorize(series)
+        return codes == -1, None, codes
+
+    codes, uniques = pd.factorize(series)
+    nulls = codes == -1
+
+    bad = _bad_values(pd.Series(uniques), spec)
+    if bad is None or not bad.any():
+        return nulls, None, codes
+
+    return nulls, np.append(bad, False)[codes], codes
+
+
+@traced("validate")
+def validate_batch(
+    df: pd.DataFrame,
+    table_name: str,
+    quarantine: bool = True,
+    quarantine_dir: Path = QUARANTINE_DIR
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Drop duplicate keys and quarantine invalid rows of a batch.
+
+    Columns are matched to the DDL case-insensitively; columns the DDL
+    doesn't define (and DDL columns missing from the batch) are ignored.
+
+    Args:
+        df: Batch about to be loaded
+        table_name: RAW table it is loaded into
+        quarantine: Write invalid rows to the quarantine directory
+        quarantine_dir: Root of the quarantine directory
+
+    Returns:
+        (clean DataFrame, report dict with rows, duplicates, invalid,
+        per-check counts and quarantine file)
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    schema = load_table_schemas().get(table_name.upper())
+    report = {"table": table_name, "rows": len(df), "duplicates": 0, "invalid": 0, "checks": {}, "quarantine_file": None}
+
+    if schema is None or df.empty:
+        return df, report
+
+    by_upper = {col.upper(): col for col in df.columns}
+    primary_key = schema["primary_key"]
+
+    # Invalid rows: one boolean mask per failed check, OR-ed together
+    checks = {}
+    key_codes = {}
+    for name, spec in schema["columns"].items():
+        col = by_upper.get(name)
+        if col is None:
+            continue
+        # Nullable non-key columns with nothing to parse or no type check: skip
+        if not spec["not_null"] and name not in primary_key and (df[col].dtype != object or not _has_type_check(spec)):
+            continue
+
+        nulls, violations, codes = _scan_column(df[col], spec)
+        if name in primary_key:
+            key_codes[name] = codes
+        if spec["not_null"] and nulls.any():
+            checks[f"{name} is null"] = nulls
+        if violations is not None:
+            label = f"{name} longer than {spec['length']}" if spec["length"] else f"{name} not {spec['type'].lower()}"
+            checks[label] = violations
+
+    invalid = np.zeros(len(df), dtype=bool)
+    for mask in checks.values():
+        invalid |= mask
+
+    report["checks"] = {check: int(mask.sum()) for check, mask in checks.items()}
+    report["invalid"] = int(invalid.sum())
+
+    # Duplicate keys among the valid rows; the last occurrence wins
+    duplicate = np.zeros(len(df), dtype=bool)
+    if primary_key and len(key_codes) == len(primary_key):
+        valid = ~invalid
+        hashes = hash_keys([key_codes[name] for name in primary_key]).to_numpy()
+        duplicate[valid] = pd.Series(hashes[valid]).duplicated(keep="last").to_numpy()
+    report["duplicates"] = int(duplicate.sum())
+    current_span().set(table=table_name, rows=report["rows"], duplicates=report["duplicates"], invalid=report["invalid"])
+
+    if report["invalid"] and quarantine:
+        report["quarantine_file"] = str(_quarantine(df[invalid], checks, invalid, table_name, quarantine_dir))
+
+    if report["invalid"] or report["duplicates"]:
+        console.print(
+            f"[yellow]⚠ {table_name}: dropped {report['duplicates']:,} duplicate key(s), "
+            f"quarantined {report['invalid']:,} invalid row(s)[/yellow]"
+        )
+        for check, count in report["checks"].items():
+            console.print(f"  [yellow]{check}: {count:,}[/yellow]")
+        return df[~(invalid | duplicate)], report
+
+    return df, report
+
+
+def _quarantine(
+    rows: pd.DataFrame,
+    checks: dict,
+    invalid,
+    table_name: str,
+    quarantine_dir: Path
+) -> Path:
+    """Write invalid rows with the checks they failed to a Parquet side file."""
+
+    import numpy as np
+
+    reasons = np.full(len(rows), "", dtype=object)
+    for check, mask in checks.items():
+        failed = mask[invalid]
+        reasons[failed] = reasons[failed] + check + "; "
+
+    rows = rows.astype(str).assign(_REASON=[reason[:-2] for reason in reasons])
+
+    table_dir = Path(quarantine_dir) / table_name.upper()
+    table_dir.mkdir(parents=True, exist_ok=True)
+    path = table_dir / f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}.parquet"
+    rows.to_parquet(path, index=False, compression="zstd")
+    return path
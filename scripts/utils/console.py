@@ -0,0 +1,23 @@
+"""
+Shared rich console, constructed on first use.
+
+Importing this module is free; rich is only imported (and the terminal
+probed) the first time something is printed, so `--help` and other early
+exits never pay for it.
+"""
+
+
+class LazyConsole:
+    """Proxy that builds rich.console.Console on first attribute access."""
+
+    def __init__(self):
+        self._console = None
+
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = LazyConsole()
@@ -0,0 +1,114 @@
+"""
+Selective dbt runs after collector loads.
+
+Each load reports the RAW tables and date range it touched. Those map to the
+dbt sources they feed, and dbt runs only `source:<name>+` (the source's
+downstream lineage) with the touched window passed as the start_date and
+end_date vars, which staging models use to prune RAW reads. An hourly
+Adjust load rebuilds only the Adjust lineage for its days, not the project.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .console import console
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+project_root = Path(__file__).parent.parent.parent
+
+DBT_PROJECT_DIR = project_root / "my_dbt_project"
+
+# RAW table → (dbt source, date column as loaded, date format as loaded)
+DBT_SOURCES = {
+    "ADMOB_DAILY": ("raw.admob_daily", "DATE", "%Y%m%d"),
+    "ADJUST_HOURLY": ("raw.adjust_hourly", "DAY", "%Y-%m-%d"),
+}
+
+
+def touched_dates(df: pd.DataFrame, table_name: str) -> dict:
+    """
+    Date window a loaded batch touched, for tables that feed dbt.
+
+    Returns:
+        {table_name: [start_date, end_date]} (ISO dates), or {} if the table
+        has no dbt source or the batch is empty
+    """
+
+    if table_name not in DBT_SOURCES or df.empty:
+        return {}
+
+    _, column, date_format = DBT_SOURCES[table_name]
+    values = df[column] if column in df.columns else df[column.lower()]
+    dates = sorted(
+        datetime.strptime(str(value), date_format).date()
+        for value in values.dropna().unique()
+    )
+    return {table_name: [dates[0].isoformat(), dates[-1].isoformat()]}
+
+
+def merge_touched(touched_list: list[dict]) -> dict:
+    """Union of touched windows per table (earliest start, latest end)."""
+
+    merged = {}
+    for touched in touched_list:
+        for table_name, (start, end) in touched.items():
+            if table_name in merged:
+                start = min(start, merged[table_name][0])
+                end = max(end, merged[table_name][1])
+            merged[table_name] = [start, end]
+    return merged
+
+
+def dbt_commands(touched: dict, project_dir: Path = DBT_PROJECT_DIR) -> list[list[str]]:
+    """
+    One `dbt run` per touched source, limited to its lineage and window.
+
+    Runs are per source (not one union selector) so each gets its own date
+    window; they run one after another since dbt invocations share target/.
+    """
+
+    commands = []
+    for table_name, (start, end) in sorted(touched.items()):
+        source = DBT_SOURCES[table_name][0]
+        commands.append([
+            "dbt", "run",
+            "--project-dir", str(project_dir),
+            "--select", f"source:{source}+",
+            "--vars", json.dumps({"start_date": start, "end_date": end}),
+        ])
+    return commands
+
+
+def run_dbt(touched: dict, project_dir: Path = DBT_PROJECT_DIR, dry_run: bool = False) -> int:
+    """
+    Run dbt for the touched sources.
+
+    Returns:
+        0 if every run succeeded (or nothing to run), else the first
+        non-zero dbt exit code
+    """
+
+    commands = dbt_commands(touched, project_dir)
+    if not commands:
+        console.print("[cyan]No dbt sources touched; skipping dbt[/cyan]")
+        return 0
+
+    exit_code = 0
+    for command in commands:
+        console.print(f"\n[bold]dbt run[/bold] {' '.join(command[4:])}")
+        if dry_run:
+            continue
+
+        completed = subprocess.run(command, cwd=project_dir)
+        if completed.returncode != 0:
+            console.print(f"[red]✗ dbt run failed ({completed.returncode}): {command[5]}[/red]")
+            exit_code = exit_code or completed.returncode
+
+    return exit_code
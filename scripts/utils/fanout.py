@@ -0,0 +1,84 @@
+"""
+Sink fan-out: load one fetched batch into several destinations at once.
+
+The batch is handed to every sink as the same immutable pyarrow Table; each
+sink converts it to its own frame, so no sink can see another's changes.
+Sinks run concurrently, each with its own retries, and a sink is committed
+(on_commit) only after its own load succeeds. A slow or failing sink never
+delays or repeats the others' writes.
+"""
+
+from __future__ import annotations
+
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable
+
+from .console import console
+from .tracing import span
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def fan_out(
+    batch: pa.Table,
+    sinks: dict[str, Callable[[pa.Table], int]],
+    retries: int = 2,
+    backoff_seconds: float = 2.0,
+    on_commit: Callable[[str], None] = None
+) -> dict[str, dict]:
+    """
+    Load a batch into all sinks concurrently.
+
+    Args:
+        batch: Immutable batch shared by all sinks
+        sinks: {sink name: load(batch) -> rows loaded}
+        retries: Retries per sink after the first attempt
+        backoff_seconds: Initial retry delay, doubled each retry
+        on_commit: Called with the sink name after its load succeeds
+
+    Returns:
+        {sink name: {"rows", "attempts", "status", "error", "seconds"}};
+        failures are reported, never raised
+    """
+
+    def run_sink(name: str, load: Callable[[pa.Table], int]) -> dict:
+        start = time.perf_counter()
+        result = {"rows": 0, "attempts": 0, "status": "ok", "error": None}
+
+        with span(f"sink.{name}", rows_in=batch.num_rows, bytes=batch.nbytes) as sink_span:
+            for attempt in range(1, retries + 2):
+                result["attempts"] = attempt
+                try:
+                    result["rows"] = load(batch) or 0
+                    result["error"] = None
+                    break
+                except Exception as e:
+                    result["error"] = str(e)
+                    if attempt <= retries:
+                        delay = backoff_seconds * 2 ** (attempt - 1)
+                        console.print(f"[yellow]⚠ {name}: attempt {attempt} failed ({e}), retrying in {delay:.0f}s[/yellow]")
+                        time.sleep(delay)
+
+            if result["error"] is None:
+                if on_commit:
+                    on_commit(name)
+            else:
+                result["status"] = "failed"
+                sink_span.record_error(RuntimeError(result["error"]))
+                console.print(f"[red]✗ {name}: failed after {result['attempts']} attempt(s): {result['error']}[/red]")
+
+            sink_span.set(rows=result["rows"], retries=result["attempts"] - 1)
+
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(len(sinks), 1)) as executor:
+        # Sink spans nest under the caller's span (one context copy per thread)
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, run_sink, name, load)
+            for name, load in sinks.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,261 @@
+"""
+Run profiling for the collector CLIs (--profile cpu|mem).
+
+- cpu: a sampling profiler. A background thread records every thread's
+  Python stack every few milliseconds; the counts are written as collapsed
+  stacks ("root;caller;callee count" per line), the input of flamegraph.pl,
+  speedscope and inferno. Sampling keeps the overhead low enough to profile
+  real runs, and the stacks are complete (unlike cProfile's caller pairs).
+- mem: tracemalloc snapshots at stage boundaries (every StageTimer stage,
+  plus checkpoint() calls inside the fetch/parse/concat code). Each
+  checkpoint records the traced memory and the peak since the previous
+  one; the report lists the top allocation sites that grew at each step.
+
+checkpoint() does nothing unless memory profiling is on.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+import sysconfig
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from .console import console
+
+project_root = Path(__file__).parent.parent.parent
+
+PROFILE_DIR = project_root / ".state" / "profiles"
+PROFILE_MODES = ("cpu", "mem")
+SAMPLE_INTERVAL = 0.005  # seconds between CPU samples
+TOP_SITES = 8  # allocation sites listed per memory checkpoint
+MIN_SITE_BYTES = 64 * 1024  # smaller growth is left out of the report
+
+_memory_profiler = None
+
+
+class SamplingProfiler:
+    """Sample all thread stacks on an interval and count collapsed stacks."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.counts = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        labels = {}  # code object → frame label (cached)
+
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = _frame_label(code)
+                    stack.append(label)
+                    frame = frame.f_back
+
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.counts[";".join(reversed(stack))] += 1
+
+            self.samples += 1
+
+    def write_collapsed(self, path: Path) -> Path:
+        """Write the counts as collapsed stacks (flamegraph input)."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def top_functions(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Functions by samples on top of the stack (self time)."""
+
+        leaves = Counter()
+        for stack, count in self.counts.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(limit)
+
+
+def _short_path(filename: str) -> str:
+    """Path relative to the project, site-packages or the standard library."""
+
+    for root in (str(project_root) + "/", "site-packages/", sysconfig.get_paths()["stdlib"] + "/"):
+        if root in filename:
+            return filename.split(root, 1)[1]
+    return filename
+
+
+def _frame_label(code) -> str:
+    """'function (file:line)' for a stack frame's code object."""
+    return f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+class MemoryProfiler:
+    """tracemalloc snapshots at named checkpoints."""
+
+    def __init__(self, top: int = TOP_SITES):
+        self.top = top
+        # (label, current bytes, peak bytes since previous, top growing sites)
+        self.checkpoints = []
+        self._snapshot = None
+
+    def start(self):
+        tracemalloc.start()
+        self._filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+        self._snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def checkpoint(self, label: str):
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+
+        # Only the latest snapshot is kept, so profiling memory stays bounded
+        growth = [stat for stat in snapshot.compare_to(self._snapshot, "lineno") if stat.size_diff >= MIN_SITE_BYTES]
+        self._snapshot = snapshot
+        self.checkpoints.append((label, current, peak, growth[:self.top]))
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        tracemalloc.stop()
+
+    def report(self):
+        """Print memory per checkpoint, the peak, and top growing allocation sites."""
+
+        from rich.table import Table
+
+        table = Table(title="Memory by checkpoint (tracemalloc)")
+        table.add_column("Checkpoint", style="cyan")
+        table.add_column("Traced (MB)", justify="right", style="green")
+        table.add_column("Δ (MB)", justify="right")
+        table.add_column("Peak since previous (MB)", justify="right", style="yellow")
+
+        previous = 0
+        for label, current, peak, _ in self.checkpoints:
+            table.add_row(label, _mb(current), f"{(current - previous) / 1024 ** 2:+,.1f}", _mb(peak))
+            previous = current
+        console.print(table)
+
+        peak_label, _, peak, _ = max(self.checkpoints, key=lambda checkpoint: checkpoint[2])
+        console.print(f"Peak traced memory: [bold]{_mb(peak)} MB[/bold] (in the step ending at '{peak_label}')")
+
+        for label, _, _, growth in self.checkpoints:
+            if not growth:
+                continue
+            console.print(f"\n[bold]Top allocation growth → {label}[/bold]")
+            for stat in growth:
+                frame = stat.traceback[0]
+                console.print(
+                    f"  {stat.size_diff / 1024 ** 2:+8.1f} MB  {stat.count_diff:+10,} blocks  "
+                    f"{_short_path(frame.filename)}:{frame.lineno}"
+                )
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 ** 2:,.1f}"
+
+
+def checkpoint(label: str):
+    """Memory snapshot at a stage boundary (no-op unless --profile mem)."""
+
+    if _memory_profiler is not None:
+        _memory_profiler.checkpoint(label)
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Add --profile / --profile-output to a CLI."""
+
+    parser.add_argument(
+        "--profile", choices=PROFILE_MODES,
+        help="cpu: sampled collapsed stacks (flamegraph input); mem: tracemalloc report per stage"
+    )
+    parser.add_argument(
+        "--profile-output", type=Path, metavar="PATH",
+        help=f"Collapsed-stack file for --profile cpu (default: {PROFILE_DIR.relative_to(project_root)}/<cli>-<time>.collapsed)"
+    )
+
+
+@contextmanager
+def profile(mode: str, name: str, output: Path = None):
+    """
+    Profile the block (does nothing if mode is None).
+
+    Args:
+        mode: cpu, mem or None
+        name: CLI name, used in the default output file name
+        output: Collapsed-stack file for cpu mode
+    """
+
+    global _memory_profiler
+
+    if mode is None:
+        yield
+        return
+
+    if mode == "cpu":
+        profiler = SamplingProfiler()
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            path = output or PROFILE_DIR / f"{name}-{datetime.now().strftime('%Y%m%dT%H%M%S')}.collapsed"
+            profiler.write_collapsed(path)
+            _print_cpu_summary(profiler, time.perf_counter() - start, path)
+        return
+
+    profiler = MemoryProfiler()
+    profiler.start()
+    _memory_profiler = profiler
+    try:
+        yield
+    finally:
+        profiler.checkpoint("end")
+        _memory_profiler = None
+        profiler.stop()
+        profiler.report()
+
+
+def _print_cpu_summary(profiler: SamplingProfiler, seconds: float, path: Path):
+    from rich.table import Table
+
+    table = Table(title=f"Wall-clock samples: {profiler.samples:,} over {seconds:.1f}s (top of stack)")
+    table.add_column("Function", style="cyan")
+    table.add_column("Samples", justify="right", style="yellow")
+    table.add_column("%", justify="right")
+
+    total = sum(profiler.counts.values()) or 1
+    for label, count in profiler.top_functions():
+        table.add_row(label, f"{count:,}", f"{count / total:.1%}")
+    console.print(table)
+
+    console.print(f"[green]✓ Collapsed stacks: {path}[/green] (flamegraph.pl {path.name} > flame.svg, or open in speedscope)")
@@ -0,0 +1,184 @@
+"""
+Per-source API rate limiting shared by every caller on the host.
+
+Each source (admob, adjust) has one token bucket whose state lives in
+.state/ratelimit/<source>.json and is only read or changed under an
+exclusive flock on that file, so collector threads, run_pipeline.py jobs,
+the daemon and ad-hoc backfills in other processes draw from the same
+budget. A request takes a token (waiting for one if the bucket is empty)
+before it is sent.
+
+The rate adapts (AIMD): every successful request adds 2% of the source's
+ceiling, a 429 halves it and pauses the source for Retry-After (or a
+default backoff). The rate settles just under the point where the API
+starts throttling. Rate and pause are kept across runs.
+
+Ceilings (requests/sec) can be set per host with ADMOB_RATE_LIMIT /
+ADJUST_RATE_LIMIT, e.g. to leave quota for another host.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import fcntl
+import threading
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+
+RATE_LIMIT_DIR = project_root / ".state" / "ratelimit"
+
+# Source → starting rate and ceiling (requests/sec) and burst size (tokens)
+RATE_LIMITS = {
+    "admob": {"rate": 1.0, "max_rate": 5.0, "burst": 2},
+    "adjust": {"rate": 2.0, "max_rate": 10.0, "burst": 4},
+}
+
+INCREASE = 0.02  # additive increase per success, as a share of the ceiling
+DECREASE = 0.5  # multiplicative decrease per 429
+MIN_RATE_SHARE = 0.02  # floor, as a share of the ceiling
+DEFAULT_BACKOFF = 5.0  # pause (seconds) after a 429 without Retry-After
+MAX_PAUSE = 300.0  # cap on a Retry-After pause
+THROTTLE_RETRIES = 5  # 429 retries per request before giving up
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    """Adaptive token bucket for one source, stored in a file-locked JSON state file."""
+
+    def __init__(self, source: str, rate: float, max_rate: float, burst: int, state_dir: Path = RATE_LIMIT_DIR):
+        self.source = source
+        self.max_rate = max_rate
+        self.min_rate = max_rate * MIN_RATE_SHARE
+        self.start_rate = min(rate, max_rate)
+        self.burst = burst
+        self.path = state_dir / f"{source}.json"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available.
+
+        Returns:
+            Seconds waited
+        """
+
+        waited = 0.0
+        while True:
+            with self._state() as state:
+                now = time.time()
+                wait = state["paused_until"] - now
+                if wait <= 0:
+                    if state["tokens"] >= 1:
+                        state["tokens"] -= 1
+                        return waited
+                    wait = (1 - state["tokens"]) / state["rate"]
+
+            time.sleep(wait)
+            waited += wait
+
+    def succeeded(self):
+        """Additive increase after a request that was not throttled."""
+
+        with self._state() as state:
+            state["rate"] = min(self.max_rate, state["rate"] + INCREASE * self.max_rate)
+
+    def throttled(self, retry_after: float = None) -> float:
+        """
+        Multiplicative decrease and a pause for every caller after a 429.
+
+        Returns:
+            Seconds until requests resume
+        """
+
+        pause = min(retry_after if retry_after is not None else DEFAULT_BACKOFF, MAX_PAUSE)
+        with self._state() as state:
+            now = time.time()
+            state["rate"] = max(self.min_rate, state["rate"] * DECREASE)
+            state["tokens"] = 0.0
+            state["paused_until"] = max(state["paused_until"], now + pause)
+            state["throttles"] += 1
+            return state["paused_until"] - now
+
+    def snapshot(self) -> dict:
+        """Current state (rate, tokens, paused_until, throttles)."""
+
+        with self._state() as state:
+            return dict(state)
+
+    def _state(self):
+        return _LockedState(self)
+
+
+class _LockedState:
+    """Context manager: exclusive flock, refilled state in, state written back out."""
+
+    def __init__(self, limiter: RateLimiter):
+        self.limiter = limiter
+
+    def __enter__(self) -> dict:
+        limiter = self.limiter
+        # Separate open() per use: flock then also excludes other threads
+        self.file = open(limiter.path, "a+")
+        fcntl.flock(self.file, fcntl.LOCK_EX)
+
+        self.file.seek(0)
+        try:
+            state = json.loads(self.file.read())
+        except ValueError:
+            state = {}
+
+        now = time.time()
+        rate = min(max(state.get("rate", limiter.start_rate), limiter.min_rate), limiter.max_rate)
+        elapsed = max(now - state.get("updated", now), 0.0)
+        self.state = {
+            "rate": rate,
+            "tokens": min(limiter.burst, state.get("tokens", limiter.burst) + elapsed * rate),
+            "paused_until": state.get("paused_until", 0.0),
+            "throttles": state.get("throttles", 0),
+        }
+        return self.state
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self.state["updated"] = time.time()
+            self.file.seek(0)
+            self.file.truncate()
+            self.file.write(json.dumps(self.state))
+            self.file.flush()
+        finally:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+            self.file.close()
+
+
+def get_limiter(source: str) -> RateLimiter:
+    """Shared limiter for a source (one instance per process)."""
+
+    with _limiters_lock:
+        if source not in _limiters:
+            config = dict(RATE_LIMITS[source])
+            ceiling = os.getenv(f"{source.upper()}_RATE_LIMIT")
+            if ceiling:
+                config["max_rate"] = float(ceiling)
+            _limiters[source] = RateLimiter(source, **config)
+        return _limiters[source]
+
+
+def parse_retry_after(value) -> float | None:
+    """Retry-After header (delay seconds or HTTP date) as seconds, or None."""
+
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,200 @@
+"""
+Adaptive sharding of AdMob mediation report requests.
+
+A report covers APP × DATE × COUNTRY × PLATFORM × FORMAT × AD_UNIT for a
+date range, so a busy account or a long backfill range can produce a
+response large enough to time out or come back 5xx. Before fetching, the
+request is planned as shards from the rows per day each app and platform
+returned in earlier runs (.state/admob_report_sizes.json, per publisher):
+a shard estimated above TARGET_ROWS is split until every shard fits.
+
+Splits are tried in order: halve the date range, filter by PLATFORM, then
+split the apps into two groups of similar size. Apps are only split on
+when the account's app inventory is known (apps.list plus apps seen in
+earlier responses), since dimension filters can only include values and
+an app missing from every group would be dropped. The same splits are
+used when a shard keeps failing. Without history a request is one shard.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+
+HISTORY_FILE = project_root / ".state" / "admob_report_sizes.json"
+
+TARGET_ROWS = 50_000  # estimated rows above which a shard is split
+PLATFORMS = ["Android", "iOS"]
+
+_history_lock = threading.Lock()
+
+
+def shard_label(shard: dict) -> str:
+    """Short description for logs and spans, e.g. '2025-01-01:2025-01-07 iOS 3 apps'."""
+
+    parts = [f"{shard['start']}:{shard['end']}"]
+    filters = shard["filters"]
+    if "PLATFORM" in filters:
+        parts.append(",".join(filters["PLATFORM"]))
+    if "APP" in filters:
+        parts.append(f"{len(filters['APP'])} apps")
+    return " ".join(parts)
+
+
+def shard_days(shard: dict) -> int:
+    """Days in the shard's date range."""
+
+    return (date.fromisoformat(shard["end"]) - date.fromisoformat(shard["start"])).days + 1
+
+
+def report_filters(shard: dict) -> list:
+    """The shard's filters as report spec dimension_filters."""
+
+    return [
+        {"dimension": dimension, "matches_any": {"values": values}}
+        for dimension, values in shard["filters"].items()
+    ]
+
+
+def _matching_sizes(shard: dict, sizes: dict) -> dict:
+    """{(app, platform): rows per day} for the apps and platforms the shard covers."""
+
+    apps = shard["filters"].get("APP")
+    platforms = shard["filters"].get("PLATFORM")
+    matching = {}
+    for key, rows in sizes.items():
+        app, platform = key.split("|", 1)
+        if (apps is None or app in apps) and (platforms is None or platform in platforms):
+            matching[(app, platform)] = rows
+    return matching
+
+
+def estimate_rows(shard: dict, sizes: dict) -> float | None:
+    """Estimated response rows for a shard, or None without history."""
+
+    if not sizes:
+        return None
+    return shard_days(shard) * sum(_matching_sizes(shard, sizes).values())
+
+
+def split_shard(shard: dict, apps: dict | None, sizes: dict = None) -> list:
+    """
+    Split a shard in two or more smaller shards.
+
+    Args:
+        shard: {start, end, filters}
+        apps: Account app inventory {app ID: platform}, or None if unknown
+        sizes: Rows per day history (balances app groups)
+
+    Returns:
+        Shards covering the same rows ([] if the shard can't be split)
+    """
+
+    filters = shard["filters"]
+
+    days = shard_days(shard)
+    if days > 1:
+        start = date.fromisoformat(shard["start"])
+        middle = start + timedelta(days=days // 2 - 1)
+        return [
+            {**shard, "end": middle.isoformat()},
+            {**shard, "start": (middle + timedelta(days=1)).isoformat()},
+        ]
+
+    if "PLATFORM" not in filters:
+        return [{**shard, "filters": {**filters, "PLATFORM": [platform]}} for platform in PLATFORMS]
+
+    if not apps:
+        return []
+
+    platforms = filters["PLATFORM"]
+    candidates = filters.get("APP") or sorted(app for app, platform in apps.items() if platform in platforms)
+    if len(candidates) < 2:
+        return []
+
+    # Largest apps first, each to the lighter group
+    app_rows = {}
+    for (app, _), rows in _matching_sizes(shard, sizes or {}).items():
+        app_rows[app] = app_rows.get(app, 0) + rows
+    groups = [[], []]
+    totals = [0.0, 0.0]
+    for app in sorted(candidates, key=lambda app: app_rows.get(app, 0), reverse=True):
+        lighter = min((0, 1), key=lambda group: (totals[group], len(groups[group])))
+        groups[lighter].append(app)
+        totals[lighter] += app_rows.get(app, 0)
+
+    return [{**shard, "filters": {**filters, "APP": sorted(group)}} for group in groups]
+
+
+def plan_shards(shard: dict, sizes: dict, apps: dict | None, target: int = TARGET_ROWS) -> list:
+    """Split a request until every shard's estimate is at most target rows."""
+
+    estimate = estimate_rows(shard, sizes)
+    if estimate is None or estimate <= target:
+        return [shard]
+
+    parts = split_shard(shard, apps, sizes)
+    if not parts:
+        return [shard]
+
+    return [planned for part in parts for planned in plan_shards(part, sizes, apps, target)]
+
+
+def load_sizes(publisher_id: str, path: Path = HISTORY_FILE) -> dict:
+    """Rows per day by 'app|platform' from earlier runs ({} if none)."""
+
+    try:
+        return json.loads(path.read_text()).get(publisher_id, {})
+    except (OSError, ValueError):
+        return {}
+
+
+def record_sizes(publisher_id: str, responses: list, days: int, path: Path = HISTORY_FILE):
+    """
+    Save rows per day by app and platform from a complete report.
+
+    Args:
+        publisher_id: Publisher ID
+        responses: mediationReport.generate responses covering every app and platform
+        days: Days the responses cover
+    """
+
+    counts = {}
+    for response in responses:
+        for item in response[1:]:
+            if "row" in item:
+                dim = item["row"].get("dimensionValues", {})
+                key = f"{dim.get('APP', {}).get('value')}|{dim.get('PLATFORM', {}).get('value')}"
+                counts[key] = counts.get(key, 0) + 1
+
+    if not counts:
+        return
+
+    with _history_lock:
+        try:
+            history = json.loads(path.read_text())
+        except (OSError, ValueError):
+            history = {}
+        history[publisher_id] = {key: round(rows / max(days, 1), 1) for key, rows in counts.items()}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(history, indent=2, sort_keys=True))
+        os.replace(tmp_path, path)
+
+
+def known_apps(apps: dict | None, sizes: dict) -> dict | None:
+    """App inventory {app ID: platform}: apps.list plus apps seen in the history."""
+
+    if apps is None:
+        return None
+    inventory = dict(apps)
+    for key in sizes:
+        app, platform = key.split("|", 1)
+        inventory.setdefault(app, platform)
+    return inventory
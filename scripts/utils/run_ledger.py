@@ -0,0 +1,268 @@
+"""
+Pipeline run ledger: one record per job run in OPS.PIPELINE_RUNS.
+
+Each record holds the run ID, job, source, partitions (date window loaded),
+rows, batch bytes, per-stage wall time, rows/sec, retries, peak RSS and
+outcome. A run's records are written in one batched INSERT after its jobs
+finish. If Snowflake is unreachable they go to a local SQLite file
+(.state/pipeline_runs.db) instead, and are flushed to Snowflake with the
+next successful write, so the ledger has no gaps from warehouse outages.
+
+scripts/maintenance/pipeline_runs_report.py charts the trends.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .console import console
+from .profiling import checkpoint
+from .tracing import span
+
+# sqlite3 is imported where first used (only on the fallback path)
+if TYPE_CHECKING:
+    import sqlite3
+
+    import pandas as pd
+
+project_root = Path(__file__).parent.parent.parent
+
+LEDGER_TABLE = "PIPELINE_RUNS"
+LOCAL_LEDGER = project_root / ".state" / "pipeline_runs.db"
+
+# OPS.PIPELINE_RUNS columns, in DDL order (SQLite adds SYNCED)
+LEDGER_COLUMNS = [
+    "RUN_ID", "RUNNER", "JOB_NAME", "SOURCE", "STARTED_AT", "PARTITIONS",
+    "ROWS_LOADED", "BATCH_BYTES", "STAGE_SECONDS", "TOTAL_SECONDS",
+    "ROWS_PER_SECOND", "RETRIES", "PEAK_RSS_MB", "STATUS", "ERROR",
+]
+
+
+class StageTimer:
+    """
+    Wall-clock timings per named pipeline stage.
+
+    Each stage is also a tracing span and, under --profile mem, ends with a
+    memory checkpoint.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        # Run facts for the ledger (bytes, retries, partitions)
+        self.metrics = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block and add it to the named stage."""
+
+        start = time.perf_counter()
+        try:
+            with span(f"stage.{name}"):
+                yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+            checkpoint(f"after {name}")
+
+    def record(self, **metrics):
+        """Record run facts; numeric values add up across calls."""
+
+        for name, value in metrics.items():
+            if isinstance(value, (int, float)) and name in self.metrics:
+                value += self.metrics[name]
+            self.metrics[name] = value
+
+
+def new_run_id() -> str:
+    """Run ID shared by all job records of one runner invocation or tick."""
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+def utc_now() -> str:
+    """Current UTC time as TIMESTAMP_NTZ text."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def batch_bytes(df: pd.DataFrame) -> int:
+    """In-memory size of a fetched batch (strings included)."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def format_partitions(touched: dict) -> str:
+    """{RAW table: [start, end]} → 'TABLE:start..end' (comma-separated)."""
+    return ",".join(f"{table}:{start}..{end}" for table, (start, end) in sorted(touched.items()))
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (MB; None if unknown)."""
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def build_record(run_id: str, runner: str, result: dict) -> dict:
+    """
+    Ledger record from one job result (run_pipeline.run_job shape).
+
+    Args:
+        run_id: new_run_id() of the invocation
+        runner: What ran the job (pipeline, daemon, cli)
+        result: {name, source, rows, status, error, stages, seconds,
+            started_at, metrics}
+    """
+
+    metrics = result.get("metrics", {})
+    seconds = result["seconds"]
+
+    return {
+        "RUN_ID": run_id,
+        "RUNNER": runner,
+        "JOB_NAME": result["name"],
+        "SOURCE": result["source"],
+        "STARTED_AT": result.get("started_at") or utc_now(),
+        "PARTITIONS": metrics.get("partitions"),
+        "ROWS_LOADED": int(result["rows"]),
+        "BATCH_BYTES": metrics.get("bytes"),
+        "STAGE_SECONDS": json.dumps({name: round(value, 3) for name, value in result["stages"].items()}),
+        "TOTAL_SECONDS": round(seconds, 3),
+        "ROWS_PER_SECOND": round(result["rows"] / seconds, 1) if seconds > 0 else None,
+        "RETRIES": int(metrics.get("retries", 0)),
+        "PEAK_RSS_MB": peak_rss_mb(),
+        "STATUS": result["status"],
+        "ERROR": (result.get("error") or None) and str(result["error"])[:1000],
+    }
+
+
+def record_runs(records: list[dict], pool=None, local_path: Path = LOCAL_LEDGER) -> str:
+    """
+    Append run records to OPS.PIPELINE_RUNS (SQLite fallback).
+
+    Records left in SQLite by earlier failed writes are sent in the same
+    INSERT and then marked synced.
+
+    Args:
+        records: build_record() dicts
+        pool: SnowflakeClientPool to borrow a connection from (left open);
+            an OPS client is created and closed if not given
+        local_path: SQLite fallback file
+
+    Returns:
+        Where the records went: "snowflake" or "sqlite"
+    """
+
+    if not records:
+        return "snowflake"
+
+    pending = read_local(local_path, unsynced_only=True)
+
+    try:
+        _insert(pending + records, pool)
+
+    except Exception as e:
+        console.print(f"[yellow]⚠ Run ledger: Snowflake write failed ({e}); saved to {local_path.name}[/yellow]")
+        write_local(records, local_path)
+        return "sqlite"
+
+    if pending:
+        mark_synced([record["RUN_ID"] for record in pending], local_path)
+        console.print(f"[cyan]✓ Run ledger: flushed {len(pending)} locally saved record(s)[/cyan]")
+
+    return "snowflake"
+
+
+def record_cli_run(
+    job_name: str,
+    source: str,
+    timer: StageTimer,
+    started_at: str,
+    seconds: float,
+    rows: int,
+    error: str = None
+) -> str:
+    """Record a standalone collector CLI run (runner "cli")."""
+
+    result = {
+        "name": job_name, "source": source, "rows": rows,
+        "status": "failed" if error else "ok", "error": error,
+        "stages": timer.stages, "metrics": timer.metrics,
+        "started_at": started_at, "seconds": seconds,
+    }
+    return record_runs([build_record(new_run_id(), "cli", result)])
+
+
+def _insert(records: list[dict], pool=None):
+    """One batched INSERT into OPS.PIPELINE_RUNS (connection errors raise too)."""
+
+    if pool is not None:
+        with pool.acquire() as client:
+            return client.insert_rows(LEDGER_TABLE, records, schema="OPS")
+
+    from .snowflake_client import get_snowflake_client
+
+    with get_snowflake_client(schema="OPS") as client:
+        return client.insert_rows(LEDGER_TABLE, records)
+
+
+def _connect_local(local_path: Path) -> sqlite3.Connection:
+    import sqlite3
+
+    local_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(local_path)
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {LEDGER_TABLE.lower()} "
+        f"({', '.join(LEDGER_COLUMNS)}, SYNCED INTEGER DEFAULT 0)"
+    )
+    return conn
+
+
+def write_local(records: list[dict], local_path: Path = LOCAL_LEDGER):
+    """Append run records to the SQLite ledger (unsynced)."""
+
+    with _connect_local(local_path) as conn:
+        conn.executemany(
+            f"INSERT INTO {LEDGER_TABLE.lower()} ({', '.join(LEDGER_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in LEDGER_COLUMNS)})",
+            [[record[col] for col in LEDGER_COLUMNS] for record in records]
+        )
+    conn.close()
+
+
+def read_local(local_path: Path = LOCAL_LEDGER, unsynced_only: bool = False) -> list[dict]:
+    """Run records in the SQLite ledger (oldest first)."""
+
+    if not local_path.exists():
+        return []
+
+    conn = _connect_local(local_path)
+    try:
+        rows = conn.execute(
+            f"SELECT {', '.join(LEDGER_COLUMNS)} FROM {LEDGER_TABLE.lower()}"
+            f"{' WHERE SYNCED = 0' if unsynced_only else ''} ORDER BY STARTED_AT"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [dict(zip(LEDGER_COLUMNS, row)) for row in rows]
+
+
+def mark_synced(run_ids: list[str], local_path: Path = LOCAL_LEDGER):
+    """Mark locally saved runs as written to Snowflake."""
+
+    with _connect_local(local_path) as conn:
+        conn.executemany(
+            f"UPDATE {LEDGER_TABLE.lower()} SET SYNCED = 1 WHERE RUN_ID = ?",
+            [(run_id,) for run_id in set(run_ids)]
+        )
+    conn.close()
@@ -5,15 +5,46 @@ Provides reusable connection and data loading functions following
 M01W03 lab pattern.
 """
 
-from typing import Optional
-import pandas as pd
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
-import snowflake.connector
-from snowflake.connector.pandas_tools import write_pandas
-from rich.console import Console
+from __future__ import annotations
 
-console = Console()
+import os
+import queue
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from .console import console
+from .tracing import current_span, span, traced
+
+# pandas, cryptography and snowflake.connector are imported where first
+# used, so importing this module (and CLI --help) stays fast
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Snowflake error codes for a session that no longer exists or has expired
+SESSION_EXPIRED_ERRNOS = {390111, 390112, 390114}
+
+
+@lru_cache(maxsize=None)
+def load_private_key_der(private_key_path: str) -> bytes:
+    """Load a PEM private key once per process and return it as DER bytes."""
+
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.backends import default_backend
+
+    with open(private_key_path, 'rb') as key_file:
+        private_key = serialization.load_pem_private_key(
+            key_file.read(),
+            password=None,
+            backend=default_backend()
+        )
+
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
 
 
 class SnowflakeClient:
@@ -27,9 +58,15 @@ class SnowflakeClient:
         database: str = 'DB_T34',
         schema: str = 'RAW',
         role: str = 'RL_T34',
-        private_key_path: str = '/Users/lehongthai/.snowflake/keys/rsa_key.p8'
+        private_key_path: str = '/Users/lehongthai/.snowflake/keys/rsa_key.p8',
+        keep_alive: bool = False
     ):
-        """Initialize Snowflake client with JWT authentication."""
+        """
+        Initialize Snowflake client with JWT authentication.
+
+        keep_alive sets client_session_keep_alive, so a connection held
+        open across idle periods (the daemon's pool) isn't expired.
+        """
 
         self.account = account
         self.user = user
@@ -38,6 +75,7 @@ class SnowflakeClient:
         self.schema = schema
         self.role = role
         self.private_key_path = private_key_path
+        self.keep_alive = keep_alive
         self.connection = None
 
     def connect(self):
@@ -46,29 +84,22 @@ class SnowflakeClient:
         if self.connection is not None:
             return self.connection
 
-        # Load private key
-        with open(self.private_key_path, 'rb') as key_file:
-            private_key = serialization.load_pem_private_key(
-                key_file.read(),
-                password=None,
-                backend=default_backend()
-            )
+        with span("snowflake.connect", account=self.account, warehouse=self.warehouse, schema=self.schema):
+            # Load private key (parsed once per process)
+            pkb = load_private_key_der(self.private_key_path)
 
-        pkb = private_key.private_bytes(
-            encoding=serialization.Encoding.DER,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
-        )
+            import snowflake.connector
 
-        self.connection = snowflake.connector.connect(
-            account=self.account,
-            user=self.user,
-            private_key=pkb,
-            warehouse=self.warehouse,
-            database=self.database,
-            schema=self.schema,
-            role=self.role
-        )
+            self.connection = snowflake.connector.connect(
+                account=self.account,
+                user=self.user,
+                private_key=pkb,
+                warehouse=self.warehouse,
+                database=self.database,
+                schema=self.schema,
+                role=self.role,
+                client_session_keep_alive=self.keep_alive
+            )
 
         console.print(f"[green]✓ Connected to Snowflake: {self.database}.{self.schema}[/green]")
         return self.connection
@@ -80,6 +111,17 @@ class SnowflakeClient:
             self.connection = None
             console.print("[cyan]✓ Snowflake connection closed[/cyan]")
 
+    def reset(self):
+        """Drop a lost or expired connection; the next connect() opens a new session."""
+
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    @traced("snowflake.load_dataframe")
     def load_dataframe(
         self,
         df: pd.DataFrame,
@@ -108,6 +150,10 @@ class SnowflakeClient:
         console.print(f"  Rows: {len(df):,}")
         console.print(f"  Columns: {len(df.columns)}")
 
+        from snowflake.connector.pandas_tools import write_pandas
+
+        current_span().set(table=table_name, rows=len(df), bytes=int(df.memory_usage().sum()))
+
         try:
             # Use Snowflake's write_pandas for efficient bulk loading
             success, nchunks, nrows, _ = write_pandas(
@@ -121,6 +167,8 @@ class SnowflakeClient:
                 overwrite=False  # Append mode
             )
 
+            current_span().set(rows_loaded=nrows, chunks=nchunks)
+
             if success:
                 console.print(f"[green]✓ Loaded {nrows:,} rows in {nchunks} chunks[/green]")
                 return nrows
@@ -132,6 +180,190 @@ class SnowflakeClient:
             console.print(f"[red]✗ Error loading data: {str(e)}[/red]")
             raise
 
+    @traced("snowflake.insert_rows")
+    def insert_rows(self, table_name: str, rows: list[dict], schema: str = None) -> int:
+        """
+        Insert a few rows with one batched INSERT.
+
+        For small appends (ledger records) where write_pandas' stage and
+        COPY round trips would dominate. executemany sends the rows as a
+        single multi-row INSERT.
+
+        Args:
+            table_name: Target table name (without schema)
+            rows: Dicts with the same keys (column names)
+            schema: Target schema (default: the client's schema)
+
+        Returns:
+            Number of rows inserted
+        """
+
+        if not rows:
+            return 0
+
+        if not self.connection:
+            self.connect()
+
+        columns = list(rows[0])
+        target = f"{self.database}.{schema or self.schema}.{table_name}"
+        current_span().set(table=target, rows=len(rows))
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(
+                f"INSERT INTO {target} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(f'%({col})s' for col in columns)})",
+                rows
+            )
+            return cursor.rowcount
+
+        finally:
+            cursor.close()
+
+    @traced("snowflake.merge_dataframe")
+    def merge_dataframe(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        keys: list[str],
+        timestamp_column: Optional[str] = 'LOADED_AT',
+        hash_column: Optional[str] = 'ROW_HASH'
+    ) -> int:
+        """
+        Upsert pandas DataFrame into a table on its key columns.
+
+        The frame is written to a temporary table, then MERGEd: matched keys
+        are updated, new keys inserted, all other rows left untouched. When
+        the frame carries a row hash, matched rows with an unchanged hash
+        are skipped too (no rewrite, LOADED_AT kept).
+
+        Args:
+            df: pandas DataFrame (column names match the table)
+            table_name: Target table name (without schema)
+            keys: Key columns to match on
+            timestamp_column: Set to CURRENT_TIMESTAMP() on insert and
+                update (None to skip)
+            hash_column: Row fingerprint column compared before updating
+                (ignored if the frame has no such column)
+
+        Returns:
+            Number of rows inserted or updated
+        """
+
+        if not self.connection:
+            self.connect()
+
+        console.print(f"\n[cyan]Merging into {self.schema}.{table_name}:[/cyan]")
+        console.print(f"  Rows: {len(df):,}")
+
+        from snowflake.connector.pandas_tools import write_pandas
+
+        target = f"{self.database}.{self.schema}.{table_name}"
+        staging = f"{table_name}_STAGE_{uuid.uuid4().hex[:8].upper()}"
+        columns = [col for col in df.columns if col != timestamp_column]
+        updates = [col for col in columns if col not in keys]
+
+        set_clause = [f"t.{col} = s.{col}" for col in updates]
+        # Rows stored before the hash existed have NULL and are updated once
+        matched = f"MATCHED AND t.{hash_column} IS DISTINCT FROM s.{hash_column}" if hash_column in columns else "MATCHED"
+        insert_columns = list(columns)
+        insert_values = [f"s.{col}" for col in columns]
+        if timestamp_column:
+            set_clause.append(f"t.{timestamp_column} = CURRENT_TIMESTAMP()")
+            insert_columns.append(timestamp_column)
+            insert_values.append("CURRENT_TIMESTAMP()")
+
+        cursor = self.connection.cursor()
+        try:
+            write_pandas(
+                conn=self.connection,
+                df=df[columns],
+                table_name=staging,
+                schema=self.schema,
+                database=self.database,
+                auto_create_table=True,
+                table_type='temporary',
+                overwrite=False
+            )
+
+            cursor.execute(
+                f"""
+                MERGE INTO {target} t
+                USING {self.database}.{self.schema}.{staging} s
+                ON {' AND '.join(f"t.{key} = s.{key}" for key in keys)}
+                WHEN {matched} THEN UPDATE SET {', '.join(set_clause)}
+                WHEN NOT MATCHED THEN INSERT ({', '.join(insert_columns)})
+                VALUES ({', '.join(insert_values)})
+                """
+            )
+            # (rows inserted, rows updated)
+            inserted, updated = cursor.fetchone()[:2]
+            current_span().set(table=table_name, rows=len(df), inserted=inserted, updated=updated)
+            console.print(f"[green]✓ Merged into {table_name}: {inserted:,} inserted, {updated:,} updated[/green]")
+            return inserted + updated
+
+        except Exception as e:
+            console.print(f"[red]✗ Error merging into {table_name}: {str(e)}[/red]")
+            raise
+
+        finally:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.database}.{self.schema}.{staging}")
+            cursor.close()
+
+    @traced("snowflake.load_parquet")
+    def load_parquet(self, path, table_name: str) -> int:
+        """
+        Load a local Parquet file into a table (PUT to table stage + COPY).
+
+        Skips write_pandas' re-serialization when the batch is already on
+        disk (e.g. spooled). COPY load metadata ignores a file name it has
+        already loaded into the table, so re-running after a crash between
+        load and commit does not duplicate rows.
+
+        Args:
+            path: Local Parquet file (column names match the table)
+            table_name: Target table name (without schema)
+
+        Returns:
+            Number of rows loaded
+        """
+
+        if not self.connection:
+            self.connect()
+
+        path = str(path)
+        stage = f"@{self.database}.{self.schema}.%{table_name}"
+        file_name = path.rsplit('/', 1)[-1]
+        current_span().set(table=table_name, file=file_name, bytes=os.path.getsize(path))
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"PUT 'file://{path}' {stage} AUTO_COMPRESS=FALSE OVERWRITE=TRUE")
+            cursor.execute(
+                f"""
+                COPY INTO {self.database}.{self.schema}.{table_name}
+                FROM {stage}
+                FILES = ('{file_name}')
+                FILE_FORMAT = (TYPE = PARQUET)
+                MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+                PURGE = TRUE
+                """
+            )
+            # One result row per file: (file, status, rows_parsed, rows_loaded, ...)
+            results = cursor.fetchall()
+            nrows = sum(int(row[3] or 0) for row in results if len(row) > 3)
+            current_span().set(rows=nrows)
+            console.print(f"[green]✓ Loaded {nrows:,} rows from {file_name}[/green]")
+            return nrows
+
+        except Exception as e:
+            console.print(f"[red]✗ Error loading {file_name}: {str(e)}[/red]")
+            raise
+
+        finally:
+            cursor.close()
+
+    @traced("snowflake.execute_query")
     def execute_query(self, query: str) -> pd.DataFrame:
         """
         Execute SQL query and return results as DataFrame.
@@ -146,10 +378,15 @@ class SnowflakeClient:
         if not self.connection:
             self.connect()
 
+        query_span = current_span()
+        if query_span.recording:
+            query_span.set(statement=" ".join(query.split())[:200])
+
         cursor = self.connection.cursor()
         try:
             cursor.execute(query)
             df = cursor.fetch_pandas_all()
+            query_span.set(rows=len(df), query_id=cursor.sfqid)
             return df
         finally:
             cursor.close()
@@ -182,6 +419,8 @@ class SnowflakeClient:
         FROM {self.schema}.{table_name}
         """
 
+        import pandas as pd
+
         try:
             df = self.execute_query(query)
             max_ts = df['MAX_TS'].iloc[0]
@@ -199,6 +438,78 @@ class SnowflakeClient:
         self.close()
 
 
+class SnowflakeClientPool:
+    """
+    Fixed-size pool of SnowflakeClient connections.
+
+    Lets concurrent pipeline stages share connections (and one private key
+    parse) instead of each opening and closing its own session. Connections
+    are opened lazily on first use and kept until close(). A connection
+    found closed, or that fails with a connection or session-expired error,
+    is dropped and reopened on its next use.
+    """
+
+    def __init__(self, size: int = 2, **kwargs):
+        """
+        Initialize pool.
+
+        Args:
+            size: Maximum number of open connections
+            **kwargs: Passed to each SnowflakeClient
+        """
+
+        self.size = size
+        self._clients = [SnowflakeClient(**kwargs) for _ in range(size)]
+        self._available = queue.Queue()
+        for client in self._clients:
+            self._available.put(client)
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connected client; blocks while all are in use."""
+
+        client = self._available.get()
+        try:
+            if client.connection is not None and client.connection.is_closed():
+                client.reset()
+            client.connect()
+            try:
+                yield client
+            except Exception as e:
+                if is_connection_lost(e):
+                    console.print(f"[yellow]⚠ Snowflake session lost ({e}); reconnecting on next use[/yellow]")
+                    client.reset()
+                raise
+        finally:
+            self._available.put(client)
+
+    def close(self):
+        """Close all open connections."""
+        for client in self._clients:
+            client.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+def is_connection_lost(e: Exception) -> bool:
+    """Whether an error means the session is gone (expired, or the connection dropped)."""
+
+    if getattr(e, "errno", None) in SESSION_EXPIRED_ERRNOS:
+        return True
+
+    try:
+        from snowflake.connector.errors import OperationalError
+    except ImportError:
+        return False
+    return isinstance(e, OperationalError)
+
+
 # Convenience function for quick connections
 def get_snowflake_client(**kwargs) -> SnowflakeClient:
     """
@@ -0,0 +1,171 @@
+"""
+Local spool of fetched batches (write-ahead buffer for warehouse loads).
+
+Each batch is written to `.state/spool/<TABLE>/<batch>.parquet` (zstd) with a
+JSON manifest beside it, loaded from that file, and marked committed only
+after the load succeeds. A failed load leaves the batch pending for
+`scripts/replay_spool.py`, so warehouse outages never cost an API refetch.
+
+A batch fanned out to several sinks is committed per sink; it stays pending
+until every sink has loaded it, and replay only reloads the sinks that have
+not.
+
+Manifest fields: id, source, table_name, file, rows, bytes, created_at,
+sinks ({sink: committed_at or null}), status (pending|committed),
+committed_at.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .tracing import current_span, traced
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+project_root = Path(__file__).parent.parent.parent
+
+SPOOL_DIR = project_root / ".state" / "spool"
+
+
+class Spool:
+    """Directory of spooled batches with per-batch JSON manifests."""
+
+    def __init__(self, root: Path = SPOOL_DIR):
+        self.root = Path(root)
+        # Sinks of one batch commit from concurrent threads
+        self._lock = threading.Lock()
+
+    @traced("spool.write")
+    def write(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        source: str,
+        sinks: list[str] = ("snowflake",)
+    ) -> dict:
+        """
+        Spool a batch before loading it.
+
+        The Parquet file is written before its manifest, so a manifest only
+        ever points at a complete file.
+
+        Args:
+            df: Batch exactly as it should be loaded
+            table_name: Target RAW table
+            source: Producing source (admob, adjust)
+            sinks: Destinations that must each commit the batch
+
+        Returns:
+            Manifest dict (status pending)
+        """
+
+        table_dir = self.root / table_name
+        table_dir.mkdir(parents=True, exist_ok=True)
+
+        batch_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        parquet_path = table_dir / f"{batch_id}.parquet"
+
+        # Microsecond timestamps: Snowflake misreads Parquet nanosecond ones
+        df.to_parquet(
+            parquet_path,
+            index=False,
+            compression="zstd",
+            coerce_timestamps="us",
+            allow_truncated_timestamps=True,
+        )
+
+        manifest = {
+            "id": batch_id,
+            "source": source,
+            "table_name": table_name,
+            "file": parquet_path.name,
+            "rows": len(df),
+            "bytes": parquet_path.stat().st_size,
+            "created_at": datetime.now().isoformat(),
+            "sinks": {sink: None for sink in sinks},
+            "status": "pending",
+            "committed_at": None,
+        }
+        self._write_manifest(manifest)
+        current_span().set(table=table_name, rows=manifest["rows"], bytes=manifest["bytes"])
+        return manifest
+
+    def path_for(self, manifest: dict) -> Path:
+        """Parquet path of a spooled batch."""
+        return self.root / manifest["table_name"] / manifest["file"]
+
+    def read(self, manifest: dict) -> pd.DataFrame:
+        """Read a spooled batch back into a DataFrame."""
+
+        import pandas as pd
+
+        return pd.read_parquet(self.path_for(manifest))
+
+    def commit(self, manifest: dict, sink: str = None):
+        """
+        Mark a batch as loaded into one sink (or all sinks if None).
+
+        The batch is committed once every sink has loaded it.
+        """
+
+        with self._lock:
+            now = datetime.now().isoformat()
+            sinks = manifest.setdefault("sinks", {"snowflake": None})
+            for name in ([sink] if sink else list(sinks)):
+                sinks[name] = now
+
+            if all(sinks.values()):
+                manifest["status"] = "committed"
+                manifest["committed_at"] = now
+            self._write_manifest(manifest)
+
+    def pending_sinks(self, manifest: dict) -> list[str]:
+        """Sinks that have not loaded a batch yet."""
+
+        # Manifests written before per-sink tracking had one Snowflake sink
+        sinks = manifest.get("sinks", {"snowflake": manifest.get("committed_at")})
+        return [name for name, committed_at in sinks.items() if committed_at is None]
+
+    def pending(self, table_name: str = None) -> list[dict]:
+        """Uncommitted batches, oldest first."""
+
+        return [m for m in self._manifests(table_name) if m["status"] != "committed"]
+
+    def purge(self, older_than_days: int = 7) -> int:
+        """Delete committed batches older than N days. Returns batches removed."""
+
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        removed = 0
+
+        for manifest in self._manifests():
+            if manifest["status"] != "committed":
+                continue
+            if datetime.fromisoformat(manifest["committed_at"]) >= cutoff:
+                continue
+            self.path_for(manifest).unlink(missing_ok=True)
+            self._manifest_path(manifest).unlink(missing_ok=True)
+            removed += 1
+
+        return removed
+
+    def _manifest_path(self, manifest: dict) -> Path:
+        return self.root / manifest["table_name"] / f"{manifest['id']}.json"
+
+    def _write_manifest(self, manifest: dict):
+        path = self._manifest_path(manifest)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        tmp_path.replace(path)
+
+    def _manifests(self, table_name: str = None) -> list[dict]:
+        if not self.root.exists():
+            return []
+        pattern = f"{table_name}/*.json" if table_name else "*/*.json"
+        return [json.loads(path.read_text()) for path in sorted(self.root.glob(pattern))]
@@ -0,0 +1,117 @@
+"""
+Startup latency profiling for the collector CLIs.
+
+Two views of import cost:
+- Startup: what importing the CLI module costs (paid by every run and
+  `--help`), measured in a fresh interpreter with `python -X importtime`
+- Deferred: what each heavy module costs on first use during a real run,
+  timed in-process
+"""
+
+import os
+import sys
+import time
+import importlib
+import subprocess
+from pathlib import Path
+
+from .console import console
+
+project_root = Path(__file__).parent.parent.parent
+
+
+def measure_module_startup(module_name: str) -> tuple[float, list[tuple[str, float]]]:
+    """
+    Import a module in a fresh interpreter under -X importtime.
+
+    Args:
+        module_name: Dotted module path (e.g. scripts.collect_adjust)
+
+    Returns:
+        (total_ms, [(import, cumulative_ms), ...] sorted slowest first)
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=project_root,
+        env={**os.environ, "PYTHONPATH": str(project_root)},
+        capture_output=True,
+        text=True,
+    )
+
+    # Lines: "import time: <self us> | <cumulative us> | <indent><package>"
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        indent = len(name) - len(name.lstrip())
+        entries.append((indent, name.strip(), int(cumulative) / 1000))
+
+    if not entries:
+        return 0.0, []
+
+    # Top-level imports give the total; their direct children (one indent
+    # level deeper, e.g. what the CLI module itself imports) the breakdown
+    top_indent = min(indent for indent, _, _ in entries)
+    total_ms = sum(ms for indent, _, ms in entries if indent == top_indent)
+    breakdown = [(name, ms) for indent, name, ms in entries if indent <= top_indent + 2]
+
+    return total_ms, sorted(breakdown, key=lambda item: item[1], reverse=True)
+
+
+def measure_deferred_imports(modules: list[str]) -> list[tuple[str, float, str]]:
+    """
+    Time the first import of each deferred module, in order.
+
+    Each time includes only dependencies not already loaded by the modules
+    before it, so the column sums to the total deferred cost.
+
+    Returns:
+        [(module, ms, note), ...]
+    """
+
+    timings = []
+    for module_name in modules:
+        if module_name in sys.modules:
+            timings.append((module_name, 0.0, "already loaded"))
+            continue
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+            note = ""
+        except ImportError as e:
+            note = f"not installed ({e.name})"
+        timings.append((module_name, (time.perf_counter() - start) * 1000, note))
+
+    return timings
+
+
+def print_startup_profile(module_name: str, deferred_modules: list[str], top: int = 10):
+    """Print the startup and deferred import breakdown for a CLI module."""
+
+    # Measure before rich is imported for the output tables
+    total_ms, breakdown = measure_module_startup(module_name)
+    deferred = measure_deferred_imports(deferred_modules)
+
+    from rich.table import Table
+
+    startup_table = Table(title=f"Startup: import {module_name} ({total_ms:.1f} ms)")
+    startup_table.add_column("Import", style="cyan")
+    startup_table.add_column("Cumulative (ms)", justify="right", style="yellow")
+    for name, ms in breakdown[:top]:
+        startup_table.add_row(name, f"{ms:.1f}")
+    console.print(startup_table)
+
+    deferred_table = Table(title="Deferred: first use during a run")
+    deferred_table.add_column("Module", style="cyan")
+    deferred_table.add_column("Import (ms)", justify="right", style="yellow")
+    deferred_table.add_column("Note")
+    for name, ms, note in deferred:
+        deferred_table.add_row(name, f"{ms:.1f}", note)
+    console.print(deferred_table)
+
+    deferred_ms = sum(ms for _, ms, _ in deferred)
+    console.print(f"Startup: [bold]{total_ms:.1f} ms[/bold] | Deferred: [bold]{deferred_ms:.1f} ms[/bold]")
@@ -0,0 +1,296 @@
+"""
+Lightweight tracing spans for pipeline stages.
+
+Spans time a block and carry attributes (rows, bytes, partition, retries,
+...). Each finished span is appended as one JSON line to a local file:
+- jsonl: flat records (trace_id, span_id, parent_id, name, start, duration_ms,
+  status, attributes), easy to read with pandas or jq
+- otlp: one OTLP/JSON ExportTraceServiceRequest per line (the OpenTelemetry
+  file exporter layout), importable by OTLP-aware tools
+
+Tracing is off unless configured (--trace on the CLIs, or PIPELINE_TRACE=<path>
+and optionally PIPELINE_TRACE_SAMPLE / PIPELINE_TRACE_FORMAT). When off,
+span() yields a shared no-op span and traced() calls straight through.
+
+Sampling is decided once per trace (at the root span) and inherited by its
+children, so sampled traces are always complete. Spans nest through
+contextvars; work handed to a thread pool keeps its parent if submitted
+with contextvars.copy_context().run.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import random
+import secrets
+import argparse
+import threading
+import functools
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+
+TRACE_DIR = project_root / ".state" / "traces"
+DEFAULT_TRACE_FILE = TRACE_DIR / "spans.jsonl"
+FORMATS = ("jsonl", "otlp")
+SERVICE_NAME = "mobile-analytics-pipeline"
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation with attributes."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "recording",
+        "attributes", "start_ns", "duration_ns", "status", "error",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: str, recording: bool, attributes: dict):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.recording = recording
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.duration_ns = 0
+        self.status = "ok"
+        self.error = None
+
+    def set(self, **attributes):
+        """Set attributes on the span."""
+        self.attributes.update(attributes)
+
+    def add(self, name: str, amount: int = 1):
+        """Increment a counter attribute (e.g. retries)."""
+        self.attributes[name] = self.attributes.get(name, 0) + amount
+
+    def record_error(self, error: BaseException):
+        """Mark the span failed (for errors that are handled, not raised)."""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+
+class _NoopSpan:
+    """Span stand-in when tracing is off: every call does nothing."""
+
+    recording = False
+
+    def set(self, **attributes):
+        pass
+
+    def add(self, name: str, amount: int = 1):
+        pass
+
+    def record_error(self, error: BaseException):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class FileExporter:
+    """Append finished spans to a local file, one JSON line each (thread-safe)."""
+
+    def __init__(self, path: Path, fmt: str = "jsonl"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown trace format {fmt!r} (expected one of {', '.join(FORMATS)})")
+        self.path = Path(path)
+        self.fmt = fmt
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(self._otlp(span) if self.fmt == "otlp" else self._jsonl(span), default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", buffering=1)
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _jsonl(self, span: Span) -> dict:
+        return {
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "start": datetime.fromtimestamp(span.start_ns / 1e9, tz=timezone.utc).isoformat(),
+            "duration_ms": round(span.duration_ns / 1e6, 3),
+            "status": span.status,
+            "error": span.error,
+            "thread": threading.current_thread().name,
+            "attributes": span.attributes,
+        }
+
+    def _otlp(self, span: Span) -> dict:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.start_ns + span.duration_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+            # STATUS_CODE_OK / STATUS_CODE_ERROR
+            "status": {"code": 1} if span.status == "ok" else {"code": 2, "message": span.error},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+
+        return {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": [otlp_span]}],
+        }]}
+
+
+class Tracer:
+    """Span factory bound to an exporter and a trace sample rate."""
+
+    def __init__(self, exporter: FileExporter = None, sample_rate: float = 1.0):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None and self.sample_rate > 0
+
+
+_tracer = Tracer()
+
+
+def configure(path=None, sample_rate: float = None, fmt: str = None) -> Tracer:
+    """
+    Turn tracing on (or off) for this process.
+
+    Args:
+        path: Span file; None falls back to PIPELINE_TRACE ("1" means the
+            default .state/traces/spans.jsonl); tracing is off if neither is set
+        sample_rate: Fraction of traces kept (default: PIPELINE_TRACE_SAMPLE or 1.0)
+        fmt: jsonl or otlp (default: PIPELINE_TRACE_FORMAT or jsonl)
+
+    Returns:
+        The active Tracer
+    """
+
+    global _tracer
+
+    path = path or os.getenv("PIPELINE_TRACE")
+    if sample_rate is None:
+        sample_rate = float(os.getenv("PIPELINE_TRACE_SAMPLE", "1.0"))
+    fmt = fmt or os.getenv("PIPELINE_TRACE_FORMAT", "jsonl")
+
+    if _tracer.exporter:
+        _tracer.exporter.close()
+
+    exporter = None
+    if path and str(path).lower() not in ("0", "false", "off"):
+        exporter = FileExporter(DEFAULT_TRACE_FILE if str(path).lower() in ("1", "true", "on") else path, fmt)
+
+    _tracer = Tracer(exporter, sample_rate)
+    return _tracer
+
+
+def add_trace_arguments(parser: argparse.ArgumentParser):
+    """Add --trace / --trace-sample / --trace-format to a CLI."""
+
+    parser.add_argument(
+        "--trace", nargs="?", const=str(DEFAULT_TRACE_FILE), metavar="PATH",
+        help=f"Write tracing spans to PATH (default: {DEFAULT_TRACE_FILE.relative_to(project_root)})"
+    )
+    parser.add_argument("--trace-sample", type=float, help="Fraction of traces kept (default: 1.0)")
+    parser.add_argument("--trace-format", choices=FORMATS, help="Span file format (default: jsonl)")
+
+
+def configure_from_args(args: argparse.Namespace) -> Tracer:
+    """Configure tracing from add_trace_arguments() flags (env as fallback)."""
+    return configure(args.trace, args.trace_sample, args.trace_format)
+
+
+def current_span():
+    """The innermost open span (the no-op span when there is none)."""
+    return _current_span.get() or NOOP_SPAN
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Time a block as a span; yields the Span to set attributes on.
+
+    Exceptions mark the span failed and propagate.
+    """
+
+    tracer = _tracer
+    if tracer.exporter is None:
+        yield NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    if parent is None:
+        recording = tracer.sample_rate >= 1 or random.random() < tracer.sample_rate
+        trace_id = secrets.token_hex(16)
+    else:
+        recording = parent.recording
+        trace_id = parent.trace_id
+
+    current = Span(name, trace_id, parent.span_id if parent else None, recording, attributes)
+    token = _current_span.set(current)
+    start = time.perf_counter_ns()
+
+    try:
+        yield current
+    except BaseException as e:
+        current.record_error(e)
+        raise
+    finally:
+        current.duration_ns = time.perf_counter_ns() - start
+        _current_span.reset(token)
+        if recording:
+            tracer.exporter.export(current)
+
+
+def traced(name: str = None, **attributes):
+    """
+    Decorator: run each call of a function in a span.
+
+    The function can add attributes with current_span().set(...).
+    """
+
+    def decorator(fn):
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer.exporter is None:
+                return fn(*args, **kwargs)
+            with span(span_name, **attributes):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# PIPELINE_TRACE in the environment turns tracing on without CLI flags
+configure()
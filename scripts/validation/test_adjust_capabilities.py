@@ -24,7 +24,9 @@ class AdjustCapabilityTester:
     def __init__(self):
         self.adjust_token = os.getenv("ADJUST_TOKEN", "")
         self.headers = {"Authorization": f"Bearer {self.adjust_token}"}
-        self.base_url = "https://automate.adjust.com/reports-service/csv_report"
+        # ADJUST_API_URL points the probes at a stand-in (mock_api_server.py)
+        api_url = os.getenv("ADJUST_API_URL", "https://automate.adjust.com").rstrip("/")
+        self.base_url = f"{api_url}/reports-service/csv_report"
 
     def test_basic_connection(self):
         """Test basic Adjust API connection"""
@@ -41,6 +41,18 @@ class APICapabilityTester:
 
     def authenticate_admob(self, publisher_id):
         """Authenticate with AdMob using existing pickle tokens"""
+        # ADMOB_API_URL points the probes at a stand-in (mock_api_server.py)
+        api_url = os.getenv("ADMOB_API_URL")
+        if api_url:
+            from google.auth.credentials import AnonymousCredentials
+
+            service = build(
+                "admob", "v1", credentials=AnonymousCredentials(), static_discovery=False,
+                discoveryServiceUrl=f"{api_url.rstrip('/')}/$discovery/rest?version={{apiVersion}}"
+            )
+            print(f"✅ AdMob authenticated: {publisher_id} (stand-in API)")
+            return service
+
         token_file = f"{self.secret_dir}/token_{publisher_id}.pickle"
 
         if not os.path.exists(token_file):
@@ -19,6 +19,18 @@ import json
 
 def authenticate_admob(publisher_id):
     """Authenticate with AdMob"""
+    # ADMOB_API_URL points the probe at a stand-in (mock_api_server.py)
+    api_url = os.getenv("ADMOB_API_URL")
+    if api_url:
+        from google.auth.credentials import AnonymousCredentials
+
+        service = build(
+            "admob", "v1", credentials=AnonymousCredentials(), static_discovery=False,
+            discoveryServiceUrl=f"{api_url.rstrip('/')}/$discovery/rest?version={{apiVersion}}"
+        )
+        print(f"✅ AdMob authenticated: {publisher_id} (stand-in API)")
+        return service
+
     token_file = f"./.secret/token_{publisher_id}.pickle"
 
     if not os.path.exists(token_file):
@@ -0,0 +1,32 @@
+-- ============================================================================
+-- RAW Schema Clustering - apply to existing tables (no data loss)
+-- ============================================================================
+-- Purpose: Add clustering keys to RAW tables created before clustering was
+--          declared in create_raw_tables.sql (which uses CREATE OR REPLACE)
+-- Target: Snowflake DB_T34.RAW schema
+-- Cost: Automatic Clustering consumes credits; check with
+--       scripts/maintenance/pruning_report.py before/after
+-- ============================================================================
+
+USE DATABASE DB_T34;
+USE SCHEMA RAW;
+
+ALTER TABLE RAW.ADMOB_DAILY CLUSTER BY (date, app_id);
+
+ALTER TABLE RAW.ADJUST_HOURLY CLUSTER BY (day, app);
+
+-- Typed AdMob variant (only exists if created with --typed)
+ALTER TABLE IF EXISTS RAW.ADMOB_DAILY_TYPED CLUSTER BY (date, app_id);
+
+-- ============================================================================
+-- Verify Clustering Keys
+-- ============================================================================
+
+SELECT
+    table_name,
+    clustering_key,
+    auto_clustering_on
+FROM DB_T34.INFORMATION_SCHEMA.TABLES
+WHERE table_schema = 'RAW'
+  AND table_name IN ('ADMOB_DAILY', 'ADJUST_HOURLY', 'ADMOB_DAILY_TYPED')
+ORDER BY table_name;
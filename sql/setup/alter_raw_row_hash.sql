@@ -0,0 +1,36 @@
+-- ============================================================================
+-- RAW Schema Row Hashes - apply to existing tables (no data loss)
+-- ============================================================================
+-- Purpose: Add the ROW_HASH column to RAW tables created before it was
+--          declared in create_raw_tables.sql / create_raw_typed_tables.sql /
+--          create_rollup_tables.sql (which use CREATE OR REPLACE)
+-- Target: Snowflake DB_T34.RAW schema
+-- Note: Existing rows keep ROW_HASH NULL. The ADJUST_DAILY MERGE treats a
+--       NULL hash as changed, so each key is rewritten once; the dbt
+--       exclude_unchanged_rows macro compares with equal_null, so rows still
+--       NULL in RAW and in the model are skipped
+-- ============================================================================
+
+USE DATABASE DB_T34;
+USE SCHEMA RAW;
+
+ALTER TABLE RAW.ADMOB_DAILY ADD COLUMN IF NOT EXISTS row_hash BIGINT;
+
+ALTER TABLE RAW.ADMOB_DAILY_TYPED ADD COLUMN IF NOT EXISTS row_hash BIGINT;
+
+ALTER TABLE RAW.ADJUST_HOURLY ADD COLUMN IF NOT EXISTS row_hash BIGINT;
+
+ALTER TABLE RAW.ADJUST_DAILY ADD COLUMN IF NOT EXISTS row_hash BIGINT;
+
+-- ============================================================================
+-- Verify Columns
+-- ============================================================================
+
+SELECT
+    table_name,
+    column_name,
+    data_type
+FROM DB_T34.INFORMATION_SCHEMA.COLUMNS
+WHERE table_schema = 'RAW'
+  AND column_name = 'ROW_HASH'
+ORDER BY table_name;
@@ -0,0 +1,69 @@
+-- ============================================================================
+-- HOT Schema Tables - PostgreSQL hot storage (last 14 days)
+-- ============================================================================
+-- Purpose: Recent Adjust hourly data for operational dashboards, served
+--          without resuming a Snowflake warehouse
+-- Target: PostgreSQL (docker/docker-compose.yml), schema hot
+-- Philosophy: Same columns as RAW.ADJUST_HOURLY; loaded by upsert on the
+--             RAW primary key, so re-fetched hours replace earlier values
+-- Retention: Daily range partitions on hour; expired days are dropped whole
+--            by scripts/maintenance/hot_partitions.py (no DELETE, no bloat)
+-- ============================================================================
+
+CREATE SCHEMA IF NOT EXISTS hot;
+
+-- ============================================================================
+-- TABLE: ADJUST_HOURLY (Hot copy of RAW.ADJUST_HOURLY)
+-- ============================================================================
+-- Source: Adjust API (hourly granularity), via collect_adjust.py
+-- Volume: ~127K rows/day, ~1.8M rows at 14 days
+-- Load Pattern: Binary COPY into a temp table, then INSERT ... ON CONFLICT
+--               (rows with an unchanged row_hash are not updated)
+-- Partitions: adjust_hourly_pYYYYMMDD, one per day [day, day + 1); no
+--             default partition, so a missing day fails loudly
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS hot.adjust_hourly (
+    app VARCHAR(200) NOT NULL,
+    store_id VARCHAR(100) NOT NULL,
+    day DATE NOT NULL,
+    hour TIMESTAMP NOT NULL,
+    country VARCHAR(100) NOT NULL,
+    os_name VARCHAR(20) NOT NULL,
+    installs INTEGER,
+    clicks INTEGER,
+    daus NUMERIC(10, 2),
+    ad_revenue NUMERIC(10, 4),
+    ad_impressions INTEGER,
+    ad_revenue_total_d0 NUMERIC(10, 4),
+    ad_impressions_total_d0 INTEGER,
+    network_cost NUMERIC(10, 4),
+    network_cost_diff NUMERIC(10, 4),
+
+    -- Metadata (added by pipeline)
+    loaded_at TIMESTAMP DEFAULT now(),
+    row_hash BIGINT,                  -- 64-bit hash of the metric values
+
+    PRIMARY KEY (hour, app, store_id, country, os_name)
+) PARTITION BY RANGE (hour);
+
+-- Tables created before row_hash (upserts skip rows whose hash is unchanged)
+ALTER TABLE hot.adjust_hourly ADD COLUMN IF NOT EXISTS row_hash BIGINT;
+
+-- Dashboard reads: recent hours for one app (created on every partition)
+CREATE INDEX IF NOT EXISTS adjust_hourly_app_hour_idx ON hot.adjust_hourly (app, hour DESC);
+
+-- Initial partitions: last 14 days plus 3 ahead (maintenance keeps this window)
+DO $$
+DECLARE
+    d DATE;
+BEGIN
+    FOR d IN SELECT generate_series(current_date - 13, current_date + 3, interval '1 day')::date LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS hot.%I PARTITION OF hot.adjust_hourly FOR VALUES FROM (%L) TO (%L)',
+            'adjust_hourly_p' || to_char(d, 'YYYYMMDD'), d, d + 1
+        );
+    END LOOP;
+END $$;
+
+COMMENT ON TABLE hot.adjust_hourly IS 'Adjust hourly hot storage - last 14 days, upserted on RAW key';
@@ -0,0 +1,115 @@
+-- ============================================================================
+-- OPS Schema Tables - Pipeline and dbt operational metadata
+-- ============================================================================
+-- Purpose: Run history used to spot slow or expensive models and loads
+-- Target: Snowflake DB_T34.OPS schema
+-- Philosophy: Append-only; one row per model per dbt invocation and one row
+--             per collector job run
+-- ============================================================================
+
+USE DATABASE DB_T34;
+CREATE SCHEMA IF NOT EXISTS OPS;
+USE SCHEMA OPS;
+
+-- ============================================================================
+-- TABLE: DBT_RUN_LEDGER (dbt model performance history)
+-- ============================================================================
+-- Source: scripts/maintenance/dbt_perf_ledger.py (run_results.json + manifest
+--         joined to INFORMATION_SCHEMA.QUERY_HISTORY on the dbt query comment)
+-- Volume: models x runs (~50 rows/day at hourly staging runs)
+-- Load Pattern: Append after each dbt run
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS OPS.DBT_RUN_LEDGER (
+    -- Run
+    invocation_id VARCHAR(50) NOT NULL,
+    generated_at TIMESTAMP_NTZ NOT NULL,
+    dbt_command VARCHAR(50),
+
+    -- Model (from manifest)
+    unique_id VARCHAR(500) NOT NULL,
+    model_name VARCHAR(200),
+    layer VARCHAR(100),               -- models/ subfolder (01_staging, ...)
+    materialized VARCHAR(50),
+
+    -- run_results.json
+    status VARCHAR(20),
+    execution_time_s FLOAT,
+    rows_affected INTEGER,
+
+    -- Warehouse query history (all queries of the model in the run)
+    query_count INTEGER,
+    bytes_scanned NUMBER(38, 0),
+    partitions_scanned INTEGER,
+    partitions_total INTEGER,
+    bytes_spilled_local NUMBER(38, 0),
+    bytes_spilled_remote NUMBER(38, 0),
+
+    -- Regression vs the model's trailing median (before this run)
+    median_execution_time_s FLOAT,
+    median_bytes_scanned NUMBER(38, 0),
+    runtime_regressed BOOLEAN,
+    scan_regressed BOOLEAN,
+
+    -- Metadata
+    loaded_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+
+    PRIMARY KEY (invocation_id, unique_id)
+)
+CLUSTER BY (TO_DATE(generated_at));
+
+COMMENT ON TABLE OPS.DBT_RUN_LEDGER IS 'dbt model run performance history with regression flags';
+
+-- ============================================================================
+-- TABLE: PIPELINE_RUNS (collector job run history)
+-- ============================================================================
+-- Source: scripts/run_pipeline.py, scripts/daemon.py and the collector CLIs
+--         (scripts/utils/run_ledger.py)
+-- Volume: jobs x runs (~50 rows/day with hourly Adjust + daily AdMob)
+-- Load Pattern: One batched INSERT per run; written to .state/pipeline_runs.db
+--               when Snowflake is unreachable and flushed on the next run
+-- Report: scripts/maintenance/pipeline_runs_report.py
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS OPS.PIPELINE_RUNS (
+    -- Run
+    run_id VARCHAR(50) NOT NULL,      -- shared by the jobs of one invocation/tick
+    runner VARCHAR(20),               -- pipeline, daemon, cli
+    job_name VARCHAR(100) NOT NULL,
+    source VARCHAR(20),               -- admob, adjust
+    started_at TIMESTAMP_NTZ NOT NULL, -- UTC
+    partitions VARCHAR(500),          -- RAW table:start..end dates loaded
+
+    -- Throughput
+    rows_loaded INTEGER,
+    batch_bytes NUMBER(38, 0),        -- fetched batch size in memory
+    stage_seconds VARCHAR(2000),      -- JSON {stage: seconds}
+    total_seconds FLOAT,
+    rows_per_second FLOAT,
+    retries INTEGER,                  -- sink load retries
+    peak_rss_mb FLOAT,                -- process peak at job end
+
+    -- Outcome
+    status VARCHAR(20),               -- ok, failed
+    error VARCHAR(1000),
+
+    -- Metadata
+    loaded_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+
+    PRIMARY KEY (run_id, job_name)
+)
+CLUSTER BY (TO_DATE(started_at));
+
+COMMENT ON TABLE OPS.PIPELINE_RUNS IS 'Collector job runs with per-stage timings and throughput';
+
+-- ============================================================================
+-- Verify Tables
+-- ============================================================================
+
+SELECT
+    table_name,
+    row_count,
+    comment
+FROM DB_T34.INFORMATION_SCHEMA.TABLES
+WHERE table_schema = 'OPS'
+ORDER BY table_name;
@@ -15,6 +15,7 @@ USE SCHEMA RAW;
 -- Source: AdMob API (daily granularity)
 -- Volume: ~13,500 rows/day
 -- Load Pattern: Daily batch loads
+-- Clustering: (date, app_id) - YYYYMMDD strings sort in date order
 -- ============================================================================
 
 CREATE OR REPLACE TABLE RAW.ADMOB_DAILY (
@@ -35,9 +36,11 @@ CREATE OR REPLACE TABLE RAW.ADMOB_DAILY (
     -- Metadata (added by pipeline)
     loaded_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
     batch_id VARCHAR(50),
+    row_hash BIGINT,                  -- 64-bit hash of the metric values
 
     PRIMARY KEY (date, app_id, country_code, platform, ad_format, ad_unit_id)
-);
+)
+CLUSTER BY (date, app_id);
 
 COMMENT ON TABLE RAW.ADMOB_DAILY IS 'AdMob daily RAW data - exact API response (flattened)';
 
@@ -47,6 +50,8 @@ COMMENT ON TABLE RAW.ADMOB_DAILY IS 'AdMob daily RAW data - exact API response (
 -- Source: Adjust API (hourly granularity)
 -- Volume: ~127K rows/day
 -- Load Pattern: Daily loads with hourly grain
+-- Clustering: (day, app) - day is the date of hour; hour itself is too
+--             high-cardinality to be a cost-effective clustering key
 -- ============================================================================
 
 CREATE OR REPLACE TABLE RAW.ADJUST_HOURLY (
@@ -69,9 +74,11 @@ CREATE OR REPLACE TABLE RAW.ADJUST_HOURLY (
 
     -- Metadata (added by pipeline)
     loaded_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+    row_hash BIGINT,                  -- 64-bit hash of the metric values
 
     PRIMARY KEY (hour, app, store_id, country, os_name)
-);
+)
+CLUSTER BY (day, app);
 
 COMMENT ON TABLE RAW.ADJUST_HOURLY IS 'Adjust hourly RAW data - exact API response';
 
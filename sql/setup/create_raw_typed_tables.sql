@@ -0,0 +1,65 @@
+-- ============================================================================
+-- RAW Schema Tables - Typed Variants (cast at ingest, originals kept)
+-- ============================================================================
+-- Purpose: Optional typed layout for AdMob RAW data
+-- Target: Snowflake DB_T34.RAW schema
+-- Philosophy: Same rows as RAW.ADMOB_DAILY, cast once by the collector so
+--             downstream queries don't cast on read. Original API strings
+--             are kept in RAW_VALUES (VARIANT) for lineage.
+-- ============================================================================
+
+USE DATABASE DB_T34;
+USE SCHEMA RAW;
+
+-- ============================================================================
+-- TABLE: ADMOB_DAILY_TYPED (Batch Pipeline, typed)
+-- ============================================================================
+-- Source: AdMob API (daily granularity), via collect_admob.py --typed
+-- Volume: ~13,500 rows/day
+-- Load Pattern: Daily batch loads
+-- Clustering: (date, app_id)
+-- ============================================================================
+
+CREATE OR REPLACE TABLE RAW.ADMOB_DAILY_TYPED (
+    -- Dimensions
+    date DATE NOT NULL,
+    app_id VARCHAR(200) NOT NULL,
+    country_code VARCHAR(100) NOT NULL,
+    platform VARCHAR(50) NOT NULL,
+    ad_format VARCHAR(50) NOT NULL,
+    ad_unit_id VARCHAR(200) NOT NULL,
+
+    -- Metrics (cast from API strings)
+    ad_impressions INTEGER,
+    ad_clicks INTEGER,
+    ad_requests INTEGER,
+    matched_requests INTEGER,
+    estimated_earnings NUMBER(38, 0),  -- microsValue (divide by 1e6 for USD)
+    observed_ecpm NUMBER(38, 0),       -- microsValue (divide by 1e6 for USD)
+
+    -- Lineage: exact API values as strings
+    raw_values VARIANT,
+
+    -- Metadata (added by pipeline)
+    loaded_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+    batch_id VARCHAR(50),
+    row_hash BIGINT,                   -- hash of the API metric strings (same as ADMOB_DAILY)
+
+    PRIMARY KEY (date, app_id, country_code, platform, ad_format, ad_unit_id)
+)
+CLUSTER BY (date, app_id);
+
+COMMENT ON TABLE RAW.ADMOB_DAILY_TYPED IS 'AdMob daily RAW data - typed at ingest, original strings in RAW_VALUES';
+
+-- ============================================================================
+-- Verify Tables
+-- ============================================================================
+
+SELECT
+    table_name,
+    row_count,
+    comment
+FROM DB_T34.INFORMATION_SCHEMA.TABLES
+WHERE table_schema = 'RAW'
+  AND table_name = 'ADMOB_DAILY_TYPED'
+ORDER BY table_name;
@@ -0,0 +1,68 @@
+-- ============================================================================
+-- RAW Schema Tables - Ingest-time Rollups
+-- ============================================================================
+-- Purpose: Daily pre-aggregate of Adjust hourly data for daily-grain models
+-- Target: Snowflake DB_T34.RAW schema
+-- Philosophy: Maintained by the collector alongside RAW.ADJUST_HOURLY (which
+--             stays the exact API record). Each batch re-aggregates the whole
+--             days it fetched and MERGEs only those keys, so re-fetched days
+--             replace their totals instead of adding to them.
+-- ============================================================================
+
+USE DATABASE DB_T34;
+USE SCHEMA RAW;
+
+-- ============================================================================
+-- TABLE: ADJUST_DAILY (Rollup of ADJUST_HOURLY)
+-- ============================================================================
+-- Source: collect_adjust.py --rollup (or rollup = true in pipeline_jobs.toml)
+-- Volume: ~1/24 of ADJUST_HOURLY (~5K rows/day)
+-- Load Pattern: MERGE on (day, app, store_id, country, os_name), rows
+--               with an unchanged row_hash skipped
+-- Clustering: (day, app)
+-- Note: daus is the SUM of hourly values (same as the planned
+--       stg_adjust__daily_metrics), not distinct daily users
+-- ============================================================================
+
+CREATE OR REPLACE TABLE RAW.ADJUST_DAILY (
+    -- Dimensions
+    day DATE NOT NULL,
+    app VARCHAR(200) NOT NULL,
+    store_id VARCHAR(100) NOT NULL,
+    country VARCHAR(100) NOT NULL,
+    os_name VARCHAR(20) NOT NULL,
+
+    -- Metrics (SUM over the day's hours)
+    installs INTEGER,
+    clicks INTEGER,
+    daus DECIMAL(14, 2),
+    ad_revenue DECIMAL(14, 4),
+    ad_impressions INTEGER,
+    ad_revenue_total_d0 DECIMAL(14, 4),
+    ad_impressions_total_d0 INTEGER,
+    network_cost DECIMAL(14, 4),
+    network_cost_diff DECIMAL(14, 4),
+    hours_reported INTEGER,            -- hourly rows aggregated (24 = full day)
+
+    -- Metadata (added by pipeline)
+    loaded_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+    row_hash BIGINT,                   -- hash of the totals; unchanged days are not re-merged
+
+    PRIMARY KEY (day, app, store_id, country, os_name)
+)
+CLUSTER BY (day, app);
+
+COMMENT ON TABLE RAW.ADJUST_DAILY IS 'Adjust daily rollup of ADJUST_HOURLY - merged by the collector';
+
+-- ============================================================================
+-- Verify Tables
+-- ============================================================================
+
+SELECT
+    table_name,
+    row_count,
+    comment
+FROM DB_T34.INFORMATION_SCHEMA.TABLES
+WHERE table_schema = 'RAW'
+  AND table_name = 'ADJUST_DAILY'
+ORDER BY table_name;
@@ -0,0 +1,28 @@
+-- ============================================================================
+-- RAW Schema Search Optimization (Optional)
+-- ============================================================================
+-- Purpose: Point lookups on high-cardinality dimensions (single app, ad unit
+--          or country) that clustering on date alone can't prune
+-- Target: Snowflake DB_T34.RAW schema
+-- Cost: Enterprise Edition feature; storage + maintenance credits
+-- ============================================================================
+
+USE DATABASE DB_T34;
+USE SCHEMA RAW;
+
+ALTER TABLE RAW.ADMOB_DAILY ADD SEARCH OPTIMIZATION ON EQUALITY(app_id, ad_unit_id, country_code);
+
+ALTER TABLE RAW.ADJUST_HOURLY ADD SEARCH OPTIMIZATION ON EQUALITY(app, store_id, country);
+
+-- ============================================================================
+-- Verify Search Optimization
+-- ============================================================================
+
+SELECT
+    table_name,
+    search_optimization,
+    search_optimization_progress
+FROM DB_T34.INFORMATION_SCHEMA.TABLES
+WHERE table_schema = 'RAW'
+  AND table_name IN ('ADMOB_DAILY', 'ADJUST_HOURLY')
+ORDER BY table_name;